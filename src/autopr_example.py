@@ -62,7 +62,10 @@ def git_clone(url, branch_name):
     """
     try:
         # Execute Git clone command for the specified branch
-        subprocess.run(['git', 'clone', '-b', branch_name, '--single-branch', url], check=True, stdout=subprocess.PIPE)
+        # 앱과 같은 미러(~/.auto-pr/mirrors)가 있으면 객체를 재사용
+        from git.mirror import mirror_path_for
+        reference = mirror_path_for(url)
+        subprocess.run(['git', 'clone', '-b', branch_name, '--single-branch', '--reference-if-able', reference, url], check=True, stdout=subprocess.PIPE)
         print("Git clone completed successfully.")
 
         def remove_last_git(s):
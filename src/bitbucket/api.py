@@ -1,8 +1,35 @@
+import copy
+import json
 import requests
-from typing import Dict, List, Optional
+from datetime import datetime, timezone
+from typing import Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass
+from urllib.parse import urlencode
 from atlassian import Bitbucket
 from atlassian.bitbucket import Cloud 
+from bitbucket.http_cache import CachedResponse, HttpCache
+from bitbucket.transport import Transport
+from models.pull_request import PullRequest
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 50  # Bitbucket Cloud 의 pagelen 최대값
+META_REPO_PREFIX = 'meta-'
+PR_STATES = ['OPEN', 'MERGED', 'DECLINED', 'SUPERSEDED']
+
+# PRItemWidget, EditVersionDialog, diff 조회에서 사용하는 필드만 요청
+PR_META_FIELDS = ','.join(['next'] + [f'values.{field}' for field in (
+    'id', 'title', 'state', 'updated_on',
+    'source.branch.name', 'source.repository.name', 'source.commit.hash',
+    'destination.branch.name', 'destination.commit.hash',
+    'links.diff.href', 'links.diffstat.href', 'links.html.href'
+)])
+
+def bbql_quote(value: str) -> str:
+    """BBQL 문자열 리터럴"""
+    return '"' + value.replace('\\', '\\\\').replace('"', '\\"') + '"'
 
 class BitbucketAPI:
     _instance = None
@@ -23,48 +50,184 @@ class BitbucketAPI:
         if BitbucketAPI._instance is not None:
             raise RuntimeError("BitbucketAPI is a singleton. Use get_instance() instead.")
         self.bitbucket = cloud
+        self.transport = Transport(cloud)
+        self.http_cache = HttpCache()
+
+    def iter_pull_request_pages(self, page_size: int = DEFAULT_PAGE_SIZE, max_items: Optional[int] = None,
+                                query: Optional[str] = None, fields: Optional[str] = None,
+                                states: Optional[List[str]] = None) -> Iterator[List[PullRequest]]:
+        """PR 목록을 페이지 단위로 반환하는 제너레이터
 
-    def get_pull_requests(self):
+        응답의 `next` 링크를 따라가며 페이지를 받는 즉시 yield 하므로 호출자는
+        첫 페이지부터 바로 사용할 수 있습니다. max_items 개를 넘기면 중단합니다.
+        query 는 BBQL 필터(q=), fields 는 응답 필드 projection(fields=) 입니다.
+        states 를 주지 않으면 Bitbucket 기본값대로 OPEN 상태의 PR 만 반환됩니다.
+        """
+        params = {'pagelen': max(1, min(page_size, MAX_PAGE_SIZE))}
+        if states:
+            params['state'] = list(states)
+        if query:
+            params['q'] = query
+        if fields:
+            params['fields'] = fields
+        url = f'pullrequests/{self.bitbucket.username}?{urlencode(params, doseq=True)}'
+        remaining = max_items
+        while url and (remaining is None or remaining > 0):
+            page = self.get(url, decode=self._decode_pr_page)
+            values = page['values']
+            if remaining is not None:
+                values = values[:remaining]
+                remaining -= len(values)
+            if values:
+                yield values
+            url = page.get('next')
+
+    def iter_pull_requests(self, page_size: int = DEFAULT_PAGE_SIZE, max_items: Optional[int] = None) -> Iterator[PullRequest]:
+        """모든 페이지의 PR 을 하나씩 반환하는 제너레이터"""
+        for page in self.iter_pull_request_pages(page_size, max_items):
+            yield from page
+
+    def get_pull_requests(self, page_size: int = DEFAULT_PAGE_SIZE, max_items: Optional[int] = None):
+        pull_requests = []
         try:
-            pull_requests = self.bitbucket.get(f'pullrequests/{self.bitbucket.username}')
-            return pull_requests['values']
+            for pr in self.iter_pull_requests(page_size, max_items):
+                pull_requests.append(pr)
         except Exception as e:
-            print(f"Error getting pull requests: {e}")
-            return []
-        
-    def get_pull_requests_meta(self):
-        try:
-            pull_requests = self.get_pull_requests()
+            logger.error(f"Error getting pull requests: {e}")
+        return pull_requests
 
-            # pr['source']['repository']['name']가 meta-* 인 것만 추출
-            pull_requests = [pr for pr in pull_requests if pr['source']['repository']['name'].startswith('meta-')]
-            
-            return pull_requests
+    @staticmethod
+    def is_meta_pull_request(pr: PullRequest) -> bool:
+        # source 저장소 이름이 meta-* 인 것만 추출
+        return bool(pr.source.repository) and pr.source.repository.startswith(META_REPO_PREFIX)
+
+    @staticmethod
+    def _decode_pr_page(page: dict) -> dict:
+        # 페이지의 PR JSON 을 PullRequest 로 변환 (HttpCache 에는 변환된 페이지가 보관됨)
+        return {
+            'values': [PullRequest.from_json(value) for value in page.get('values', [])],
+            'next': page.get('next')
+        }
+
+    @staticmethod
+    def build_pr_query(state: Union[str, List[str], None] = "OPEN", repo_prefix: Optional[str] = None,
+                       updated_since: Optional[datetime] = None) -> str:
+        """BBQL 필터 문자열을 만듭니다. state 는 하나 또는 여러 상태 목록입니다.
+
+        BBQL 에는 접두어 비교가 없어 repo_prefix 는 포함(~) 조건으로 보내므로
+        결과는 is_meta_pull_request 로 한 번 더 확인해야 합니다.
+        """
+        conditions = []
+        states = [state] if isinstance(state, str) else list(state or [])
+        if states:
+            condition = ' OR '.join(f'state = {bbql_quote(value)}' for value in states)
+            conditions.append(f'({condition})' if len(states) > 1 else condition)
+        if repo_prefix:
+            conditions.append(f'source.repository.name ~ {bbql_quote(repo_prefix)}')
+        if updated_since:
+            if updated_since.tzinfo is None:
+                updated_since = updated_since.replace(tzinfo=timezone.utc)
+            conditions.append(f'updated_on > {updated_since.isoformat()}')
+        return ' AND '.join(conditions)
+
+    def iter_pull_request_meta_pages(self, page_size: int = DEFAULT_PAGE_SIZE, max_items: Optional[int] = None,
+                                     updated_since: Optional[datetime] = None,
+                                     state: Union[str, List[str], None] = "OPEN") -> Iterator[List[PullRequest]]:
+        """meta-* 저장소의 PR 만 서버에서 걸러 필요한 필드만 받아 페이지 단위로 반환합니다."""
+        query = self.build_pr_query(state, META_REPO_PREFIX, updated_since)
+        states = [state] if isinstance(state, str) else state
+        for page in self.iter_pull_request_pages(page_size, max_items, query, PR_META_FIELDS, states):
+            pull_requests = [pr for pr in page if self.is_meta_pull_request(pr)]
+            if pull_requests:
+                yield pull_requests
+
+    def get_pull_requests_meta(self, page_size: int = DEFAULT_PAGE_SIZE, max_items: Optional[int] = None,
+                               updated_since: Optional[datetime] = None,
+                               state: Union[str, List[str], None] = "OPEN"):
+        pull_requests = []
+        try:
+            for page in self.iter_pull_request_meta_pages(page_size, max_items, updated_since, state):
+                pull_requests.extend(page)
         except Exception as e:
-            print(f"Error getting pull requests: {e}")
-            return []
+            logger.error(f"Error getting pull requests: {e}")
+        return pull_requests
         
     def get_current_user(self):
         try:
             user = self.get('user')
             return user
         except Exception as e:
-            print(f"Error getting user info: {e}")
+            logger.error(f"Error getting user info: {e}")
             return None
         
+    def get_transport_stats(self) -> Dict[str, dict]:
+        """endpoint 별 요청/재시도/오류 횟수와 지연 시간, HTTP 캐시 적중률"""
+        return {'endpoints': self.transport.get_stats(), 'cache': self.http_cache.stats()}
+
     # curl --request GET \
     #   --url 'https://api.bitbucket.org/2.0/repositories/{workspace}/{repo_slug}/src/{commit}/{path}' \
     #   --header 'Authorization: Bearer <access_token>' \
     #   --header 'Accept: application/json'
     def get_file_content(self, workspace, repo_slug, commit, path):
         url = f'https://api.bitbucket.org/2.0/repositories/{workspace}/{repo_slug}/src/{commit}/{path}'
-        response = self.bitbucket.get(url)
-        return response
+        return self.get(url)
         
-    def get(self, url):
+    def get(self, url, decode=None):
+        """GET 요청 결과를 반환합니다.
+
+        ETag / Last-Modified 가 있던 응답은 조건부 요청으로 재검증하고,
+        304 응답이면 HttpCache 에 저장된 값을 사용합니다.
+        decode 를 주면 해석한 JSON 을 변환한 값을 반환하고 그 값을 메모리에 보관합니다.
+        보관한 값은 호출자끼리 공유되지 않도록 복사해서 반환합니다. (PullRequest 같은
+        읽기 전용 모델은 복사하지 않고 그대로 공유)
+        """
         url = url.replace('https://api.bitbucket.org/2.0/', '')
-        response = self.bitbucket.get(url)
-        return response
+        key = f"{self.bitbucket.username}:{url}"
+        if decode is not None:
+            key = f"{key}#{decode.__name__}"
+        cached = self.http_cache.get(key)
+
+        headers = dict(self.bitbucket.default_headers)
+        if cached is not None:
+            headers.update(cached.validators())
+        response = self.transport.request('GET', url, headers=headers)
+
+        if response.status_code == 304 and cached is not None:
+            revalidated = CachedResponse(
+                response.headers.get('ETag', cached.etag),
+                response.headers.get('Last-Modified', cached.last_modified),
+                cached.content_type,
+                cached.body
+            )
+            value = self.http_cache.revalidated(key, revalidated)
+            if value is None:
+                value = self._decode_body(cached.body)
+                if decode is not None:
+                    value = decode(value)
+                self.http_cache.remember(key, revalidated, value)
+            return copy.deepcopy(value)
+
+        self.bitbucket.raise_for_status(response)
+        self.http_cache.miss()
+        value = self._decode_body(response.content)
+        if decode is not None:
+            value = decode(value)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            content_type = response.headers.get('Content-Type', '')
+            self.http_cache.put(key, CachedResponse(etag, last_modified, content_type, response.content), value)
+            return copy.deepcopy(value)
+        return value
+
+    def _decode_body(self, body: bytes):
+        # atlassian 의 get 과 같이 JSON 이 아니면 텍스트(diff 등)로 반환
+        if not body:
+            return None
+        try:
+            return json.loads(body)
+        except ValueError:
+            return body.decode('utf-8', errors='replace')
 
     def create_pull_request(self, pr_data: dict):
         """Pull Request를 생성합니다."""
@@ -73,7 +236,8 @@ class BitbucketAPI:
             repo_slug = pr_data['source']['repository']
             
             # PR 생성 API 호출
-            response = self.bitbucket.post(
+            response = self.transport.request(
+                'POST',
                 f'repositories/{workspace}/{repo_slug}/pullrequests',
                 data={
                     'title': pr_data['title'],
@@ -90,13 +254,68 @@ class BitbucketAPI:
                     }
                 }
             )
+            self.bitbucket.raise_for_status(response)
             
-            return response
+            return PullRequest.from_json(response.json())
             
         except Exception as e:
-            print(f"Error creating pull request: {e}")
+            logger.error(f"Error creating pull request: {e}")
+            raise
+
+    def update_pull_request(self, repo_slug: str, pr_id: int, pr_data: dict):
+        """기존 Pull Request의 제목과 설명을 갱신합니다."""
+        try:
+            workspace = self.bitbucket.username
+            response = self.transport.request(
+                'PUT',
+                f'repositories/{workspace}/{repo_slug}/pullrequests/{pr_id}',
+                data={
+                    'title': pr_data['title'],
+                    'description': pr_data['description']
+                }
+            )
+            self.bitbucket.raise_for_status(response)
+
+            return PullRequest.from_json(response.json())
+
+        except Exception as e:
+            logger.error(f"Error updating pull request {repo_slug}#{pr_id}: {e}")
             raise
 
+    def find_open_pull_requests(self, repo_slug: str, branch_pairs) -> Dict[tuple, PullRequest]:
+        """(source 브랜치, destination 브랜치) 쌍들에 해당하는 열린 PR 을 한 번의 BBQL 조회로 찾습니다.
+
+        {(source 브랜치, destination 브랜치): PR} 를 반환합니다.
+        """
+        branch_pairs = list(dict.fromkeys(branch_pairs))
+        if not branch_pairs:
+            return {}
+
+        pairs = ' OR '.join(
+            f'(source.branch.name = {bbql_quote(source)} AND destination.branch.name = {bbql_quote(destination)})'
+            for source, destination in branch_pairs
+        )
+        params = {
+            'pagelen': MAX_PAGE_SIZE,
+            'q': f'state = "OPEN" AND ({pairs})',
+            'fields': ','.join(['next'] + [f'values.{field}' for field in (
+                'id', 'state', 'updated_on', 'source.branch.name', 'source.repository.name',
+                'destination.branch.name', 'links.html.href'
+            )])
+        }
+        url = f'repositories/{self.bitbucket.username}/{repo_slug}/pullrequests?{urlencode(params)}'
+
+        wanted = set(branch_pairs)
+        result = {}
+        while url:
+            page = self.get(url, decode=self._decode_pr_page)
+            for pr in page['values']:
+                key = (pr.source.branch, pr.destination.branch)
+                if key in wanted and key not in result:
+                    result[key] = pr
+            url = page.get('next')
+        return result
+
 if __name__ == "__main__":
     import json
     from utils import parse_info_from_diff
@@ -114,19 +333,21 @@ if __name__ == "__main__":
             self.pr = pr
             
         def execute(self):
-            print(f"PR Title: {self.pr['title']}\n"
-                  f"PR ID: {self.pr['id']}\n"
-                  f"PR Repository: {self.pr['source']['repository']['name']}\n"
-                  f"PR State: {self.pr['state']}\n"
-                  f"PR Created On: {self.pr['created_on']}\n"
-                  f"PR Updated On: {self.pr['updated_on']}\n"
-                  f"PR Author: {self.pr['author']['display_name']}\n"
-                  f"PR Source Branch: {self.pr['source']['branch']['name']}\n"
-                  f"PR Destination Branch: {self.pr['destination']['branch']['name']}\n"
-                  f"PR Description: {self.pr['description']}\n"
+            print(f"PR Title: {self.pr.title}\n"
+                  f"PR ID: {self.pr.id}\n"
+                  f"PR Repository: {self.pr.source.repository}\n"
+                  f"PR State: {self.pr.state}\n"
+                  f"PR Updated On: {self.pr.updated_on}\n"
+                  f"PR Source Branch: {self.pr.source.branch}\n"
+                  f"PR Source Commit: {self.pr.source.commit}\n"
+                  f"PR Destination Branch: {self.pr.destination.branch}\n"
                   )
             print("\n=== PR Links ===")
-            print_links_menu(self.pr['links'])
+            print_links_menu({
+                'html': {'href': self.pr.html_url},
+                'diff': {'href': self.pr.diff_url},
+                'diffstat': {'href': self.pr.diffstat_url}
+            })
             
     # Diff 정보 출력을 위한 Leaf 컴포넌트  
     class DiffInfoTest(APITest):
@@ -135,7 +356,7 @@ if __name__ == "__main__":
             self.pr = pr
             
         def execute(self):
-            diff = self.pr['links']['diff']['href']
+            diff = self.pr.diff_url
             diff_info = self.api.get(diff)
             print(json.dumps(diff_info, indent=4))
             parsed_info = parse_info_from_diff(diff_info)
@@ -164,7 +385,7 @@ if __name__ == "__main__":
     def print_pr_list(pull_requests):
         print("\n=== PR 목록 ===")
         for i, pr in enumerate(pull_requests, 1):
-            print(f"{i}. {pr['title']} ({pr['source']['repository']['name']})")
+            print(f"{i}. {pr.title} ({pr.source.repository})")
         print("0. 이전 메뉴로")
 
     def print_links_menu(links):
@@ -0,0 +1,200 @@
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+HTTP_CACHE_PATH = os.path.expanduser("~/.auto-pr/http_cache.sqlite3")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_MEMORY_ENTRIES = 256
+
+@dataclass
+class CachedResponse:
+    """저장된 응답 본문과 재검증에 필요한 validator"""
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: str
+    body: bytes
+
+    def validators(self) -> Dict[str, str]:
+        """조건부 요청 헤더 (If-None-Match / If-Modified-Since)"""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+class HttpCache:
+    """ETag / Last-Modified 가 있는 GET 응답을 SQLite 에 압축해 저장합니다.
+
+    다음 요청은 조건부 요청으로 보내고 304 응답이면 저장된 본문을 사용합니다.
+    최근에 해석한 값은 메모리에도 두어 304 일 때 JSON 을 다시 해석하지 않습니다.
+    전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+    """
+
+    def __init__(self, db_path: str = HTTP_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES,
+                 memory_entries: int = DEFAULT_MEMORY_ENTRIES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.memory_entries = memory_entries
+        self.hits = 0
+        self.misses = 0
+        self.memory: "OrderedDict[str, tuple]" = OrderedDict()  # key -> (validator, 해석된 값)
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = self._connect()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " etag TEXT,"
+                " last_modified TEXT,"
+                " content_type TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            # 캐시를 쓸 수 없어도 API 요청은 그대로 동작해야 함
+            logger.warning(f"HTTP cache disabled ({self.db_path}): {e}")
+            return None
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """저장된 응답을 반환합니다. 없으면 None"""
+        with self._lock:
+            if self._conn is None:
+                return None
+            try:
+                row = self._conn.execute(
+                    "SELECT etag, last_modified, content_type, payload FROM responses WHERE key = ?", (key,)
+                ).fetchone()
+            except sqlite3.Error as e:
+                logger.warning(f"HTTP cache read failed: {e}")
+                return None
+            if row is None:
+                return None
+
+            etag, last_modified, content_type, payload = row
+            try:
+                body = zlib.decompress(payload)
+            except zlib.error as e:
+                logger.warning(f"Discarding corrupt HTTP cache entry {key}: {e}")
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                return None
+            return CachedResponse(etag, last_modified, content_type, body)
+
+    def put(self, key: str, response: CachedResponse, value: Any = None):
+        """응답을 저장하고 필요하면 오래된 항목을 지웁니다."""
+        payload = zlib.compress(response.body)
+        with self._lock:
+            if value is not None:
+                self._remember(key, self._validator(response), value)
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, etag, last_modified, content_type, payload, size, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (key, response.etag, response.last_modified, response.content_type,
+                     payload, len(payload), time.time())
+                )
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"HTTP cache write failed: {e}")
+
+    def revalidated(self, key: str, response: CachedResponse) -> Any:
+        """304 응답을 받은 항목을 적중으로 기록하고 메모리에 해석된 값이 있으면 반환합니다."""
+        with self._lock:
+            self.hits += 1
+            if self._conn is not None:
+                try:
+                    self._conn.execute(
+                        "UPDATE responses SET etag = ?, last_modified = ?, last_used = ? WHERE key = ?",
+                        (response.etag, response.last_modified, time.time(), key)
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"HTTP cache update failed: {e}")
+
+            remembered = self.memory.get(key)
+            if remembered is None or remembered[0] != self._validator(response):
+                return None
+            self.memory.move_to_end(key)
+            return remembered[1]
+
+    def remember(self, key: str, response: CachedResponse, value: Any):
+        """해석한 값을 메모리에 보관합니다."""
+        with self._lock:
+            self._remember(key, self._validator(response), value)
+
+    def miss(self):
+        with self._lock:
+            self.misses += 1
+
+    def _validator(self, response: CachedResponse) -> tuple:
+        return (response.etag, response.last_modified)
+
+    def _remember(self, key: str, validator: tuple, value: Any):
+        self.memory[key] = (validator, value)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_entries:
+            self.memory.popitem(last=False)
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY last_used").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+        for (key,) in evicted:
+            self.memory.pop(key, None)
+        logger.info(f"Evicted {len(evicted)} HTTP cache entries")
+
+    def stats(self) -> dict:
+        """적중(304)/실패 횟수와 저장된 항목 수, 크기를 반환합니다."""
+        with self._lock:
+            entries, size = 0, 0
+            if self._conn is not None:
+                try:
+                    entries, size = self._conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+                    ).fetchone()
+                except sqlite3.Error:
+                    pass
+            return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'bytes': size}
+
+    def clear(self):
+        """모든 항목을 지웁니다."""
+        with self._lock:
+            self.memory.clear()
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM responses")
+                self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
@@ -0,0 +1,107 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+from bitbucket.api import BitbucketAPI
+from bitbucket.utils import parse_info_from_diff
+from models.pull_request import PullRequest
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+RECIPE_SUFFIXES = ('.bb', '.bbappend', '.inc')
+MAX_PARALLEL_DIFFS = 8
+MAX_CACHED_RESULTS = 256
+
+class PRInspector:
+    """PR 의 레시피 버전 변경 정보(parse_info_from_diff 결과)를 구합니다.
+
+    전체 diff 대신 diffstat 으로 바뀐 경로를 먼저 확인하고, 레시피 파일
+    (.bb / .bbappend / .inc) 의 diff 만 경로별로 동시에 받습니다.
+    diff 는 source 커밋과 destination 에 따라 정해지므로 결과를 (저장소, source 커밋,
+    destination 브랜치, destination 커밋) 별로 최근 MAX_CACHED_RESULTS 개까지 보관합니다.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if PRInspector._instance is not None:
+            raise RuntimeError("PRInspector is a singleton. Use get_instance() instead")
+        # (저장소, source 커밋, destination 브랜치, destination 커밋) -> 변경 정보
+        self.results: "OrderedDict[Tuple[str, str, str, Optional[str]], List[dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _changed_recipe_paths(self, api: BitbucketAPI, diffstat_url: str) -> List[str]:
+        paths = []
+        url = diffstat_url
+        while url:
+            page = api.get(url)
+            for entry in page.get('values', []):
+                if entry.get('status') == 'removed':
+                    continue
+                path = (entry.get('new') or {}).get('path')
+                if path and path.endswith(RECIPE_SUFFIXES):
+                    paths.append(path)
+            url = page.get('next')
+        return paths
+
+    def _path_diff_url(self, diff_url: str, path: str) -> str:
+        separator = '&' if '?' in diff_url else '?'
+        return f"{diff_url}{separator}{urlencode({'path': path})}"
+
+    def inspect(self, pr: PullRequest) -> List[dict]:
+        """PR 에서 변경된 CCOS_VERSION 정보 목록을 반환합니다."""
+        diff_url = pr.diff_url
+        diffstat_url = pr.diffstat_url
+        repo_name = pr.source.repository
+        source_commit: Optional[str] = pr.source.commit
+
+        key = (repo_name, source_commit, pr.destination.branch, pr.destination.commit)
+        if source_commit:
+            with self._lock:
+                if key in self.results:
+                    self.results.move_to_end(key)
+                    return self._copy(self.results[key])
+
+        api = BitbucketAPI.get_instance()
+        if not diffstat_url:
+            # diffstat 링크가 없으면 전체 diff 로 처리
+            info = parse_info_from_diff(api.get(diff_url))
+        else:
+            paths = self._changed_recipe_paths(api, diffstat_url)
+            logger.debug(f"{repo_name} PR changes {len(paths)} recipe files")
+
+            def fetch(path):
+                return parse_info_from_diff(api.get(self._path_diff_url(diff_url, path)) or "")
+
+            info = []
+            if paths:
+                with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_DIFFS, len(paths))) as executor:
+                    for path_info in executor.map(fetch, paths):
+                        info.extend(path_info)
+
+        if source_commit:
+            with self._lock:
+                self.results[key] = info
+                while len(self.results) > MAX_CACHED_RESULTS:
+                    self.results.popitem(last=False)
+        return self._copy(info)
+
+    def _copy(self, info: List[dict]) -> List[dict]:
+        # 호출자가 결과를 고쳐도 보관한 값은 바뀌지 않도록 복사
+        return [dict(entry) for entry in info]
+
+    def invalidate(self, repo_name: str = None):
+        """저장된 결과를 지웁니다. (PR 브랜치를 직접 수정한 뒤 등)"""
+        with self._lock:
+            if repo_name is None:
+                self.results.clear()
+            else:
+                for key in [key for key in self.results if key[0] == repo_name]:
+                    del self.results[key]
@@ -0,0 +1,188 @@
+import random
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError, Timeout
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+POOL_SIZE = 16  # 병렬 PR 작업(브랜치, 저장소)을 합친 최대 동시 요청 수
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5  # 초
+BACKOFF_CAP = 30.0  # 초
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+IDEMPOTENT_METHODS = {"GET", "HEAD", "PUT", "DELETE", "OPTIONS"}
+DEFAULT_RATE = 5.0  # 초당 요청 수
+DEFAULT_BURST = 20
+
+# endpoint 통계에서 이름 그대로 남길 경로 요소 (나머지는 * 로 묶음)
+RESOURCE_SEGMENTS = {
+    "repositories", "pullrequests", "workspaces", "user", "users", "src", "diff", "diffstat",
+    "commits", "commit", "activity", "comments", "approve", "merge", "decline",
+    "refs", "tags", "branches", "statuses"
+}
+
+def endpoint_key(method: str, path: str) -> str:
+    """통계용 endpoint 이름 (예: "GET repositories/*/*/pullrequests")"""
+    path = path.split("?", 1)[0].replace("https://api.bitbucket.org/2.0/", "").strip("/")
+    segments = [segment if segment in RESOURCE_SEGMENTS else "*" for segment in path.split("/")]
+    return f"{method} {'/'.join(segments)}"
+
+@dataclass
+class EndpointStats:
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+
+    @property
+    def avg_latency(self) -> float:
+        return self.total_latency / self.requests if self.requests else 0.0
+
+class TokenBucket:
+    """초당 rate 개씩 채워지는 토큰 버킷. 요청마다 토큰 하나를 사용합니다."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: int = DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def acquire(self):
+        """토큰이 생길 때까지 기다립니다."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now >= self.blocked_until and self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate)
+            time.sleep(wait)
+
+    def block(self, seconds: float):
+        """Retry-After 등으로 지정된 시간 동안 모든 요청을 멈춥니다."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+            self.tokens = 0
+
+    def adapt(self, headers):
+        """Bitbucket 할당량 헤더에 맞춰 남은 토큰 수를 줄입니다."""
+        remaining = headers.get("X-RateLimit-Remaining")
+        near_limit = headers.get("X-RateLimit-NearLimit", "").lower() == "true"
+        with self._lock:
+            if remaining is not None and remaining.isdigit():
+                self.tokens = min(self.tokens, float(remaining))
+            if near_limit:
+                # 남은 할당량이 20% 미만이면 버스트 없이 천천히 요청
+                self.tokens = min(self.tokens, 1.0)
+
+class Transport:
+    """atlassian Cloud 세션 위에서 연결 풀, 재시도, 속도 제한, endpoint 통계를 담당합니다.
+
+    429 와 일시적인 5xx, 연결 오류는 지수 백오프(full jitter)로 재시도하고
+    Retry-After 가 있으면 그 시간 동안 모든 요청을 멈춥니다.
+    POST 처럼 멱등이 아닌 요청은 서버가 처리하지 않았다고 확실한 429 만 재시도합니다.
+    """
+
+    def __init__(self, cloud, pool_size: int = POOL_SIZE, max_retries: int = MAX_RETRIES,
+                 bucket: Optional[TokenBucket] = None):
+        self.cloud = cloud
+        self.max_retries = max_retries
+        self.bucket = bucket or TokenBucket()
+        self.stats: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+        # keep-alive 연결을 동시 요청 수만큼 유지 (재시도는 직접 처리)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=0)
+        cloud._session.mount("https://", adapter)
+        cloud._session.mount("http://", adapter)
+
+    def _record(self, key: str, latency: float = 0.0, retry: bool = False, error: bool = False):
+        with self._lock:
+            stats = self.stats.setdefault(key, EndpointStats())
+            if retry:
+                stats.retries += 1
+            elif error:
+                stats.errors += 1
+            else:
+                stats.requests += 1
+                stats.total_latency += latency
+                stats.max_latency = max(stats.max_latency, latency)
+
+    def _retry_after(self, response) -> Optional[float]:
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        if value.isdigit():
+            return float(value)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def _backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+
+    def request(self, method: str, path: str, data=None, params=None, headers=None):
+        """요청을 보내고 requests.Response 를 반환합니다. (상태 코드 검사는 호출자가 함)"""
+        key = endpoint_key(method, path)
+        retryable = method in IDEMPOTENT_METHODS
+        attempt = 0
+        while True:
+            self.bucket.acquire()
+            start = time.monotonic()
+            try:
+                response = self.cloud.request(
+                    method, path, data=data, params=params, headers=headers, advanced_mode=True
+                )
+            except (ConnectionError, Timeout) as e:
+                if not retryable or attempt >= self.max_retries:
+                    self._record(key, error=True)
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{key} failed ({e}); retrying in {delay:.1f}s")
+            else:
+                self._record(key, time.monotonic() - start)
+                self.bucket.adapt(response.headers)
+                status = response.status_code
+                if status not in RETRY_STATUSES or attempt >= self.max_retries or \
+                        (not retryable and status != 429):
+                    if status >= 400:
+                        self._record(key, error=True)
+                    return response
+
+                retry_after = self._retry_after(response)
+                delay = retry_after if retry_after is not None else self._backoff(attempt)
+                if retry_after is not None:
+                    self.bucket.block(retry_after)
+                logger.warning(f"{key} returned {status}; retrying in {delay:.1f}s")
+
+            self._record(key, retry=True)
+            attempt += 1
+            time.sleep(delay)
+
+    def get_stats(self) -> Dict[str, dict]:
+        """endpoint 별 요청/재시도/오류 횟수와 지연 시간(초)"""
+        with self._lock:
+            return {
+                key: {
+                    'requests': stats.requests,
+                    'retries': stats.retries,
+                    'errors': stats.errors,
+                    'avg_latency': stats.avg_latency,
+                    'max_latency': stats.max_latency
+                }
+                for key, stats in self.stats.items()
+            }
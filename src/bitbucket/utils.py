@@ -1,35 +1,112 @@
-def parse_info_from_diff(diff: str):
-    # {
-    #     "file": "meta-ccos-avn/audiostreamingmanager/audiostreamingmanager.bb", 
-    #     "version": "version/0.0.1",
-    #     "commit": "7683c0f6dd80cb9df933764771654020712a5369"
-    # }
-    
-    print(diff)
-    
+import io
+import re
+from typing import Iterable, List, Union
+
+# "+CCOS_VERSION = "0.0.1_<hash>"", "-CCOS_GIT_BRANCH_NAME ?= "..."" 같은 변경 줄
+RECIPE_VARIABLE = re.compile(r'^([+-])(CCOS_VERSION|CCOS_GIT_BRANCH_NAME)\s*[?:.+]*=\s*(.*)$')
+HUNK_HEADER = re.compile(r'^@@ -\d+(?:,(\d+))? \+\d+(?:,(\d+))? @@')
+
+def _value(raw: str) -> str:
+    raw = raw.strip()
+    if raw.startswith('"'):
+        return raw.split('"')[1]
+    return raw
+
+def _split_version(value: str):
+    # "0.0.1_7683c0f6..." -> ("version/0.0.1", "7683c0f6...")
+    version, _, commit = value.rpartition('_')
+    if not version:
+        version, commit = value, None
+    return f"version/{version}", commit
+
+def parse_info_from_diff(diff: Union[str, Iterable[Union[str, bytes]]]) -> List[dict]:
+    """diff 에서 레시피 파일별 CCOS_VERSION / CCOS_GIT_BRANCH_NAME 변경을 추출합니다.
+
+    diff 는 문자열이나 줄 단위 iterator (스트리밍 HTTP 본문 등) 모두 가능하며
+    한 번만 훑으므로 큰 diff 도 길이에 비례하는 시간에 처리합니다.
+    CCOS_VERSION 이 추가(+)된 파일마다 항목을 하나 반환하며, 한 파일에 여러 번
+    나오면 마지막 값을 씁니다. CCOS_GIT_BRANCH_NAME 만 바뀐 파일은 제외합니다.
+    항목 형식은 아래와 같습니다. (old_* / new_branch 는 없으면 None)
+
+    {
+        "file": "meta-ccos-avn/audiostreamingmanager/audiostreamingmanager.bb",
+        "version": "version/0.0.1",
+        "commit": "7683c0f6dd80cb9df933764771654020712a5369",
+        "old_version": "version/0.0.0",
+        "old_commit": "...",
+        "old_branch": "@s6mobis",
+        "new_branch": "release"
+    }
+    """
+    if isinstance(diff, str):
+        diff = io.StringIO(diff)
+    elif diff is None:
+        return []
+
     info = []
-    
-    # diff 문자열을 줄 단위로 분리
-    lines = diff.split('\n')
-    
-    for line in lines:
-        if line.startswith('+CCOS_VERSION'):
-            # CCOS_VERSION = "0.0.1_7683c0f6dd80cb9df933764771654020712a5369" 형식에서 정보 추출
-            version_str = line.split('"')[1]
-            version, commit = version_str.split('_')
-            
-            # 이전 줄에서 파일 경로 찾기
-            file_path = None
-            for prev_line in reversed(lines[:lines.index(line)]):
-                if prev_line.startswith('+++ b/'):
-                    file_path = prev_line[6:]
-                    break
-                    
-            if file_path:
-                info.append({
-                    "file": file_path,
-                    "version": f"version/{version}",
-                    "commit": commit
-                })
-        
-    return info
+    current = None       # 현재 파일 경로 (+++ b/ 줄)
+    entry = None         # 현재 파일의 결과 항목
+    old_remaining = 0    # 현재 hunk 에 남은 이전/새 줄 수
+    new_remaining = 0
+
+    for line in diff:
+        if isinstance(line, bytes):
+            line = line.decode('utf-8', errors='replace')
+        line = line.rstrip('\r\n')
+
+        if old_remaining > 0 or new_remaining > 0:
+            # hunk 본문
+            tag = line[:1]
+            if tag == '-':
+                old_remaining -= 1
+            elif tag == '+':
+                new_remaining -= 1
+            elif tag == '\\':
+                continue  # "\ No newline at end of file"
+            else:
+                old_remaining -= 1
+                new_remaining -= 1
+                continue
+
+            if current is None or not line.startswith('CCOS_', 1):
+                continue
+            match = RECIPE_VARIABLE.match(line)
+            if not match:
+                continue
+            if entry is None:
+                entry = {
+                    "file": current, "version": None, "commit": None,
+                    "old_version": None, "old_commit": None, "old_branch": None, "new_branch": None
+                }
+                info.append(entry)
+
+            sign, name, raw = match.groups()
+            value = _value(raw)
+            if name == 'CCOS_VERSION':
+                version, commit = _split_version(value)
+                if sign == '+':
+                    entry["version"], entry["commit"] = version, commit
+                else:
+                    entry["old_version"], entry["old_commit"] = version, commit
+            elif sign == '+':
+                entry["new_branch"] = value
+            else:
+                entry["old_branch"] = value
+            continue
+
+        # 파일/hunk 헤더
+        if line.startswith('diff --git '):
+            current, entry = None, None
+        elif line.startswith('+++ '):
+            path = line[4:].split('\t')[0]
+            current = path[2:] if path.startswith('b/') else None  # /dev/null 은 삭제된 파일
+            entry = None
+        elif line.startswith('@@'):
+            match = HUNK_HEADER.match(line)
+            if match:
+                old_count, new_count = match.groups()
+                old_remaining = int(old_count) if old_count is not None else 1
+                new_remaining = int(new_count) if new_count is not None else 1
+
+    # 버전 변경이 없는 항목은 EditVersionDialog 에서 편집할 수 없으므로 제외
+    return [entry for entry in info if entry["version"] is not None]
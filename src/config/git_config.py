@@ -0,0 +1,40 @@
+import os
+import json
+
+class GitConfig:
+    """git 관련 사용자 설정 (~/.config/bitbucket-monitor/git.json)"""
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if GitConfig._instance is not None:
+            raise RuntimeError("GitConfig is a singleton. Use get_instance() instead")
+
+        self.config_dir = os.path.expanduser("~/.config/bitbucket-monitor")
+        self.config_file = os.path.join(self.config_dir, "git.json")
+        self.backend = "cli"  # 읽기 전용 조회 백엔드: "cli" 또는 "dulwich"
+        self.load_config()
+
+    def load_config(self):
+        """git.json 파일에서 설정을 로드합니다."""
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as f:
+                    data = json.load(f)
+                    self.backend = data.get('backend', self.backend)
+        except Exception as e:
+            print(f"Error loading git config: {e}")
+
+    def save_config(self):
+        """현재 설정을 git.json 파일에 저장합니다."""
+        try:
+            os.makedirs(self.config_dir, exist_ok=True)
+            with open(self.config_file, 'w') as f:
+                json.dump({'backend': self.backend}, f, indent=4)
+        except Exception as e:
+            print(f"Error saving git config: {e}")
@@ -0,0 +1,51 @@
+import os
+import json
+
+class WebhookConfig:
+    """로컬 webhook 수신 설정 (~/.config/bitbucket-monitor/webhook.json)"""
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        if WebhookConfig._instance is not None:
+            raise RuntimeError("WebhookConfig is a singleton. Use get_instance() instead")
+
+        self.config_dir = os.path.expanduser("~/.config/bitbucket-monitor")
+        self.config_file = os.path.join(self.config_dir, "webhook.json")
+        self.enabled = False
+        self.host = "127.0.0.1"
+        self.port = 8787
+        self.secret = ""  # Bitbucket webhook 에 설정한 secret (서명 검증용)
+        self.load_config()
+
+    def load_config(self):
+        """webhook.json 파일에서 설정을 로드합니다."""
+        try:
+            if os.path.exists(self.config_file):
+                with open(self.config_file, 'r') as f:
+                    data = json.load(f)
+                    self.enabled = data.get('enabled', self.enabled)
+                    self.host = data.get('host', self.host)
+                    self.port = data.get('port', self.port)
+                    self.secret = data.get('secret', self.secret)
+        except Exception as e:
+            print(f"Error loading webhook config: {e}")
+
+    def save_config(self):
+        """현재 설정을 webhook.json 파일에 저장합니다."""
+        try:
+            os.makedirs(self.config_dir, exist_ok=True)
+            with open(self.config_file, 'w') as f:
+                json.dump({
+                    'enabled': self.enabled,
+                    'host': self.host,
+                    'port': self.port,
+                    'secret': self.secret
+                }, f, indent=4)
+        except Exception as e:
+            print(f"Error saving webhook config: {e}")
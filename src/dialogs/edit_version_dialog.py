@@ -4,9 +4,10 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout,
                            QFormLayout, QGroupBox, QMessageBox, QWidget)
 from PyQt6.QtCore import Qt, QTimer
 from workspace.manager import WorkspaceManager
+from models.pull_request import PullRequest
 
 class EditVersionDialog(QDialog):
-    def __init__(self, diff_info, pr_data, parent=None):
+    def __init__(self, diff_info, pr_data: PullRequest, parent=None):
         super().__init__(parent)
         self.diff_info = diff_info
         self.pr_data = pr_data
@@ -24,11 +25,11 @@ class EditVersionDialog(QDialog):
         branch_layout = QFormLayout()
         
         # Source branch
-        self.source_branch = QLineEdit(self.pr_data['source']['branch']['name'])
+        self.source_branch = QLineEdit(self.pr_data.source.branch)
         branch_layout.addRow("Source Branch:", self.source_branch)
         
         # Target branch
-        self.target_branch = QLineEdit(self.pr_data['destination']['branch']['name'])
+        self.target_branch = QLineEdit(self.pr_data.destination.branch)
         self.target_branch.setReadOnly(True)
         branch_layout.addRow("Target Branch:", self.target_branch)
         
@@ -114,7 +115,7 @@ class EditVersionDialog(QDialog):
     def has_changes(self):
         """변경사항이 있는지 확인합니다."""
         # 브랜치 변경 확인
-        if self.source_branch.text() != self.pr_data['source']['branch']['name']:
+        if self.source_branch.text() != self.pr_data.source.branch:
             return True
             
         # 버전/브랜치 변경 확인
@@ -138,8 +139,8 @@ class EditVersionDialog(QDialog):
         msg = "The following items will be changed:\n\n"
         
         # 브랜치 변경 확인
-        if self.source_branch.text() != self.pr_data['source']['branch']['name']:
-            msg += f"Branch: {self.pr_data['source']['branch']['name']} → {self.source_branch.text()}\n\n"
+        if self.source_branch.text() != self.pr_data.source.branch:
+            msg += f"Branch: {self.pr_data.source.branch} → {self.source_branch.text()}\n\n"
         
         # 파일 변경 확인
         for row in range(self.table.rowCount()):
@@ -169,16 +170,16 @@ class EditVersionDialog(QDialog):
         
         if reply == QMessageBox.StandardButton.Yes:
             workspace = WorkspaceManager.get_instance()
-            repo_name = self.pr_data['source']['repository']['name']
+            repo_name = self.pr_data.source.repository
             updated_versions = self.get_updated_versions()
             updated_branch = self.get_updated_branch()
-            source_branch = self.pr_data['source']['branch']['name']
+            source_branch = self.pr_data.source.branch
             
             self.show_progress("Updating files...")
             
             def on_checkout_complete(repo_path):
                 try:
-                    # BB 파일 업데이트 (변경된 항목만)
+                    # 파일을 고치기 전에 태그 해시를 모두 구함 (실패하면 아무 파일도 바꾸지 않음)
                     for version_info in updated_versions:
                         file_name = version_info['file'].split('/')[-1]
                         recipe_name = file_name.split('.')[0]
@@ -190,8 +191,18 @@ class EditVersionDialog(QDialog):
                             raise Exception(f"{version} not found in tags")
                         else:
                             version_info['tag'] = tags[version]
-                            
-                        workspace.update_bb_file(repo_name, file_name, version_info)
+                    
+                    # 태그가 원격에 같은 커밋으로 있는지 확인 (원격당 ls-remote 1회)
+                    problems = workspace.validate_remote_tags(
+                        (version_info['file'].split('/')[-1].split('.')[0], version_info['version'], version_info['tag'])
+                        for version_info in updated_versions
+                    )
+                    if problems:
+                        raise Exception("Remote tag check failed:\n" + "\n".join(problems))
+                    
+                    # BB 파일 업데이트 (변경된 항목만)
+                    for version_info in updated_versions:
+                        workspace.update_bb_file(repo_name, version_info['file'].split('/')[-1], version_info)
                     
                     if updated_versions:  # 변경된 파일이 있을 때만 커밋
                         # 변경사항 commit
@@ -231,7 +242,7 @@ class EditVersionDialog(QDialog):
             
         workspace.operation_error.connect(on_error)
         workspace.checkout_branch(
-            self.pr_data['source']['repository']['name'],
+            self.pr_data.source.repository,
             self.source_branch.text(),
             callback=on_checkout_complete
         )
@@ -248,7 +259,7 @@ class EditVersionDialog(QDialog):
             
             workspace = WorkspaceManager.get_instance()
             recipe_info = workspace.get_recipe_info(
-                self.pr_data['source']['repository']['name'], 
+                self.pr_data.source.repository, 
                 file_path.split('/')[-1].split('.')[0],
                 self.source_branch.text()
             )
@@ -2,6 +2,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel, QTextEdi
                            QPushButton, QProgressBar, QMessageBox, QComboBox)
 from PyQt6.QtCore import Qt
 from workspace.manager import WorkspaceManager
+from git.push_batcher import PushBatcher
 from bitbucket.api import BitbucketAPI
 from utils.logger import setup_logger  # 절대 경로 사용
 from utils.version_utils import generate_next_version  # 변경
@@ -41,7 +42,7 @@ class PRDialog(QDialog):
         
         diff_preview = QTextEdit()
         diff_preview.setReadOnly(True)
-        diff_preview.setPlainText(self.get_diff_preview())
+        diff_preview.setPlainText("Loading changes...")
         diff_preview.setStyleSheet("""
             QTextEdit {
                 font-family: monospace;
@@ -49,6 +50,22 @@ class PRDialog(QDialog):
             }
         """)
         layout.addWidget(diff_preview)
+        self.diff_preview = diff_preview
+        
+        # diff 는 크기 제한이 있는 페이지 단위로 표시하고 나머지는 버튼으로 이어서 읽음
+        self.diff_pagers = []  # (저장소 이름, DiffPager)
+        self.diff_started = set()  # diff 제목을 이미 출력한 저장소
+        self.load_more_btn = QPushButton("Load more diff")
+        self.load_more_btn.clicked.connect(self.load_more_diff)
+        self.load_more_btn.hide()
+        layout.addWidget(self.load_more_btn)
+        
+        # 상태 조회와 diff 는 git 실행기에서 수행 (GUI 스레드를 막지 않음)
+        self.workspace.run_task(
+            self.workspace.git_runner.call(self.get_diff_preview),
+            on_finished=self.on_diff_page_loaded,
+            on_error=lambda e: self.diff_preview.setPlainText(f"Failed to get diff: {e}")
+        )
         
         # 진행 상태 표시
         self.progress_bar = QProgressBar()
@@ -103,6 +120,7 @@ class PRDialog(QDialog):
             titles = []  # 커밋 제목들
             jiras = set()  # JIRA 티켓 번호들
             title_parts = []  # PR 제목 부분
+            commit_ranges = []  # (레시피, 시작 태그, 끝 태그)
             
             # version_info에서 변경사항 가져오기
             for (meta_name, recipe_name), (version, _) in self.version_info.items():
@@ -135,25 +153,21 @@ class PRDialog(QDialog):
                         
                         title_parts.append(f"{recipe_name}={version_str}")
                         
-                        # 커밋 메시지 수집 (current tag부터 version까지)
-                        titles = self.workspace.get_commit_messages_between_tags(
-                            recipe_name,
-                            current_info['CCOS_VERSION'],
-                            version
-                        )
-                        
-                        jiras = self.workspace.get_jira_numbers_between_tags(
-                            recipe_name,
-                            current_info['CCOS_VERSION'],
-                            version
-                        )
+                        # 커밋 범위 수집 (current tag부터 version까지, 아래에서 한 번에 조회)
+                        commit_ranges.append((recipe_name, current_info['CCOS_VERSION'], version))
                         
-                        logger.info(f"Commits for {recipe_name} from {latest_tag} to HEAD: {titles}")
-                        
-                            
                 except Exception as e:
                     logger.warning(f"Failed to process {recipe_name}: {e}")
             
+            # 모든 레시피의 커밋 레코드를 한 번에 가져오기
+            records = self.workspace.get_commit_records(commit_ranges)
+            for commit_range in commit_ranges:
+                for record in records.get(commit_range, []):
+                    titles.append(record.subject)
+                    jiras.update(record.jira_keys)
+                logger.info(f"Commits for {commit_range[0]} from {commit_range[1]} to {commit_range[2]}: "
+                            f"{len(records.get(commit_range, []))}")
+            
             # 메시지 구성
             message = " ".join(title_parts) + "\n\n"  # PR 제목
             
@@ -173,23 +187,79 @@ class PRDialog(QDialog):
             return f"Failed to generate PR message: {e}"
         
     def get_diff_preview(self) -> str:
-        """변경사항 미리보기"""
+        """변경사항 미리보기 (변경된 파일 목록, --stat 요약, diff 첫 페이지)"""
         try:
-            diffs = []
-            for meta_name in self.workspace.get_modified_repositories():
-                diff = self.workspace.get_diff(meta_name)
-                if diff:
-                    diffs.append(f"=== {meta_name} ===\n{diff}\n")
-            return "\n".join(diffs)
+            summaries = []
+            for meta_name, changes in self.workspace.scan_status().items():
+                if not changes:
+                    continue
+                files = "\n".join(str(change) for change in changes)
+                stat = self.workspace.get_diff_stat(meta_name)
+                summaries.append(f"=== {meta_name} ===\n{files}\n\n{stat}\n")
+                self.diff_pagers.append((meta_name, self.workspace.open_diff(meta_name)))
+            return "\n".join(summaries) + "\n" + self.next_diff_page()
         except Exception as e:
             return f"Failed to get diff: {e}"
             
+    def next_diff_page(self) -> str:
+        """다음 diff 페이지를 읽습니다. 현재 저장소를 다 읽으면 다음 저장소로 넘어갑니다."""
+        while self.diff_pagers:
+            meta_name, pager = self.diff_pagers[0]
+            page = pager.next_page()
+            if not pager.has_more:
+                pager.close()
+                self.diff_pagers.pop(0)
+            if page:
+                heading = "" if meta_name in self.diff_started else f"=== diff: {meta_name} ===\n"
+                self.diff_started.add(meta_name)
+                return heading + page
+        return ""
+        
+    def on_diff_page_loaded(self, text: str):
+        """읽은 diff 페이지를 미리보기 끝에 붙입니다."""
+        cursor = self.diff_preview.textCursor()
+        if self.diff_preview.toPlainText() == "Loading changes...":
+            self.diff_preview.clear()
+        cursor.movePosition(cursor.MoveOperation.End)
+        cursor.insertText(text)
+        self.load_more_btn.setEnabled(True)
+        self.load_more_btn.setVisible(bool(self.diff_pagers))
+        
+    def load_more_diff(self):
+        """다음 diff 페이지를 git 실행기에서 읽어 붙입니다."""
+        self.load_more_btn.setEnabled(False)
+        self.workspace.run_task(
+            self.workspace.git_runner.call(self.next_diff_page),
+            on_finished=self.on_diff_page_loaded,
+            on_error=lambda e: self.on_diff_page_loaded(f"\nFailed to load more diff: {e}\n")
+        )
+        
+    def done(self, result):
+        """대화상자를 닫을 때 남은 diff 스트림(git 프로세스)을 정리합니다."""
+        for _, pager in self.diff_pagers:
+            pager.close()
+        self.diff_pagers.clear()
+        super().done(result)
+        
+    def discard_tags(self, created_tags):
+        """push 하지 못한 로컬 태그를 지워 다시 시도할 수 있게 합니다."""
+        for recipe_name, tag in created_tags:
+            try:
+                self.workspace.delete_version_tag(recipe_name, tag)
+            except Exception as e:
+                logger.warning(f"Failed to delete local tag {tag} in {recipe_name}: {e}")
+        created_tags.clear()
+        
     def create_pr(self):
         """PR 생성"""
         try:
             self.progress_bar.show()
             self.create_btn.setEnabled(False)
             
+            # 태그는 로컬에 만든 뒤 원격마다 한 번의 atomic push 로 보냄
+            batch = PushBatcher()
+            created_tags = []  # (레시피, 태그)
+            
             for (meta_name, recipe_name), (version, _) in self.version_info.items():
                 try:
                     current_info = self.workspace.get_recipe_info(meta_name, recipe_name, self.branch)
@@ -217,16 +287,28 @@ class PRDialog(QDialog):
                         
                         # HEAD에 이미 태그가 있는 경우는 새로 생성하지 않음
                         if not (version == "HEAD" and head_tags):
-                            # 태그 생성 및 푸시
-                            if self.workspace.create_version_tag(recipe_name, new_version, message):
+                            # 태그 생성 (push 는 아래에서 한 번에)
+                            if self.workspace.create_version_tag(recipe_name, new_version, message, batch=batch):
                                 logger.info(f"Created tag {new_version} for {recipe_name}")
+                                created_tags.append((recipe_name, new_version))
                             else:
                                 raise Exception(f"Failed to create tag {new_version} for {recipe_name}")
                         
                 except Exception as e:
                     logger.error(f"Failed to process {recipe_name}: {e}")
+                    self.discard_tags(created_tags)
                     raise
             
+            # 태그 push (원격별 atomic)
+            report = self.workspace.push_batch(batch)
+            failures = PushBatcher.failures(report)
+            if failures:
+                self.discard_tags(created_tags)
+                raise Exception("Push failed:\n" + "\n".join(failures))
+            logger.info("Push report:\n" + "\n".join(
+                f"{repo_name}: {result}" for repo_name, results in report.items() for result in results
+            ))
+            
             # PR 생성 로직
             # ... (기존 create_pull_requests 로직)
             
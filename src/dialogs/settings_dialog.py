@@ -11,6 +11,8 @@ from config.server_config import ServerConfig
 from config.repo_config import RepoConfig, Recipe, MetaRepo
 from workspace.manager import WorkspaceManager
 from config.branch_config import BranchManager, BranchConfig
+from config.git_config import GitConfig
+from git.backend import available_backends, set_backend
 
 class AddRecipeDialog(QDialog):
     def __init__(self, parent=None):
@@ -357,6 +359,41 @@ class ThemeSettingsTab(QWidget):
     def on_theme_changed(self, theme_name):
         self.theme_manager.apply_theme(theme_name)
 
+class GitSettingsTab(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.git_config = GitConfig.get_instance()
+        self.setup_ui()
+        
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+        
+        form_layout = QFormLayout()
+        
+        # 읽기 전용 조회(ref, 태그, 로그, blob)에 사용할 백엔드
+        self.backend_combo = QComboBox()
+        self.backend_combo.addItems(available_backends())
+        self.backend_combo.setCurrentText(self.git_config.backend)
+        form_layout.addRow("Read backend:", self.backend_combo)
+        
+        description = QLabel(
+            "cli: runs the git executable for every query.\n"
+            "dulwich: reads refs, tags, logs and files in-process (requires the dulwich package).\n"
+            "Clone, fetch, commit and push always use the git executable."
+        )
+        description.setWordWrap(True)
+        form_layout.addRow("", description)
+        
+        layout.addLayout(form_layout)
+        layout.addStretch()
+        
+    def save_settings(self):
+        backend = self.backend_combo.currentText()
+        if backend != self.git_config.backend:
+            self.git_config.backend = backend
+            self.git_config.save_config()
+            set_backend(backend)
+
 class AddBranchDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
@@ -590,6 +627,10 @@ class SettingsDialog(QDialog):
         self.branch_tab = BranchSettingsTab()
         tab_widget.addTab(self.branch_tab, "Branches")
         
+        # Git settings tab
+        self.git_tab = GitSettingsTab()
+        tab_widget.addTab(self.git_tab, "Git")
+        
         layout.addWidget(tab_widget)
         
         # Add buttons
@@ -608,4 +649,5 @@ class SettingsDialog(QDialog):
         # Save all settings from each tab
         self.server_tab.save_settings()
         self.repo_config.save_config()
+        self.git_tab.save_settings()
         self.accept() 
\ No newline at end of file
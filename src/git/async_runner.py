@@ -0,0 +1,166 @@
+import asyncio
+import functools
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, List, Optional
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+class RepoLock:
+    """저장소(워킹 트리) 하나의 변경 작업을 직렬화하는 잠금
+
+    같은 소유자(기본값은 현재 스레드)는 다시 잠글 수 있으므로, 잠금을 잡은 동기
+    작업이 같은 저장소의 다른 동기 작업을 호출해도 멈추지 않습니다.
+    스레드 대신 임의의 토큰을 소유자로 쓸 수 있어 이벤트 루프의 코루틴도 사용할 수 있습니다.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition()
+        self._owner: Optional[Hashable] = None
+        self._depth = 0
+
+    def acquire(self, owner: Hashable = None):
+        owner = owner if owner is not None else threading.get_ident()
+        with self._condition:
+            while self._owner is not None and self._owner != owner:
+                self._condition.wait()
+            self._owner = owner
+            self._depth += 1
+
+    def release(self, owner: Hashable = None):
+        owner = owner if owner is not None else threading.get_ident()
+        with self._condition:
+            if self._owner != owner:
+                raise RuntimeError("RepoLock released by a non-owner")
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._condition.notify_all()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+class AsyncGitRunner:
+    """asyncio 기반 git 실행기
+
+    전용 스레드에서 이벤트 루프를 돌리며 다음을 보장합니다.
+    - 전체 동시 실행 수 제한 (semaphore)
+    - 저장소별 잠금(repo_lock): 변경(mutating) 작업은 한 워킹 트리에서 겹치지 않음.
+      실행기를 거치지 않는 동기 호출도 같은 잠금을 사용합니다.
+    - 취소와 타임아웃: run() 으로 실행한 git 프로세스는 취소나 시간 초과 시 종료됨.
+      call() 로 실행한 동기 작업은 중단할 수 없어 끝까지 실행되고 결과만 버려짐
+
+    GUI 스레드에서는 submit() 으로 코루틴을 넘기고 반환된 Future 를 사용합니다.
+    """
+
+    def __init__(self, max_concurrency: int = DEFAULT_MAX_CONCURRENCY):
+        self.max_concurrency = max_concurrency
+        self.loop = asyncio.new_event_loop()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._repo_locks: Dict[str, RepoLock] = {}
+        self._repo_locks_guard = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="git")
+        self._thread = threading.Thread(target=self._run_loop, name="git-runner", daemon=True)
+        self._thread.start()
+
+    def _run_loop(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def repo_lock(self, repo_path: str) -> RepoLock:
+        """저장소 경로의 잠금을 반환합니다. 동기 변경 작업은 with 로 잡고 실행합니다."""
+        with self._repo_locks_guard:
+            if repo_path not in self._repo_locks:
+                self._repo_locks[repo_path] = RepoLock()
+            return self._repo_locks[repo_path]
+
+    def _lock_for(self, repo_path: Optional[str]) -> Optional[RepoLock]:
+        if not repo_path:
+            return None
+        return self.repo_lock(repo_path)
+
+    async def run(self, command: List[str], cwd: str = None, mutating: bool = False,
+                  timeout: float = None) -> str:
+        """git 명령어를 실행하고 결과를 반환합니다."""
+        lock = self._lock_for(cwd) if mutating else None
+        owner = object()  # 코루틴은 스레드가 아니므로 토큰으로 잠금을 소유
+        if lock:
+            acquiring = self.loop.run_in_executor(self._executor, lock.acquire, owner)
+            try:
+                await asyncio.shield(acquiring)
+            except BaseException:
+                # 기다리다 취소되면 나중에 잡히는 잠금을 바로 돌려줌
+                acquiring.add_done_callback(lambda done: done.exception() is None and lock.release(owner))
+                raise
+        try:
+            async with self._semaphore:
+                logger.info(f"Running command (async): {' '.join(command)}")
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    cwd=cwd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+                try:
+                    stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                except BaseException:
+                    # 취소 또는 타임아웃: git 프로세스를 남기지 않음
+                    if process.returncode is None:
+                        process.kill()
+                        await process.wait()
+                    raise
+
+                if process.returncode != 0:
+                    logger.error(f"Git command failed: {stderr.decode(errors='replace')}")
+                    raise subprocess.CalledProcessError(
+                        process.returncode, command,
+                        stdout.decode(errors='replace'), stderr.decode(errors='replace')
+                    )
+                return stdout.decode(errors='replace').strip()
+        finally:
+            if lock:
+                lock.release(owner)
+
+    async def call(self, func: Callable, *args, repo_path: str = None, mutating: bool = False,
+                   timeout: float = None, **kwargs):
+        """동기 함수를 작업 스레드에서 실행합니다.
+
+        mutating 이면 작업 스레드에서 저장소 잠금을 잡은 채 실행합니다.
+        스레드에서 실행 중인 작업은 중단할 수 없으므로, 취소나 타임아웃이 나더라도
+        저장소 잠금과 동시 실행 슬롯은 작업이 실제로 끝난 뒤에 반환됩니다.
+        """
+        lock = self._lock_for(repo_path) if mutating else None
+        await self._semaphore.acquire()
+
+        def locked():
+            with lock:
+                return func(*args, **kwargs)
+
+        target = locked if lock else functools.partial(func, *args, **kwargs)
+        future = self.loop.run_in_executor(self._executor, target)
+
+        def release(done):
+            self._semaphore.release()
+            if not done.cancelled():
+                done.exception()  # 기다리는 쪽이 없어도 경고가 남지 않도록
+
+        future.add_done_callback(release)
+        return await asyncio.wait_for(asyncio.shield(future), timeout)
+
+    def submit(self, coro):
+        """코루틴을 실행기 루프에 넘기고 concurrent.futures.Future 를 반환합니다."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self):
+        """이벤트 루프와 작업 스레드를 종료합니다."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout=5)
+        self._executor.shutdown(wait=False, cancel_futures=True)
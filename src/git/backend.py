@@ -0,0 +1,182 @@
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Tuple
+from git import git
+from git.cat_file import CatFileBatch
+from models.commit_record import CommitRecord
+from utils.logger import setup_logger
+from utils.version_utils import version_sort_key
+
+logger = setup_logger(__name__)
+
+BACKEND_CLI = "cli"
+BACKEND_DULWICH = "dulwich"
+
+class GitBackend(ABC):
+    """읽기 전용 git 조회 인터페이스 (ref, 태그, 커밋 탐색, blob 읽기)
+
+    저장소를 바꾸는 명령(clone, fetch, commit, push 등)은 항상 git CLI 를 사용합니다.
+    """
+    name = None
+
+    @abstractmethod
+    def list_refs(self, path: str, prefixes: Iterable[str]) -> List[Tuple[str, str, str]]:
+        """(ref 이름, 객체 해시, peeled 커밋 해시 또는 "") 목록을 반환합니다."""
+
+    @abstractmethod
+    def get_tag_hash_by_branch(self, path: str, branch: str) -> Dict[str, str]:
+        """브랜치에 병합된 태그와 (peeled) 커밋 해시의 매핑을 반환합니다."""
+
+    @abstractmethod
+    def ls_tree_files(self, path: str, rev: str) -> List[str]:
+        """리비전의 전체 파일 경로 목록을 반환합니다."""
+
+    @abstractmethod
+    def get_commit_records(self, path: str, from_rev: str, to_rev: str) -> List[CommitRecord]:
+        """from_rev..to_rev 범위의 커밋을 최신 커밋부터 반환합니다."""
+
+    @abstractmethod
+    def blob_reader(self, path: str):
+        """read(object_name) / read_text(object_name) / close() 를 가진 blob 읽기 객체"""
+
+class CliBackend(GitBackend):
+    """git 프로세스를 실행하는 기본 백엔드"""
+    name = BACKEND_CLI
+
+    def list_refs(self, path: str, prefixes: Iterable[str]) -> List[Tuple[str, str, str]]:
+        command = [
+            "git", "for-each-ref",
+            "--format=%(refname) %(objectname) %(*objectname)"
+        ] + list(prefixes)
+        output = git.run_git_command(command, cwd=path)
+        return [tuple((line.split(" ") + [""])[:3]) for line in output.splitlines()]
+
+    def get_tag_hash_by_branch(self, path: str, branch: str) -> Dict[str, str]:
+        # 태그마다 rev-parse 하지 않고 for-each-ref 한 번으로 모든 태그를 해석
+        command = [
+            "git", "for-each-ref", f"--merged={branch}",
+            "--format=%(refname:strip=2) %(objectname) %(*objectname)",
+            "refs/tags"
+        ]
+        output = git.run_git_command(command, cwd=path)
+
+        result = {}
+        for line in output.splitlines():
+            tag, object_hash, peeled_hash = (line.split(" ") + [""])[:3]
+            result[tag] = peeled_hash or object_hash
+        return result
+
+    def ls_tree_files(self, path: str, rev: str) -> List[str]:
+        command = ["git", "ls-tree", "-r", "--name-only", "-z", rev]
+        output = git.run_git_command(command, cwd=path)
+        return [file_path for file_path in output.split('\0') if file_path]
+
+    def get_commit_records(self, path: str, from_rev: str, to_rev: str) -> List[CommitRecord]:
+        command = ["git", "log", "-z", f"--format={git.COMMIT_RECORD_FORMAT}", f"{from_rev}..{to_rev}"]
+        output = git.run_git_command(command, cwd=path)
+        return git.parse_commit_records(output)
+
+    def blob_reader(self, path: str):
+        return CatFileBatch(path)
+
+_backends: Dict[str, GitBackend] = {}
+_current = None
+_lock = threading.Lock()
+
+def available_backends() -> List[str]:
+    """설치된 라이브러리로 사용할 수 있는 백엔드 이름 목록"""
+    names = [BACKEND_CLI]
+    from git.dulwich_backend import DULWICH_AVAILABLE
+    if DULWICH_AVAILABLE:
+        names.append(BACKEND_DULWICH)
+    return names
+
+def _create(name: str) -> GitBackend:
+    if name == BACKEND_DULWICH:
+        from git.dulwich_backend import DulwichBackend, DULWICH_AVAILABLE
+        if DULWICH_AVAILABLE:
+            return DulwichBackend(CliBackend())
+        logger.warning("dulwich is not installed. Falling back to the git CLI backend")
+    elif name != BACKEND_CLI:
+        logger.warning(f"Unknown git backend '{name}'. Falling back to the git CLI backend")
+    return CliBackend()
+
+def get_backend(name: str = None) -> GitBackend:
+    """현재(또는 지정한) 읽기 전용 백엔드를 반환합니다.
+
+    처음 호출될 때 설정(GitConfig)에서 선택한 백엔드를 사용합니다.
+    """
+    global _current
+    with _lock:
+        if name is None:
+            if _current is None:
+                from config.git_config import GitConfig
+                _current = GitConfig.get_instance().backend
+            name = _current
+        if name not in _backends:
+            _backends[name] = _create(name)
+        return _backends[name]
+
+def set_backend(name: str):
+    """읽기 전용 조회에 사용할 백엔드를 바꿉니다."""
+    global _current
+    with _lock:
+        _current = name
+    logger.info(f"Git read backend set to {name}")
+
+def _benchmark_backends(repo_path: str, branch: str = None, rounds: int = 20):
+    """같은 저장소에서 CLI 와 dulwich 백엔드의 읽기 작업 소요 시간을 비교합니다."""
+    import time
+
+    names = available_backends()
+    if BACKEND_DULWICH not in names:
+        print("dulwich is not installed; only the CLI backend will be measured")
+
+    cli = get_backend(BACKEND_CLI)
+    branch = branch or git.git_current_branch(repo_path)
+    tags = cli.get_tag_hash_by_branch(repo_path, branch)
+    # 가장 낮은 버전 태그부터 브랜치까지를 커밋 탐색 범위로 사용
+    oldest_tag = min(tags, key=version_sort_key) if tags else None
+    files = cli.ls_tree_files(repo_path, branch)
+    blob = f"{branch}:{files[0]}" if files else None
+
+    tasks = [
+        ("list_refs", lambda b: b.list_refs(repo_path, ["refs/heads", "refs/remotes", "refs/tags"])),
+        ("tag_hash_by_branch", lambda b: b.get_tag_hash_by_branch(repo_path, branch)),
+        ("ls_tree_files", lambda b: b.ls_tree_files(repo_path, branch)),
+    ]
+    if oldest_tag:
+        tasks.append(("commit_records", lambda b: b.get_commit_records(repo_path, oldest_tag, branch)))
+    if blob:
+        def read_blob(b):
+            reader = b.blob_reader(repo_path)
+            try:
+                return reader.read(blob)
+            finally:
+                reader.close()
+        tasks.append(("blob_read (new reader)", read_blob))
+
+    print(f"{repo_path} @ {branch}: {len(tags)} tags, {len(files)} files, {rounds} rounds")
+    for task_name, task in tasks:
+        timings = []
+        for name in names:
+            backend = get_backend(name)
+            task(backend)  # 캐시 준비
+            start = time.perf_counter()
+            for _ in range(rounds):
+                task(backend)
+            timings.append(f"{name}: {(time.perf_counter() - start) / rounds * 1000:8.2f} ms")
+        print(f"{task_name:<24} " + "  ".join(timings))
+
+if __name__ == "__main__":
+    import sys
+
+    # 사용법 (src 에서): python -m git.backend <저장소 경로> [브랜치] [반복 횟수]
+    if len(sys.argv) < 2:
+        print("usage: python -m git.backend <repo_path> [branch] [rounds]")
+        sys.exit(1)
+    _benchmark_backends(
+        sys.argv[1],
+        sys.argv[2] if len(sys.argv) > 2 else None,
+        int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    )
@@ -0,0 +1,74 @@
+import subprocess
+import threading
+from typing import Optional
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class CatFileBatch:
+    """git cat-file --batch 프로세스를 유지하며 워킹 트리 변경 없이 객체를 읽습니다."""
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self.process = None
+        self._lock = threading.Lock()
+
+    def _ensure_process(self):
+        if self.process is None or self.process.poll() is not None:
+            logger.info(f"Starting git cat-file --batch in {self.repo_path}")
+            self.process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+
+    def read(self, object_name: str) -> Optional[bytes]:
+        """객체 내용을 반환합니다. (예: "origin/@s6mobis:path/to/file.bb")
+
+        객체가 없으면 None 을 반환합니다.
+        """
+        with self._lock:
+            self._ensure_process()
+            try:
+                self.process.stdin.write(object_name.encode() + b"\n")
+                self.process.stdin.flush()
+
+                # "<sha> <type> <size>" 또는 "<object> missing"
+                header = self.process.stdout.readline().decode().rstrip("\n")
+                if not header:
+                    raise RuntimeError("git cat-file --batch exited unexpectedly")
+                if header.endswith(" missing") or header.endswith(" ambiguous"):
+                    return None
+
+                size = int(header.rsplit(" ", 1)[1])
+                content = self.process.stdout.read(size)
+                self.process.stdout.read(1)  # 내용 뒤의 개행
+                return content
+
+            except Exception:
+                # 프로토콜이 어긋났을 수 있으므로 다음 요청에서 새로 시작
+                self._terminate()
+                raise
+
+    def read_text(self, object_name: str) -> Optional[str]:
+        """객체 내용을 문자열로 반환합니다."""
+        content = self.read(object_name)
+        if content is None:
+            return None
+        return content.decode('utf-8', errors='replace')
+
+    def _terminate(self):
+        if self.process is not None:
+            try:
+                self.process.stdin.close()
+                self.process.wait(timeout=5)
+            except Exception:
+                self.process.kill()
+            self.process = None
+
+    def close(self):
+        """cat-file 프로세스를 종료합니다."""
+        with self._lock:
+            self._terminate()
@@ -0,0 +1,152 @@
+import subprocess
+import tempfile
+import threading
+from typing import Iterator, List, Optional
+from models.diff_hunk import DiffHunk
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_MAX_HUNK_BYTES = 64 * 1024
+DEFAULT_PAGE_BYTES = 256 * 1024
+DEFAULT_PAGE_HUNKS = 200
+
+def iter_diff_hunks(path: str, rev: str = "HEAD", max_hunk_bytes: int = DEFAULT_MAX_HUNK_BYTES) -> Iterator[DiffHunk]:
+    """워킹 트리와 rev 사이의 diff 를 hunk 단위로 읽어가며 반환합니다.
+
+    git diff 출력을 한 번에 메모리에 올리지 않으며, 한 hunk 가 max_hunk_bytes 를
+    넘으면 나머지 줄은 버리고 생략된 크기만 기록합니다. 제너레이터를 끝까지 읽지
+    않고 닫으면 git 프로세스도 종료됩니다.
+    """
+    command = ["git", "diff", "--no-color", "--no-ext-diff", rev]
+    logger.info(f"Running command: {' '.join(command)}")
+    # stderr 를 파이프로 받으면 stdout 을 읽는 동안 경고(CRLF 등)가 쌓여 git 이 멈출 수 있으므로 파일로 받음
+    stderr_file = tempfile.TemporaryFile()
+    process = subprocess.Popen(
+        command,
+        cwd=path,
+        stdout=subprocess.PIPE,
+        stderr=stderr_file,
+        text=True,
+        errors='replace'
+    )
+
+    file_path = None
+    header: List[str] = []
+    hunk: Optional[List[str]] = None
+    hunk_bytes = 0
+    truncated = 0
+
+    def flush():
+        return DiffHunk(file_path, "".join(header), "".join(hunk or []), truncated)
+
+    try:
+        for line in process.stdout:
+            if line.startswith("diff --git "):
+                if file_path is not None:
+                    yield flush()
+                # "diff --git a/<path> b/<path>" 에서 경로를 얻고 +++ 줄이 있으면 덮어씀
+                file_path = line.rstrip("\n").split(" b/", 1)[-1]
+                header, hunk, hunk_bytes, truncated = [line], None, 0, 0
+            elif line.startswith("@@"):
+                # 같은 파일의 hunk 들은 같은 헤더를 가짐 (DiffPager 가 중복 출력을 생략)
+                if hunk is not None:
+                    yield flush()
+                hunk, hunk_bytes, truncated = [line], len(line), 0
+            elif hunk is not None:
+                if hunk_bytes + len(line) > max_hunk_bytes:
+                    truncated += len(line)
+                else:
+                    hunk.append(line)
+                    hunk_bytes += len(line)
+            else:
+                if line.startswith("+++ b/"):
+                    file_path = line[len("+++ b/"):].rstrip("\n")
+                header.append(line)
+
+        if file_path is not None:
+            yield flush()
+
+        process.wait()
+        if process.returncode != 0:
+            stderr_file.seek(0)
+            stderr = stderr_file.read().decode(errors='replace')
+            logger.error(f"Git command failed: {stderr}")
+            raise subprocess.CalledProcessError(process.returncode, command, None, stderr)
+
+    finally:
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+        stderr_file.close()
+
+def git_diff_stat(path: str, rev: str = "HEAD") -> str:
+    """워킹 트리와 rev 사이의 변경 요약(--stat)을 반환합니다."""
+    command = ["git", "diff", "--no-color", "--stat", rev]
+    logger.info(f"Running command: {' '.join(command)}")
+    result = subprocess.run(command, cwd=path, capture_output=True, text=True, errors='replace', check=True)
+    return result.stdout.rstrip()
+
+class DiffPager:
+    """diff hunk 스트림을 크기 제한이 있는 페이지로 나누어 제공합니다.
+
+    next_page() 를 호출할 때마다 최대 max_bytes 또는 max_hunks 만큼 이어서 읽습니다.
+    """
+
+    def __init__(self, hunks: Iterator[DiffHunk], max_bytes: int = DEFAULT_PAGE_BYTES,
+                 max_hunks: int = DEFAULT_PAGE_HUNKS):
+        self.hunks = hunks
+        self.max_bytes = max_bytes
+        self.max_hunks = max_hunks
+        self.exhausted = False
+        self._pending: Optional[DiffHunk] = None  # 이전 페이지에 들어가지 못한 hunk
+        self._last_header = None
+        self._lock = threading.Lock()
+
+    @property
+    def has_more(self) -> bool:
+        return not self.exhausted
+
+    def _format(self, hunk: DiffHunk) -> str:
+        text = hunk.text
+        if hunk.header != self._last_header:
+            text = hunk.header + text
+        if hunk.truncated_bytes:
+            text += f"... ({hunk.truncated_bytes} bytes of this hunk omitted)\n"
+        return text
+
+    def next_page(self) -> str:
+        """다음 페이지의 diff 텍스트를 반환합니다. 더 없으면 빈 문자열"""
+        with self._lock:
+            parts = []
+            size = 0
+            while not self.exhausted and len(parts) < self.max_hunks:
+                hunk = self._pending
+                self._pending = None
+                if hunk is None:
+                    try:
+                        hunk = next(self.hunks)
+                    except StopIteration:
+                        self.exhausted = True
+                        break
+
+                # 페이지가 비어 있으면 크기와 관계없이 한 hunk 는 포함
+                if parts and size + hunk.size > self.max_bytes:
+                    self._pending = hunk
+                    break
+
+                text = self._format(hunk)
+                self._last_header = hunk.header
+                parts.append(text)
+                size += len(text)
+            return "".join(parts)
+
+    def close(self):
+        """남은 스트림을 닫습니다. (git 프로세스 종료)"""
+        with self._lock:
+            self.exhausted = True
+            self._pending = None
+            close = getattr(self.hunks, "close", None)
+            if close:
+                close()
@@ -0,0 +1,231 @@
+import os
+import re
+import threading
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from models.commit_record import CommitRecord, JIRA_PATTERN
+from git.backend import GitBackend, BACKEND_DULWICH
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+try:
+    from dulwich.repo import Repo
+    from dulwich.object_store import iter_tree_contents, tree_lookup_path
+    DULWICH_AVAILABLE = True
+except ImportError:  # 선택 의존성
+    Repo = None
+    DULWICH_AVAILABLE = False
+
+HEX_SHA = re.compile(r'^[0-9a-f]{40}$')
+TRAILER_LINE = re.compile(r'^([A-Za-z0-9][A-Za-z0-9-]*)\s*:\s*(.*)$')
+MAX_CACHED_HEADS = 16  # 조상 커밋 집합을 보관할 브랜치 head 수
+
+class DulwichBackend(GitBackend):
+    """dulwich 로 프로세스 실행 없이 저장소를 직접 읽는 백엔드
+
+    dulwich 로 처리할 수 없는 리비전 표현이나 오류가 나면 CLI 백엔드로 넘깁니다.
+    Repo 객체는 packed-refs 를 메모리에 보관하므로, HEAD / packed-refs / pack 디렉토리가
+    바뀌면(fetch, gc, pack-refs 등) 저장소를 다시 엽니다.
+    """
+    name = BACKEND_DULWICH
+
+    def __init__(self, fallback: GitBackend):
+        self.fallback = fallback
+        self._repos: Dict[str, Tuple["Repo", tuple]] = {}  # path -> (Repo, 디스크 상태)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        # (path, head 커밋) -> head 의 조상 커밋 집합. 커밋은 변하지 않으므로 head 가 같으면 재사용
+        self._ancestors: "OrderedDict[Tuple[str, bytes], frozenset]" = OrderedDict()
+        self._peeled: Dict[bytes, bytes] = {}  # 태그 객체 해시 -> 커밋 해시
+        self._cache_lock = threading.Lock()  # 저장소 잠금을 잡은 채 사용하므로 self._lock 과 분리
+
+    def _stat(self, path: str):
+        try:
+            stat = os.stat(path)
+            return (stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        except FileNotFoundError:
+            return None
+
+    def _fingerprint(self, repo) -> tuple:
+        common_dir = repo.commondir()
+        return (
+            self._stat(os.path.join(repo.controldir(), "HEAD")),
+            self._stat(os.path.join(common_dir, "packed-refs")),
+            self._stat(os.path.join(common_dir, "objects", "pack")),
+        )
+
+    def _open(self, path: str):
+        with self._lock:
+            if path not in self._locks:
+                self._locks[path] = threading.Lock()
+            lock = self._locks[path]
+            repo, fingerprint = self._repos.get(path, (None, None))
+            if repo is None or self._fingerprint(repo) != fingerprint:
+                # 이전 Repo 는 아직 사용 중인 스레드가 있을 수 있어 닫지 않고 참조만 버림
+                repo = Repo(path)
+                self._repos[path] = (repo, self._fingerprint(repo))
+            return repo, lock
+
+    def _call(self, method: str, path: str, *args):
+        """dulwich 구현을 실행하고 실패하면 CLI 백엔드로 다시 실행합니다."""
+        try:
+            repo, lock = self._open(path)
+            with lock:
+                return getattr(self, f"_{method}")(repo, *args)
+        except Exception as e:
+            logger.debug(f"dulwich {method} failed in {path} ({e}); using git CLI")
+            return getattr(self.fallback, method)(path, *args)
+
+    # ---- 내부 도우미 ----
+
+    def _peel(self, repo, sha: bytes) -> bytes:
+        if sha in self._peeled:
+            return self._peeled[sha]
+        obj = repo.object_store[sha]
+        while obj.type_name == b"tag":
+            obj = repo.object_store[obj.object[1]]
+        if obj.id != sha:
+            self._peeled[sha] = obj.id
+        return obj.id
+
+    def _resolve(self, repo, rev: str) -> bytes:
+        """HEAD, ref 이름, 짧은 ref 이름(태그, 브랜치, origin/x), 전체 해시를 커밋 해시로 변환합니다."""
+        refs = repo.refs
+        for candidate in (rev, f"refs/{rev}", f"refs/tags/{rev}", f"refs/heads/{rev}", f"refs/remotes/{rev}"):
+            name = candidate.encode()
+            if name in refs:
+                return self._peel(repo, refs[name])
+        if HEX_SHA.match(rev) and rev.encode() in repo.object_store:
+            return self._peel(repo, rev.encode())
+        raise KeyError(f"unsupported revision for dulwich: {rev}")
+
+    def _commit_record(self, commit) -> CommitRecord:
+        encoding = (commit.encoding or b"utf-8").decode()
+        message = commit.message.decode(encoding, errors="replace")
+        paragraphs = re.split(r'\n\s*\n', message.strip("\n"), maxsplit=1)
+        subject = " ".join(line.strip() for line in paragraphs[0].splitlines())
+        body = paragraphs[1].strip() if len(paragraphs) > 1 else ""
+
+        author = commit.author.decode(encoding, errors="replace")
+        name, _, email = author.partition(" <")
+        offset = timezone(timedelta(seconds=commit.author_timezone))
+        return CommitRecord(
+            sha=commit.id.decode(),
+            subject=subject,
+            body=body,
+            author=name,
+            author_email=email.rstrip(">"),
+            date=datetime.fromtimestamp(commit.author_time, offset),
+            jira_keys=list(dict.fromkeys(JIRA_PATTERN.findall(f"{subject}\n{body}"))),
+            trailers=self._parse_trailers(body)
+        )
+
+    def _parse_trailers(self, body: str) -> Dict[str, List[str]]:
+        """본문 마지막 문단이 모두 "Key: value" 줄이면 trailer 로 해석합니다. (접힌 줄 포함)"""
+        if not body:
+            return {}
+        last = re.split(r'\n\s*\n', body)[-1].splitlines()
+        trailers, current = [], None
+        for line in last:
+            match = TRAILER_LINE.match(line)
+            if match:
+                current = [match.group(1).lower(), match.group(2).strip()]
+                trailers.append(current)
+            elif current and line[:1].isspace():
+                current[1] = f"{current[1]} {line.strip()}"
+            else:
+                return {}
+        result = {}
+        for key, value in trailers:
+            result.setdefault(key, []).append(value)
+        return result
+
+    # ---- dulwich 구현 ----
+
+    def _list_refs(self, repo, prefixes: List[str]) -> List[Tuple[str, str, str]]:
+        result = []
+        for name, sha in sorted(repo.refs.as_dict().items()):
+            ref = name.decode()
+            if not any(ref == prefix or ref.startswith(prefix.rstrip("/") + "/") for prefix in prefixes):
+                continue
+            peeled = self._peel(repo, sha)
+            result.append((ref, sha.decode(), peeled.decode() if peeled != sha else ""))
+        return result
+
+    def _ancestor_set(self, repo, head: bytes) -> frozenset:
+        key = (repo.path, head)
+        with self._cache_lock:
+            if key in self._ancestors:
+                self._ancestors.move_to_end(key)
+                return self._ancestors[key]
+        ancestors = frozenset(entry.commit.id for entry in repo.get_walker(include=[head]))
+        with self._cache_lock:
+            self._ancestors[key] = ancestors
+            while len(self._ancestors) > MAX_CACHED_HEADS:
+                self._ancestors.popitem(last=False)
+        return ancestors
+
+    def _get_tag_hash_by_branch(self, repo, branch: str) -> Dict[str, str]:
+        ancestors = self._ancestor_set(repo, self._resolve(repo, branch))
+        result = {}
+        for name, sha in repo.refs.as_dict(b"refs/tags").items():
+            commit = self._peel(repo, sha)
+            if commit in ancestors:
+                result[name.decode()] = commit.decode()
+        return result
+
+    def _ls_tree_files(self, repo, rev: str) -> List[str]:
+        tree = repo.object_store[self._resolve(repo, rev)].tree
+        return sorted(entry.path.decode("utf-8", errors="replace")
+                      for entry in iter_tree_contents(repo.object_store, tree))
+
+    def _get_commit_records(self, repo, from_rev: str, to_rev: str) -> List[CommitRecord]:
+        walker = repo.get_walker(include=[self._resolve(repo, to_rev)], exclude=[self._resolve(repo, from_rev)])
+        return [self._commit_record(entry.commit) for entry in walker]
+
+    # ---- GitBackend ----
+
+    def list_refs(self, path: str, prefixes: Iterable[str]) -> List[Tuple[str, str, str]]:
+        return self._call("list_refs", path, list(prefixes))
+
+    def get_tag_hash_by_branch(self, path: str, branch: str) -> Dict[str, str]:
+        return self._call("get_tag_hash_by_branch", path, branch)
+
+    def ls_tree_files(self, path: str, rev: str) -> List[str]:
+        return self._call("ls_tree_files", path, rev)
+
+    def get_commit_records(self, path: str, from_rev: str, to_rev: str) -> List[CommitRecord]:
+        return self._call("get_commit_records", path, from_rev, to_rev)
+
+    def blob_reader(self, path: str):
+        return DulwichBlobReader(self, path)
+
+class DulwichBlobReader:
+    """CatFileBatch 와 같은 인터페이스로 "<리비전>:<경로>" blob 을 읽습니다."""
+
+    def __init__(self, backend: DulwichBackend, repo_path: str):
+        self.backend = backend
+        self.repo_path = repo_path
+
+    def read(self, object_name: str) -> Optional[bytes]:
+        """blob 내용을 반환합니다. 없으면 None"""
+        rev, _, file_path = object_name.partition(":")
+        repo, lock = self.backend._open(self.repo_path)
+        with lock:
+            try:
+                tree = repo.object_store[self.backend._resolve(repo, rev)].tree
+                _, sha = tree_lookup_path(repo.object_store.__getitem__, tree, file_path.encode())
+                return repo.object_store[sha].data
+            except KeyError:
+                return None
+
+    def read_text(self, object_name: str) -> Optional[str]:
+        content = self.read(object_name)
+        if content is None:
+            return None
+        return content.decode('utf-8', errors='replace')
+
+    def close(self):
+        pass
@@ -1,8 +1,12 @@
 import os
 import subprocess
-from typing import List
+from typing import Dict, List, Optional
 import re
+from datetime import datetime
 from utils.logger import setup_logger  # 절대 경로 사용
+from models.commit_record import CommitRecord, JIRA_PATTERN
+from models.file_change import FileChange
+from models.push_result import PushResult
 
 
 logger = setup_logger(__name__)
@@ -23,27 +27,92 @@ def run_git_command(command: list, cwd: str = None) -> str:
         logger.error(f"Git command failed: {e.stderr}")
         raise
 
-def git_clone(repo_url: str, branch: str, path: str, folder_name: str = None):
-    """저장소를 클론합니다."""
+def git_clone(repo_url: str, branch: str, path: str, folder_name: str = None, use_mirror: bool = True):
+    """저장소를 클론합니다.
+
+    use_mirror 가 True 이면 ~/.auto-pr/mirrors 의 미러를 --reference-if-able 로
+    사용하여 이미 받은 객체를 다시 내려받지 않습니다.
+    """
+    command = ["git", "clone", "-b", branch]
+    if use_mirror:
+        from git.mirror import MirrorStore
+        reference = MirrorStore.get_instance().reference_for(repo_url)
+        if reference:
+            command += ["--reference-if-able", reference]
+
+    command.append(repo_url)
     if folder_name:
         # 지정된 폴더 이름으로 클론
-        command = ["git", "clone", "-b", branch, repo_url, folder_name]
-        return run_git_command(command, cwd=path)
-    else:
-        # 기본 동작 (repo 이름으로 클론)
-        command = ["git", "clone", "-b", branch, repo_url]
-        return run_git_command(command, cwd=path)
+        command.append(folder_name)
+    return run_git_command(command, cwd=path)
     
 def git_pull(path: str):
     """현재 브랜치에서 pull을 수행합니다."""
     command = ["git", "pull"]
     return run_git_command(command, cwd=path)
     
+def git_fetch(path: str, refspecs: List[str], remote: str = "origin"):
+    """지정한 refspec 만 fetch 합니다."""
+    command = ["git", "fetch", remote] + refspecs
+    return run_git_command(command, cwd=path)
+
+def git_merge_ff_only(path: str, rev: str):
+    """현재 브랜치를 지정한 리비전으로 fast-forward 합니다."""
+    command = ["git", "merge", "--ff-only", rev]
+    return run_git_command(command, cwd=path)
+
+def git_ls_remote_heads(path: str, remote: str = "origin") -> List[str]:
+    """원격 저장소의 브랜치 이름 목록을 반환합니다."""
+    command = ["git", "ls-remote", "--heads", remote]
+    output = run_git_command(command, cwd=path)
+    return [line.split("refs/heads/", 1)[1] for line in output.splitlines() if "refs/heads/" in line]
+    
 def git_checkout(path: str, branch: str):
     """지정된 브랜치로 체크아웃합니다."""
     command = ["git", "checkout", branch]
     return run_git_command(command, cwd=path)
     
+def git_remote_url(path: str, remote: str = "origin") -> str:
+    """원격 저장소 URL 을 반환합니다."""
+    command = ["git", "remote", "get-url", remote]
+    return run_git_command(command, cwd=path)
+
+def git_toplevel(path: str) -> str:
+    """저장소의 최상위 디렉토리 경로를 반환합니다."""
+    command = ["git", "rev-parse", "--show-toplevel"]
+    return run_git_command(command, cwd=path)
+
+def git_verify_commit(path: str, rev: str = "HEAD") -> str:
+    """리비전이 가리키는 커밋과 트리가 저장소에 있는지 확인하고 커밋 해시를 반환합니다."""
+    commit = run_git_command(["git", "rev-parse", "--verify", f"{rev}^{{commit}}"], cwd=path)
+    run_git_command(["git", "cat-file", "-e", f"{commit}^{{tree}}"], cwd=path)
+    return commit
+
+def git_reset_hard(path: str, rev: str = "HEAD"):
+    """워킹 트리와 인덱스를 지정한 리비전으로 되돌립니다."""
+    command = ["git", "reset", "--hard", rev]
+    return run_git_command(command, cwd=path)
+
+def git_clean(path: str):
+    """추적되지 않는 파일과 디렉토리를 삭제합니다."""
+    command = ["git", "clean", "-fd"]
+    return run_git_command(command, cwd=path)
+
+def git_stash_push(path: str, message: str):
+    """추적하지 않는 파일을 포함한 로컬 변경사항을 stash 에 보관합니다."""
+    command = ["git", "stash", "push", "--include-untracked", "-m", message]
+    return run_git_command(command, cwd=path)
+
+def git_rev_list(path: str, args: List[str]) -> List[str]:
+    """git rev-list 결과 커밋 해시 목록을 반환합니다."""
+    command = ["git", "rev-list"] + args
+    return run_git_command(command, cwd=path).splitlines()
+
+def git_create_branch(path: str, branch: str, rev: str):
+    """rev 를 가리키는 브랜치를 만듭니다. (체크아웃하지 않음)"""
+    command = ["git", "branch", branch, rev]
+    return run_git_command(command, cwd=path)
+
 def git_branch(path: str):
     """브랜치 목록을 반환합니다."""
     command = ["git", "branch"]
@@ -54,26 +123,85 @@ def git_status(path: str):
     command = ["git", "status"]
     return run_git_command(command, cwd=path)
 
-def get_remote_tag_hash(repo_url: str, tag: str):
-    """원격 저장소의 태그 해시를 반환합니다."""
-    command = ["git", "ls-remote", "--tags", repo_url, tag]
-    return run_git_command(command)
+def parse_status_porcelain_v2(output: str) -> List[FileChange]:
+    """git status --porcelain=v2 -z 출력을 FileChange 목록으로 변환합니다."""
+    changes = []
+    entries = output.split("\0")
+    i = 0
+    while i < len(entries):
+        entry = entries[i]
+        i += 1
+        if not entry or entry.startswith("#"):
+            continue
+
+        kind = entry[0]
+        if kind == "1":
+            # 1 XY sub mH mI mW hH hI path
+            fields = entry.split(" ", 8)
+            changes.append(FileChange(fields[8], "ordinary", fields[1][0], fields[1][1]))
+        elif kind == "2":
+            # 2 XY sub mH mI mW hH hI Xscore path \0 origPath
+            fields = entry.split(" ", 9)
+            orig_path = entries[i] if i < len(entries) else None
+            i += 1
+            changes.append(FileChange(fields[9], "renamed", fields[1][0], fields[1][1], orig_path))
+        elif kind == "u":
+            # u XY sub m1 m2 m3 mW h1 h2 h3 path
+            fields = entry.split(" ", 10)
+            changes.append(FileChange(fields[10], "unmerged", fields[1][0], fields[1][1]))
+        elif kind == "?":
+            changes.append(FileChange(entry[2:], "untracked"))
+        elif kind == "!":
+            changes.append(FileChange(entry[2:], "ignored"))
+        else:
+            logger.warning(f"Unknown status entry: {entry!r}")
+    return changes
+
+def git_status_porcelain(path: str) -> List[FileChange]:
+    """저장소의 변경된 파일 목록을 반환합니다. (git 언어 설정과 무관)"""
+    command = ["git", "status", "--porcelain=v2", "-z", "--untracked-files=all"]
+    return parse_status_porcelain_v2(run_git_command(command, cwd=path))
+
+def git_ls_remote(remote: str, path: str = None) -> Dict[str, str]:
+    """원격 저장소의 모든 브랜치와 태그를 {ref 이름: 커밋 해시} 로 반환합니다.
+
+    annotated 태그는 태그 객체 대신 가리키는 커밋 해시(^{})를 사용합니다.
+    """
+    command = ["git", "ls-remote", "--heads", "--tags", remote]
+    output = run_git_command(command, cwd=path)
+
+    refs, peeled = {}, {}
+    for line in output.splitlines():
+        object_hash, _, ref = line.partition("\t")
+        if ref.endswith("^{}"):
+            peeled[ref[:-3]] = object_hash
+        elif ref:
+            refs[ref] = object_hash
+    refs.update(peeled)
+    return refs
+
+def get_remote_tag_hash(repo_url: str, tag: str) -> Optional[str]:
+    """원격 저장소의 태그가 가리키는 커밋 해시를 반환합니다. 없으면 None
+
+    원격마다 ls-remote 한 번으로 만든 RemoteRefSnapshot 에서 조회합니다.
+    """
+    from git.remote_refs import RemoteRefSnapshot
+    return RemoteRefSnapshot.get_instance().tag_hash(repo_url, tag)
+
+def get_tag_hash_by_branch(path: str, branch: str) -> Dict[str, str]:
+    """브랜치에 병합된 태그와 커밋 해시의 매핑을 반환합니다.
+
+    annotated 태그는 가리키는 커밋(peeled) 해시로 변환됩니다.
+    설정에서 선택한 읽기 백엔드(git.backend)로 조회합니다.
+    """
+    from git.backend import get_backend
+    return get_backend().get_tag_hash_by_branch(path, branch)
+
+def git_ls_tree_files(path: str, rev: str) -> List[str]:
+    """리비전의 전체 파일 경로 목록을 반환합니다. (체크아웃 없이)"""
+    from git.backend import get_backend
+    return get_backend().ls_tree_files(path, rev)
 
-def get_tag_hash_by_branch(path: str, branch: str):
-    """ 브랜치 해시를 반환합니다."""
-    # 브랜치에 병합된 태그 목록 가져오기
-    command = ["git", "tag", "--merged", branch]
-    tags = run_git_command(command, cwd=path).splitlines()
-    
-    # 각 태그의 해시값 가져오기
-    result = {}
-    for tag in tags:
-        hash_command = ["git", "rev-parse", tag]
-        hash_value = run_git_command(hash_command, cwd=path)
-        result[tag] = hash_value
-        
-    return result
-    
 def git_current_branch(path: str) -> str:
     """현재 브랜치 이름을 반환합니다."""
     command = ["git", "rev-parse", "--abbrev-ref", "HEAD"]
@@ -94,14 +222,65 @@ def git_push(path: str, branch: str):
     command = ["git", "push", "origin", branch]
     return run_git_command(command, cwd=path)
 
+def parse_push_porcelain(output: str) -> List[PushResult]:
+    """git push --porcelain 출력을 ref 별 결과로 변환합니다."""
+    results = []
+    for line in output.splitlines():
+        # "<flag>\t<from>:<to>\t<summary>"
+        parts = line.split("\t")
+        if len(parts) < 3 or len(parts[0]) != 1:
+            continue
+        flag, refspec, summary = parts[0], parts[1], "\t".join(parts[2:])
+        results.append(PushResult(refspec.rsplit(":", 1)[-1], flag, summary))
+    return results
+
+def git_push_atomic(path: str, refspecs: List[str], remote: str = "origin") -> List[PushResult]:
+    """여러 ref 를 한 번의 atomic push 로 보내고 ref 별 결과를 반환합니다.
+
+    하나라도 거부되면 원격에는 아무 ref 도 반영되지 않습니다.
+    """
+    command = ["git", "push", "--atomic", "--porcelain", remote] + list(refspecs)
+    try:
+        output = run_git_command(command, cwd=path)
+    except subprocess.CalledProcessError as e:
+        results = parse_push_porcelain(e.stdout or "")
+        if results:
+            return results
+        # 연결 실패 등으로 ref 별 결과가 없으면 모든 ref 를 실패로 보고
+        reason = (e.stderr or "").strip().splitlines()
+        summary = reason[-1] if reason else "push failed"
+        return [PushResult(refspec.rsplit(":", 1)[-1], "!", summary) for refspec in refspecs]
+    return parse_push_porcelain(output)
+
+def delete_tag(path: str, tag: str) -> None:
+    """로컬 태그를 삭제합니다."""
+    command = ["git", "tag", "-d", tag]
+    run_git_command(command, cwd=path)
+
+def git_push_head(path: str, branch: str):
+    """HEAD 를 원격 브랜치로 push 합니다. (detached worktree 용)"""
+    command = ["git", "push", "origin", f"HEAD:refs/heads/{branch}"]
+    return run_git_command(command, cwd=path)
+
+def git_worktree_add(path: str, worktree_path: str, rev: str):
+    """리비전을 detached 상태로 체크아웃한 worktree 를 추가합니다."""
+    command = ["git", "worktree", "add", "--detach", "--force", worktree_path, rev]
+    return run_git_command(command, cwd=path)
+
+def git_worktree_remove(path: str, worktree_path: str):
+    """worktree 를 삭제합니다."""
+    command = ["git", "worktree", "remove", "--force", worktree_path]
+    return run_git_command(command, cwd=path)
+
+def git_worktree_prune(path: str):
+    """디렉토리가 사라진 worktree 정보를 정리합니다."""
+    command = ["git", "worktree", "prune"]
+    return run_git_command(command, cwd=path)
+
 def get_commit_messages_between_tags(path: str, tag1: str, tag2: str) -> List[str]:
     """두 태그 사이의 커밋 메시지를 가져옵니다."""
     try:
-        # 먼저 fetch 수행
-        fetch_command = ["git", "fetch", "--all", "--tags"]
-        run_git_command(fetch_command, cwd=path)
-        
-        # 전체 커밋 메시지를 가져옴
+        # 전체 커밋 메시지를 가져옴 (fetch 는 WorkspaceManager 의 FetchCoordinator 가 담당)
         command = ["git", "log", "--pretty=format:%s", f"{tag1}..{tag2}"]
         output = run_git_command(command, cwd=path)
         
@@ -114,6 +293,53 @@ def get_commit_messages_between_tags(path: str, tag1: str, tag2: str) -> List[st
         logger.error(f"Error getting commit messages: {e}")
         return []
     
+# 커밋 사이는 -z 의 NUL, 필드 사이는 US(0x1f) 로 구분
+COMMIT_RECORD_FIELDS = ["%H", "%an", "%ae", "%aI", "%s", "%b", "%(trailers:only,unfold)"]
+COMMIT_RECORD_FORMAT = "%x1f".join(COMMIT_RECORD_FIELDS)
+
+def _parse_trailers(text: str) -> Dict[str, List[str]]:
+    trailers = {}
+    for line in text.splitlines():
+        key, sep, value = line.partition(":")
+        if sep and key.strip():
+            trailers.setdefault(key.strip().lower(), []).append(value.strip())
+    return trailers
+
+def parse_commit_records(output: str) -> List[CommitRecord]:
+    """git log -z --format=COMMIT_RECORD_FORMAT 출력을 CommitRecord 목록으로 변환합니다."""
+    records = []
+    for entry in output.split("\0"):
+        entry = entry.strip("\n")
+        if not entry:
+            continue
+        fields = entry.split("\x1f")
+        if len(fields) != len(COMMIT_RECORD_FIELDS):
+            logger.warning(f"Skipping malformed commit record: {entry[:80]!r}")
+            continue
+
+        sha, author, author_email, date, subject, body, trailers = fields
+        body = body.strip()
+        jira_keys = list(dict.fromkeys(JIRA_PATTERN.findall(f"{subject}\n{body}")))
+        records.append(CommitRecord(
+            sha=sha,
+            subject=subject,
+            body=body,
+            author=author,
+            author_email=author_email,
+            date=datetime.fromisoformat(date),
+            jira_keys=jira_keys,
+            trailers=_parse_trailers(trailers)
+        ))
+    return records
+
+def get_commit_records(path: str, from_rev: str, to_rev: str) -> List[CommitRecord]:
+    """from_rev..to_rev 범위의 커밋을 CommitRecord 목록으로 반환합니다. (최신 커밋부터)
+
+    제목, 본문, JIRA 번호, 커밋 수를 한 번의 조회로 모두 얻습니다.
+    """
+    from git.backend import get_backend
+    return get_backend().get_commit_records(path, from_rev, to_rev)
+
 def get_jira_numbers_between_tags(path: str, tag1: str, tag2: str) -> List[str]:
     """두 태그 사이의 JIRA 번호를 가져옵니다."""
     command = ["git", "log", "--pretty=format:%B", f"{tag1}..{tag2}"]
@@ -162,23 +388,13 @@ def get_commit_count_between_tags(path: str, tag1: str, tag2: str) -> int:
         return 0
 
 def git_diff(path: str) -> str:
-    """변경사항을 반환합니다."""
+    """HEAD 대비 변경사항(스테이징 여부와 무관)을 반환합니다.
+
+    큰 diff 는 diff_stream.iter_diff_hunks / DiffPager 로 나누어 읽는 것이 좋습니다.
+    """
     try:
-        # 스테이징되지 않은 변경사항
-        command = ["git", "diff"]
-        unstaged = run_git_command(command, cwd=path)
-        
-        # 스테이징된 변경사항
-        command = ["git", "diff", "--cached"]
-        staged = run_git_command(command, cwd=path)
-        
-        # 둘 다 있으면 합치기
-        if unstaged and staged:
-            return "=== Staged Changes ===\n" + staged + "\n=== Unstaged Changes ===\n" + unstaged
-        elif staged:
-            return staged
-        else:
-            return unstaged
+        command = ["git", "diff", "--no-color", "HEAD"]
+        return run_git_command(command, cwd=path)
             
     except Exception as e:
         logger.error(f"Error getting diff: {e}")
@@ -194,9 +410,52 @@ def push_tag(path: str, tag: str) -> None:
     command = ["git", "push", "origin", tag]
     run_git_command(command, cwd=path)
 
+def _benchmark_tag_hash_by_branch(tag_counts=(500, 1000, 2000, 5000)):
+    """태그 수에 따른 get_tag_hash_by_branch 소요 시간을 측정합니다."""
+    import tempfile
+    import time
+
+    for count in tag_counts:
+        with tempfile.TemporaryDirectory() as repo_path:
+            run_git_command(["git", "init", "-q", "-b", "main"], cwd=repo_path)
+
+            # fast-import로 커밋 하나와 annotated 태그 count개를 한 번에 생성
+            stream = [
+                "commit refs/heads/main",
+                "committer bench <bench@example.com> 0 +0000",
+                "data 5",
+                "bench",
+            ]
+            for i in range(count):
+                stream += [
+                    f"tag version/0.0.{i}",
+                    "from refs/heads/main",
+                    "tagger bench <bench@example.com> 0 +0000",
+                    "data 5",
+                    "bench",
+                ]
+            subprocess.run(
+                ["git", "fast-import", "--quiet"],
+                cwd=repo_path,
+                input="\n".join(stream) + "\n",
+                text=True,
+                check=True
+            )
+
+            start = time.perf_counter()
+            tags = get_tag_hash_by_branch(repo_path, "main")
+            elapsed = time.perf_counter() - start
+            print(f"{len(tags):>5} tags: {elapsed * 1000:.1f} ms")
+
 if __name__ == "__main__":
-    import os
-    
+    import sys
+
+    # 사용법 (src 에서): python -m git.git bench
+    # (python git/git.py 로 실행하면 git/ 가 sys.path 에 들어가 utils 등을 찾지 못함)
+    if len(sys.argv) > 1 and sys.argv[1] == "bench":
+        _benchmark_tag_hash_by_branch()
+        sys.exit(0)
+
     # 테스트를 위한 경로와 브랜치
     workspace_path = os.path.expanduser("~/.auto-pr/workspace")
     repo_path = os.path.join(workspace_path, "audiostreamingmanager")
@@ -0,0 +1,114 @@
+import hashlib
+import os
+import shutil
+import threading
+from typing import Dict, Optional
+from git import git
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MIRROR_DIR = os.path.expanduser("~/.auto-pr/mirrors")
+
+def normalize_url(repo_url: str) -> str:
+    """같은 원격을 가리키는 URL 이 같은 문자열이 되도록 정리합니다."""
+    url = repo_url.strip().rstrip('/')
+    return url[:-len('.git')] if url.endswith('.git') else url
+
+def mirror_path_for(repo_url: str, mirror_dir: str = MIRROR_DIR) -> str:
+    """원격 URL 에 해당하는 미러 저장소 경로를 반환합니다."""
+    url = normalize_url(repo_url)
+    digest = hashlib.sha1(url.encode()).hexdigest()[:10]
+    return os.path.join(mirror_dir, f"{url.split('/')[-1]}-{digest}.git")
+
+class MirrorStore:
+    """원격 저장소별 bare 미러를 관리합니다.
+
+    워크스페이스 클론은 --reference-if-able 로 미러를 alternates 로 사용하므로
+    같은 원격을 여러 폴더에 클론해도 객체는 한 번만 내려받고 저장합니다.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, mirror_dir: str = MIRROR_DIR):
+        if MirrorStore._instance is not None:
+            raise RuntimeError("MirrorStore is a singleton. Use get_instance() instead")
+        self.mirror_dir = mirror_dir
+        os.makedirs(self.mirror_dir, exist_ok=True)
+        self._locks: Dict[str, threading.Lock] = {}
+        self._updating = set()
+        self._lock = threading.Lock()
+
+    def _lock_for(self, mirror_path: str) -> threading.Lock:
+        with self._lock:
+            if mirror_path not in self._locks:
+                self._locks[mirror_path] = threading.Lock()
+            return self._locks[mirror_path]
+
+    def ensure(self, repo_url: str) -> str:
+        """미러가 없으면 만들고 경로를 반환합니다."""
+        mirror_path = mirror_path_for(repo_url, self.mirror_dir)
+        with self._lock_for(mirror_path):
+            if os.path.exists(os.path.join(mirror_path, "HEAD")):
+                return mirror_path
+
+            if os.path.exists(mirror_path):
+                shutil.rmtree(mirror_path)
+
+            logger.info(f"Creating mirror for {repo_url} at {mirror_path}")
+            try:
+                git.run_git_command(["git", "clone", "--mirror", repo_url, mirror_path])
+                # 클론들이 미러의 객체를 참조하므로 자동 gc 로 객체가 지워지지 않게 함
+                git.run_git_command(["git", "config", "gc.auto", "0"], cwd=mirror_path)
+                git.run_git_command(["git", "config", "gc.pruneExpire", "never"], cwd=mirror_path)
+            except Exception:
+                if os.path.exists(mirror_path):
+                    shutil.rmtree(mirror_path)
+                raise
+            return mirror_path
+
+    def update(self, repo_url: str):
+        """미러를 원격과 동기화합니다."""
+        mirror_path = mirror_path_for(repo_url, self.mirror_dir)
+        with self._lock_for(mirror_path):
+            git.run_git_command(["git", "remote", "update", "--prune"], cwd=mirror_path)
+
+    def update_in_background(self, repo_url: str):
+        """미러 동기화를 백그라운드 스레드에서 수행합니다. (이미 진행 중이면 생략)"""
+        mirror_path = mirror_path_for(repo_url, self.mirror_dir)
+        with self._lock:
+            if mirror_path in self._updating:
+                return
+            self._updating.add(mirror_path)
+
+        def run():
+            try:
+                self.update(repo_url)
+            except Exception as e:
+                logger.warning(f"Failed to update mirror {mirror_path}: {e}")
+            finally:
+                with self._lock:
+                    self._updating.discard(mirror_path)
+
+        threading.Thread(target=run, name="mirror-update", daemon=True).start()
+
+    def reference_for(self, repo_url: str) -> Optional[str]:
+        """클론에 사용할 미러 경로를 반환합니다.
+
+        미러가 이미 있으면 백그라운드에서 갱신하고, 없으면 새로 만듭니다.
+        미러를 만들 수 없으면 None 을 반환합니다.
+        """
+        mirror_path = mirror_path_for(repo_url, self.mirror_dir)
+        try:
+            if os.path.exists(os.path.join(mirror_path, "HEAD")):
+                self.update_in_background(repo_url)
+                return mirror_path
+            return self.ensure(repo_url)
+        except Exception as e:
+            logger.warning(f"Mirror unavailable for {repo_url}: {e}")
+            return None
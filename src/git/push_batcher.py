@@ -0,0 +1,72 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+from git import git
+from models.push_result import PushResult
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+class PushBatcher:
+    """저장소(원격)별로 push 할 태그와 브랜치를 모아 한 번의 git push --atomic 으로 보냅니다.
+
+    원격마다 SSH 연결은 한 번이며, 한 원격의 ref 들은 모두 반영되거나 모두 거부됩니다.
+    """
+
+    def __init__(self, remote: str = "origin"):
+        self.remote = remote
+        self.refspecs: Dict[str, List[str]] = {}  # repo_path -> refspec 목록
+        self._lock = threading.Lock()
+
+    def _add(self, repo_path: str, refspec: str):
+        with self._lock:
+            refspecs = self.refspecs.setdefault(repo_path, [])
+            if refspec not in refspecs:
+                refspecs.append(refspec)
+
+    def add_tag(self, repo_path: str, tag: str):
+        """로컬 태그를 push 대상에 추가합니다."""
+        self._add(repo_path, f"refs/tags/{tag}:refs/tags/{tag}")
+
+    def add_branch(self, repo_path: str, rev: str, branch: str):
+        """리비전(커밋 해시 등)을 원격 브랜치로 push 하도록 추가합니다."""
+        self._add(repo_path, f"{rev}:refs/heads/{branch}")
+
+    @property
+    def pending(self) -> bool:
+        with self._lock:
+            return any(self.refspecs.values())
+
+    def push(self) -> Dict[str, List[PushResult]]:
+        """모아둔 ref 들을 저장소마다 atomic push 하고 저장소별 ref 결과를 반환합니다."""
+        with self._lock:
+            batches = {repo_path: refspecs for repo_path, refspecs in self.refspecs.items() if refspecs}
+            self.refspecs = {}
+        if not batches:
+            return {}
+
+        def push_one(item):
+            repo_path, refspecs = item
+            logger.info(f"Pushing {len(refspecs)} refs atomically from {repo_path}")
+            try:
+                return repo_path, git.git_push_atomic(repo_path, refspecs, self.remote)
+            except Exception as e:
+                return repo_path, [PushResult(refspec.rsplit(":", 1)[-1], "!", str(e)) for refspec in refspecs]
+
+        with ThreadPoolExecutor(max_workers=min(8, len(batches))) as executor:
+            results = dict(executor.map(push_one, batches.items()))
+
+        for repo_path, repo_results in results.items():
+            for result in repo_results:
+                if not result.ok:
+                    logger.error(f"Push failed in {repo_path}: {result}")
+        return results
+
+    @staticmethod
+    def failures(results: Dict[str, List[PushResult]]) -> List[str]:
+        """push 결과에서 실패한 ref 의 설명 목록을 반환합니다."""
+        return [
+            f"{repo_path}: {result}"
+            for repo_path, repo_results in results.items()
+            for result in repo_results if not result.ok
+        ]
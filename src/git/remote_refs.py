@@ -0,0 +1,89 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, Optional
+from git import git
+from git.mirror import normalize_url
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_SNAPSHOT_TTL = 60  # 초
+
+class RemoteRefSnapshot:
+    """원격 저장소의 브랜치와 태그 해시를 ls-remote 한 번으로 모아 TTL 동안 보관합니다.
+
+    태그나 브랜치를 하나씩 ls-remote 하지 않고 원격마다 한 번만 조회하므로
+    여러 레시피의 태그를 검증해도 원격당 왕복은 한 번입니다.
+    """
+    _instance = None
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, ttl_seconds: float = DEFAULT_SNAPSHOT_TTL):
+        if RemoteRefSnapshot._instance is not None:
+            raise RuntimeError("RemoteRefSnapshot is a singleton. Use get_instance() instead")
+        self.ttl_seconds = ttl_seconds
+        self.snapshots: Dict[str, Dict[str, str]] = {}  # 정규화된 URL -> {ref: 커밋 해시}
+        self.taken_at: Dict[str, float] = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        with self._lock:
+            if key not in self._locks:
+                self._locks[key] = threading.Lock()
+            return self._locks[key]
+
+    def _is_fresh(self, key: str) -> bool:
+        taken_at = self.taken_at.get(key)
+        return taken_at is not None and time.monotonic() - taken_at <= self.ttl_seconds
+
+    def get_refs(self, remote_url: str, force: bool = False) -> Dict[str, str]:
+        """원격의 모든 ref 를 반환합니다. TTL 안이면 저장된 스냅샷을 사용합니다."""
+        key = normalize_url(remote_url)
+        # 같은 원격을 동시에 요청하면 한 번만 조회하고 나머지는 결과를 기다림
+        with self._lock_for(key):
+            if not force and self._is_fresh(key):
+                return self.snapshots[key]
+
+            logger.info(f"Taking remote ref snapshot of {remote_url}")
+            refs = git.git_ls_remote(remote_url)
+            self.snapshots[key] = refs
+            self.taken_at[key] = time.monotonic()
+            return refs
+
+    def prefetch(self, remote_urls: Iterable[str], force: bool = False):
+        """여러 원격의 스냅샷을 병렬로 준비합니다. 실패한 원격은 로그만 남깁니다."""
+        remote_urls = list(dict.fromkeys(remote_urls))
+        if not remote_urls:
+            return
+
+        def take(remote_url):
+            try:
+                self.get_refs(remote_url, force)
+            except Exception as e:
+                logger.error(f"Failed to list remote refs of {remote_url}: {e}")
+
+        with ThreadPoolExecutor(max_workers=min(8, len(remote_urls))) as executor:
+            list(executor.map(take, remote_urls))
+
+    def tag_hash(self, remote_url: str, tag: str) -> Optional[str]:
+        """태그가 가리키는 커밋 해시를 반환합니다. 없으면 None"""
+        return self.get_refs(remote_url).get(f"refs/tags/{tag}")
+
+    def branch_hash(self, remote_url: str, branch: str) -> Optional[str]:
+        """브랜치가 가리키는 커밋 해시를 반환합니다. 없으면 None"""
+        return self.get_refs(remote_url).get(f"refs/heads/{branch}")
+
+    def invalidate(self, remote_url: str = None):
+        """스냅샷을 지워 다음 조회에서 다시 ls-remote 하도록 합니다. (push 후 등)"""
+        with self._lock:
+            if remote_url is None:
+                self.taken_at.clear()
+            else:
+                self.taken_at.pop(normalize_url(remote_url), None)
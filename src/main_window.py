@@ -8,6 +8,7 @@ from widgets.login_page import LoginPage
 from atlassian import Bitbucket
 from bitbucket.api import BitbucketAPI
 from widgets.home_tab import HomeTab
+from services.pr_monitor import PRMonitor
 from config.repo_config import RepoConfig
 from workspace.manager import WorkspaceManager
 from widgets.recipe_versions_tab import RecipeVersionsTab
@@ -99,6 +100,9 @@ class MainWindow(QMainWindow):
         self.stacked_widget.setCurrentWidget(self.tab_widget)
         self.menuBar().setVisible(True)
         
+        # HomeTab 은 PRMonitor 의 변경 시그널로 PR 목록을 갱신
+        PRMonitor.get_instance().start_monitoring()
+        
         try:
             user = self.bitbucket.get_current_user()
             self.setWindowTitle(f"Bitbucket Monitor - {user['username']}")
@@ -124,6 +128,10 @@ class MainWindow(QMainWindow):
         settings_action.triggered.connect(self.show_settings)
         tools_menu.addAction(settings_action)
 
+    def closeEvent(self, event):
+        PRMonitor.get_instance().stop_monitoring()
+        super().closeEvent(event)
+
     def show_settings(self):
         dialog = SettingsDialog(self.theme_manager, self.config_manager, self)
         dialog.exec() 
\ No newline at end of file
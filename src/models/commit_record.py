@@ -0,0 +1,26 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, List
+import re
+
+JIRA_PATTERN = re.compile(r'(?:[A-Z][A-Z0-9]*-\d+)')
+
+@dataclass
+class CommitRecord:
+    sha: str
+    subject: str
+    body: str
+    author: str
+    author_email: str
+    date: datetime
+    jira_keys: List[str] = field(default_factory=list)
+    trailers: Dict[str, List[str]] = field(default_factory=dict)  # 키는 소문자 (예: "cause")
+
+    @property
+    def message(self) -> str:
+        """제목과 본문을 합친 전체 커밋 메시지"""
+        return f"{self.subject}\n\n{self.body}" if self.body else self.subject
+
+    def trailer(self, key: str) -> str:
+        """trailer 값을 줄바꿈으로 합쳐 반환합니다. 없으면 빈 문자열"""
+        return "\n".join(self.trailers.get(key.lower(), []))
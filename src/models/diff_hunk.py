@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+@dataclass
+class DiffHunk:
+    path: str
+    header: str  # diff --git, index, ---, +++ 등 파일 헤더
+    text: str    # "@@" 로 시작하는 hunk 내용 (바이너리, 모드 변경 등은 빈 문자열)
+    truncated_bytes: int = 0  # 크기 제한으로 생략된 바이트 수
+
+    @property
+    def size(self) -> int:
+        return len(self.header) + len(self.text)
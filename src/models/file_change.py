@@ -0,0 +1,24 @@
+from dataclasses import dataclass
+from typing import Optional
+
+@dataclass
+class FileChange:
+    path: str
+    kind: str  # ordinary, renamed, unmerged, untracked, ignored
+    index_status: str = "."     # 스테이징된 변경 (M, A, D, R, C, U 또는 .)
+    worktree_status: str = "."  # 스테이징되지 않은 변경
+    orig_path: Optional[str] = None  # 이름이 바뀐 경우 원래 경로
+
+    @property
+    def staged(self) -> bool:
+        return self.kind in ("ordinary", "renamed", "unmerged") and self.index_status != "."
+
+    @property
+    def unstaged(self) -> bool:
+        return self.kind == "untracked" or self.worktree_status != "."
+
+    def __str__(self) -> str:
+        code = "??" if self.kind == "untracked" else f"{self.index_status}{self.worktree_status}"
+        if self.orig_path:
+            return f"{code} {self.orig_path} -> {self.path}"
+        return f"{code} {self.path}"
@@ -0,0 +1,26 @@
+from dataclasses import dataclass
+from typing import Optional
+
+PR_CREATED = "created"
+PR_UPDATED = "updated"
+PR_FAILED = "failed"
+
+@dataclass
+class PRResult:
+    repository: str
+    source_branch: str
+    destination_branch: str
+    action: str                   # PR_CREATED, PR_UPDATED, PR_FAILED
+    pr_id: Optional[int] = None
+    url: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.action != PR_FAILED
+
+    def __str__(self) -> str:
+        target = f"{self.repository} {self.source_branch} → {self.destination_branch}"
+        if not self.ok:
+            return f"FAILED {target}: {self.error}"
+        return f"{self.action} {target} (#{self.pr_id})"
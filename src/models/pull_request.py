@@ -1,16 +1,154 @@
-from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
-
-@dataclass
-class PullRequest:
-    id: int
-    title: str
-    description: str
-    source_branch: str
-    target_branch: str
-    author: str
-    created_on: datetime
-    updated_on: datetime
-    state: str
-    is_merged: bool 
\ No newline at end of file
+from typing import Dict, Optional, Tuple
+
+# 저장소/브랜치 이름은 PR 마다 반복되므로 같은 문자열 객체를 공유
+_STRINGS: Dict[str, str] = {}
+
+def intern_name(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return _STRINGS.setdefault(value, value)
+
+def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+class _Immutable:
+    """한 번 정한 공개 필드는 바꿀 수 없는 객체
+
+    HttpCache 가 보관한 객체를 여러 호출자가 함께 쓰므로, 복사(copy/deepcopy)하면
+    같은 객체를 그대로 반환합니다. 밑줄로 시작하는 필드는 내부 캐시 용도로 쓸 수 있습니다.
+    """
+    __slots__ = ()
+
+    def __setattr__(self, name, value):
+        if name[0] != '_' and hasattr(self, name):
+            raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__}.{name} is read-only")
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memo):
+        return self
+
+class BranchRef(_Immutable):
+    """PR 의 source / destination (저장소, 브랜치, 커밋)"""
+    __slots__ = ('repository', 'branch', 'commit')
+
+    def __init__(self, repository: Optional[str], branch: Optional[str], commit: Optional[str] = None):
+        self.repository = intern_name(repository)
+        self.branch = intern_name(branch)
+        self.commit = commit
+
+    @classmethod
+    def from_json(cls, data: Optional[dict]) -> "BranchRef":
+        data = data or {}
+        return cls(
+            (data.get('repository') or {}).get('name'),
+            (data.get('branch') or {}).get('name'),
+            (data.get('commit') or {}).get('hash')
+        )
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BranchRef):
+            return NotImplemented
+        return (self.repository, self.branch, self.commit) == (other.repository, other.branch, other.commit)
+
+    def __hash__(self) -> int:
+        return hash((self.repository, self.branch, self.commit))
+
+    def __repr__(self) -> str:
+        return f"BranchRef({self.repository!r}, {self.branch!r}, {self.commit!r})"
+
+class PullRequest(_Immutable):
+    """화면과 PR 작업에 필요한 필드만 가진 Pull Request (읽기 전용)
+
+    Bitbucket JSON 전체 대신 이 객체를 사용합니다. updated_on / created_on 은
+    문자열로 보관하다가 처음 접근할 때 datetime 으로 변환합니다.
+    같은 PR(key) 이고 updated_on 과 state 가 같으면 같은 PR 로 봅니다.
+    """
+    __slots__ = (
+        'id', 'title', 'state', 'source', 'destination',
+        'diff_url', 'diffstat_url', 'html_url',
+        'updated_on_raw', 'created_on_raw', '_updated_on', '_created_on'
+    )
+
+    def __init__(self, id: int, title: str, state: str, source: BranchRef, destination: BranchRef,
+                 diff_url: Optional[str] = None, diffstat_url: Optional[str] = None,
+                 html_url: Optional[str] = None, updated_on: Optional[str] = None,
+                 created_on: Optional[str] = None):
+        self.id = id
+        self.title = title
+        self.state = intern_name(state)
+        self.source = source
+        self.destination = destination
+        self.diff_url = diff_url
+        self.diffstat_url = diffstat_url
+        self.html_url = html_url
+        self.updated_on_raw = updated_on
+        self.created_on_raw = created_on
+        self._updated_on = None
+        self._created_on = None
+
+    @classmethod
+    def from_json(cls, data: dict) -> "PullRequest":
+        """Bitbucket API (또는 webhook) 의 pullrequest JSON 을 변환합니다."""
+        links = data.get('links') or {}
+
+        def href(name):
+            return (links.get(name) or {}).get('href')
+
+        return cls(
+            id=data['id'],
+            title=data.get('title', ''),
+            state=data.get('state', 'OPEN'),
+            source=BranchRef.from_json(data.get('source')),
+            destination=BranchRef.from_json(data.get('destination')),
+            diff_url=href('diff'),
+            diffstat_url=href('diffstat'),
+            html_url=href('html'),
+            updated_on=data.get('updated_on'),
+            created_on=data.get('created_on')
+        )
+
+    @property
+    def key(self) -> Tuple[str, int]:
+        """(저장소, PR id)"""
+        return (self.source.repository, self.id)
+
+    @property
+    def updated_on(self) -> Optional[datetime]:
+        if self._updated_on is None:
+            self._updated_on = _parse_datetime(self.updated_on_raw)
+        return self._updated_on
+
+    @property
+    def created_on(self) -> Optional[datetime]:
+        if self._created_on is None:
+            self._created_on = _parse_datetime(self.created_on_raw)
+        return self._created_on
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == 'OPEN'
+
+    @property
+    def is_merged(self) -> bool:
+        return self.state == 'MERGED'
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, PullRequest):
+            return NotImplemented
+        return (self.id == other.id and self.source.repository == other.source.repository
+                and self.updated_on_raw == other.updated_on_raw and self.state == other.state)
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"PullRequest({self.source.repository}#{self.id} {self.state} {self.title!r})"
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+@dataclass
+class PushResult:
+    ref: str      # 원격 ref 이름 (예: refs/tags/version/1.0.0)
+    flag: str     # git push --porcelain 의 상태 문자 (' ', '+', '-', '*', '=', '!')
+    summary: str  # 예: "[new tag]", "[rejected] (atomic push failed)"
+
+    @property
+    def ok(self) -> bool:
+        return self.flag != "!"
+
+    def __str__(self) -> str:
+        return f"{'ok' if self.ok else 'FAILED'} {self.ref} {self.summary}"
@@ -0,0 +1,99 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List
+from PyQt6.QtCore import QObject, pyqtSignal
+from bitbucket.api import BitbucketAPI
+from models.pr_result import PRResult, PR_CREATED, PR_UPDATED, PR_FAILED
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MAX_PARALLEL_PRS = 8
+
+class BulkPREngine(QObject):
+    """여러 PR 을 제한된 수의 작업 스레드로 동시에 생성합니다.
+
+    저장소마다 한 번의 조회로 같은 source/destination 의 열린 PR 을 찾아
+    이미 있으면 새로 만들지 않고 제목과 설명을 갱신하므로, 일부가 실패한 뒤
+    다시 실행해도 PR 이 중복되지 않습니다.
+    """
+    pr_finished = pyqtSignal(object)  # PRResult
+    progress = pyqtSignal(int, int)  # 완료 수, 전체 수
+
+    def __init__(self, api: BitbucketAPI = None, max_workers: int = MAX_PARALLEL_PRS, parent=None):
+        super().__init__(parent)
+        self.api = api or BitbucketAPI.get_instance()
+        self.max_workers = max_workers
+
+    def _key(self, pr_data: dict) -> tuple:
+        return (pr_data['source']['repository'], pr_data['source']['branch'], pr_data['destination']['branch'])
+
+    def find_existing(self, pr_requests: List[dict]) -> Dict[tuple, object]:
+        """{(저장소, source, destination): 열린 PullRequest 또는 조회 중 발생한 예외} 를 반환합니다."""
+        pairs_by_repo: Dict[str, list] = {}
+        for pr_data in pr_requests:
+            repo, source, destination = self._key(pr_data)
+            pairs_by_repo.setdefault(repo, []).append((source, destination))
+
+        def lookup(repo):
+            try:
+                return repo, self.api.find_open_pull_requests(repo, pairs_by_repo[repo])
+            except Exception as e:
+                logger.error(f"Failed to look up open PRs in {repo}: {e}")
+                return repo, e
+
+        existing = {}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(pairs_by_repo))) as executor:
+            for repo, found in executor.map(lookup, pairs_by_repo):
+                for source, destination in pairs_by_repo[repo]:
+                    # 조회에 실패한 저장소는 중복을 만들지 않도록 생성하지 않음
+                    existing[(repo, source, destination)] = found if isinstance(found, Exception) \
+                        else found.get((source, destination))
+        return existing
+
+    def _submit_one(self, pr_data: dict, existing) -> PRResult:
+        repo, source, destination = self._key(pr_data)
+        if isinstance(existing, Exception):
+            return PRResult(repo, source, destination, PR_FAILED, error=f"open PR lookup failed: {existing}")
+        try:
+            if existing is not None:
+                pr = self.api.update_pull_request(repo, existing.id, pr_data)
+                action = PR_UPDATED
+            else:
+                pr = self.api.create_pull_request(pr_data)
+                action = PR_CREATED
+            return PRResult(repo, source, destination, action, pr.id, pr.html_url)
+        except Exception as e:
+            return PRResult(repo, source, destination, PR_FAILED, error=str(e))
+
+    def run(self, pr_requests: List[dict]) -> List[PRResult]:
+        """PR 들을 생성(또는 갱신)하고 결과 목록을 반환합니다.
+
+        pr_finished / progress 시그널은 run 을 호출한 스레드에서 발생합니다.
+        작업 스레드에서 호출하면 GUI 객체의 슬롯에는 Qt 가 큐로 전달합니다.
+        """
+        unique = {}
+        for pr_data in pr_requests:
+            key = self._key(pr_data)
+            if key in unique:
+                logger.warning(f"Skipping duplicate PR request {key}")
+                continue
+            unique[key] = pr_data
+        if not unique:
+            return []
+
+        existing = self.find_existing(list(unique.values()))
+        results = []
+        total = len(unique)
+        self.progress.emit(0, total)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, total)) as executor:
+            futures = [executor.submit(self._submit_one, pr_data, existing.get(key)) for key, pr_data in unique.items()]
+            for future in as_completed(futures):
+                result = future.result()
+                if result.ok:
+                    logger.info(f"PR {result}")
+                else:
+                    logger.error(f"PR {result}")
+                results.append(result)
+                self.pr_finished.emit(result)
+                self.progress.emit(len(results), total)
+        return results
@@ -1,35 +1,232 @@
-from typing import List, Callable
 import time
-import threading
-from bitbucket.api import BitbucketAPI
+from datetime import datetime, timedelta
+from typing import Dict, Optional, Set, Tuple
+from PyQt6.QtCore import QObject, QThread, QTimer, pyqtSignal
+from bitbucket.api import BitbucketAPI, PR_STATES
+from config.webhook_config import WebhookConfig
 from models.pull_request import PullRequest
+from services.webhook_receiver import WebhookReceiver
+from utils.logger import setup_logger
 
-class PRMonitor:
-    def __init__(self, bitbucket_api: BitbucketAPI):
-        self.api = bitbucket_api
-        self.callbacks: List[Callable[[List[PullRequest]], None]] = []
+logger = setup_logger(__name__)
+
+MIN_INTERVAL = 30  # 초, 변경이 있을 때의 폴링 간격
+MAX_INTERVAL = 10 * 60  # 초, 변경이 없을 때 늘어나는 최대 간격
+BURST_INTERVAL = 5  # 초, 로컬에서 PR 을 만든 직후의 폴링 간격
+BURST_POLLS = 6
+FULL_SYNC_INTERVAL = 15 * 60  # 초, 사라진 PR 을 찾기 위한 전체 동기화 주기
+WATERMARK_OVERLAP = timedelta(seconds=5)
+
+class PRPollWorker(QThread):
+    """meta-* PR 을 페이지 단위로 받아 전달하는 스레드
+
+    updated_since 가 없으면 열린 PR 전체를, 있으면 그 이후 바뀐 모든 상태의 PR 을 받습니다.
+    """
+    page_loaded = pyqtSignal(list)
+    error = pyqtSignal(str)
+
+    def __init__(self, updated_since: Optional[datetime] = None, parent=None):
+        super().__init__(parent)
+        self.updated_since = updated_since
+        self.failed = False
+
+    def run(self):
+        try:
+            bitbucket = BitbucketAPI.get_instance()
+            if self.updated_since is None:
+                pages = bitbucket.iter_pull_request_meta_pages()
+            else:
+                pages = bitbucket.iter_pull_request_meta_pages(updated_since=self.updated_since, state=PR_STATES)
+            for page in pages:
+                if self.isInterruptionRequested():
+                    return
+                self.page_loaded.emit(page)
+        except Exception as e:
+            self.failed = True
+            self.error.emit(str(e))
+
+class PRMonitor(QObject):
+    """meta-* 저장소의 열린 PR 목록 변경을 감시합니다.
+
+    마지막으로 본 updated_on 을 기준(watermark)으로 그 이후 바뀐 PR 만 조회하고,
+    변경 종류별 시그널(추가, 갱신, 병합/거절, 사라짐)을 GUI 스레드에서 보냅니다.
+    변경이 없으면 폴링 간격을 늘리고, 로컬에서 PR 을 만든 직후에는 좁힙니다.
+    사라진 PR 은 watermark 조회로 알 수 없으므로 주기적으로 전체 목록과 비교합니다.
+    WebhookConfig 에서 켜면 로컬 webhook 수신기로 받은 PR 도 같은 경로로 반영합니다.
+    webhook 으로 받은 PR 은 watermark 를 옮기지 않으므로, 그 사이 놓친 변경도 다음 폴링에서 받습니다.
+    """
+    _instance = None
+
+    prs_added = pyqtSignal(list)
+    prs_updated = pyqtSignal(list)
+    prs_closed = pyqtSignal(list)  # MERGED, DECLINED, SUPERSEDED
+    prs_removed = pyqtSignal(list)  # 상태 변경 없이 목록에서 사라진 PR
+    poll_failed = pyqtSignal(str)
+    webhook_received = pyqtSignal(list)  # webhook 스레드에서 GUI 스레드로 PR 을 넘김
+
+    @classmethod
+    def get_instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self, parent=None):
+        if PRMonitor._instance is not None:
+            raise RuntimeError("PRMonitor is a singleton. Use get_instance() instead")
+        super().__init__(parent)
+        self.prs: Dict[Tuple[str, int], PullRequest] = {}  # PullRequest.key -> 현재 열린 PR
+        self.watermark: Optional[datetime] = None
+        self.last_full_sync = 0.0
+        self.interval = MIN_INTERVAL
+        self.burst_polls = 0
         self.is_monitoring = False
-        self.monitor_thread = None
+        self.worker: Optional[PRPollWorker] = None
+        self.full_sync = False
+        self.seen: Set[Tuple[str, int]] = set()
+        self.changed = False
+        self.pending_full_sync = False
+        self.receiver: Optional[WebhookReceiver] = None
+        self.webhook_received.connect(self.apply_webhook)
 
-    def start_monitoring(self, interval_seconds: int = 60):
-        """PR 모니터링을 시작합니다."""
+        self.timer = QTimer(self)
+        self.timer.setSingleShot(True)
+        self.timer.timeout.connect(self.poll)
+
+    def start_monitoring(self):
+        """PR 모니터링을 시작합니다. 첫 조회는 전체 동기화입니다."""
         self.is_monitoring = True
-        self.monitor_thread = threading.Thread(target=self._monitor_loop, args=(interval_seconds,))
-        self.monitor_thread.daemon = True
-        self.monitor_thread.start()
+        self.interval = MIN_INTERVAL
+        self.start_webhook_receiver()
+        self.poll()
 
     def stop_monitoring(self):
         """PR 모니터링을 중지합니다."""
         self.is_monitoring = False
-        if self.monitor_thread:
-            self.monitor_thread.join()
-
-    def _monitor_loop(self, interval_seconds: int):
-        while self.is_monitoring:
-            try:
-                prs = self.api.get_pull_requests()
-                for callback in self.callbacks:
-                    callback(prs)
-            except Exception as e:
-                print(f"모니터링 중 오류 발생: {e}")
-            time.sleep(interval_seconds) 
\ No newline at end of file
+        self.timer.stop()
+        if self.receiver is not None:
+            self.receiver.stop()
+            self.receiver = None
+        if self.worker is not None and self.worker.isRunning():
+            self.worker.requestInterruption()
+            self.worker.wait()
+
+    def start_webhook_receiver(self):
+        """설정(WebhookConfig)에서 켜져 있으면 로컬 webhook 수신기를 시작합니다."""
+        config = WebhookConfig.get_instance()
+        if not config.enabled or self.receiver is not None:
+            return
+        try:
+            self.receiver = WebhookReceiver(config.secret, self.receive_webhook, config.host, config.port)
+            self.receiver.start()
+        except Exception as e:
+            self.receiver = None
+            logger.error(f"Failed to start webhook receiver: {e}")
+
+    def receive_webhook(self, event_key: str, pr: PullRequest):
+        """webhook 으로 받은 PR 을 GUI 스레드의 apply_webhook 으로 넘깁니다. (수신기 스레드)"""
+        if BitbucketAPI.is_meta_pull_request(pr):
+            self.webhook_received.emit([pr])
+
+    def refresh(self):
+        """바로 전체 목록을 다시 동기화합니다. (새로고침 버튼)"""
+        self.pending_full_sync = True
+        self.poll()
+
+    def notify_local_change(self):
+        """로컬에서 PR 을 만들거나 수정한 뒤 호출하면 잠시 동안 자주 폴링합니다."""
+        self.burst_polls = BURST_POLLS
+        if self.is_monitoring and (self.worker is None or not self.worker.isRunning()):
+            self._schedule(BURST_INTERVAL)
+
+    def poll(self):
+        if not self.is_monitoring:
+            return
+        if self.worker is not None and self.worker.isRunning():
+            return
+        self.timer.stop()
+
+        self.full_sync = (
+            self.pending_full_sync
+            or self.watermark is None
+            or time.monotonic() - self.last_full_sync >= FULL_SYNC_INTERVAL
+        )
+        self.pending_full_sync = False
+        self.seen = set()
+        self.changed = False
+
+        updated_since = None if self.full_sync else self.watermark - WATERMARK_OVERLAP
+        self.worker = PRPollWorker(updated_since, parent=self)
+        self.worker.page_loaded.connect(self.apply_page)
+        self.worker.error.connect(self.on_poll_error)
+        self.worker.finished.connect(self.on_poll_finished)
+        self.worker.start()
+
+    def apply_webhook(self, prs):
+        """webhook 으로 받은 PR 을 반영합니다. watermark 는 폴링 결과로만 옮깁니다."""
+        self.apply_page(prs, from_poll=False)
+
+    def apply_page(self, prs, from_poll: bool = True):
+        """받은 PR 페이지를 현재 목록과 비교해 변경 시그널을 보냅니다.
+
+        from_poll 이 False(webhook)이면 watermark 를 옮기지 않습니다. webhook 은 순서가
+        보장되지 않아, 옮기면 그보다 앞서 바뀐 PR 을 다음 폴링에서 놓칠 수 있습니다.
+        """
+        added, updated, closed = [], [], []
+        for pr in prs:
+            key = pr.key
+            if from_poll:
+                updated_on = pr.updated_on
+                if self.watermark is None or updated_on > self.watermark:
+                    self.watermark = updated_on
+
+            known = self.prs.get(key)
+            if pr.is_open:
+                self.seen.add(key)
+                if known is None:
+                    added.append(pr)
+                elif known != pr:
+                    updated.append(pr)
+                self.prs[key] = pr
+            elif known is not None:
+                del self.prs[key]
+                closed.append(pr)
+
+        self._emit(self.prs_added, added)
+        self._emit(self.prs_updated, updated)
+        self._emit(self.prs_closed, closed)
+
+    def on_poll_error(self, message):
+        logger.error(f"Error polling pull requests: {message}")
+        self.poll_failed.emit(message)
+
+    def on_poll_finished(self):
+        worker, self.worker = self.worker, None
+        if worker is None or worker.isInterruptionRequested():
+            return
+
+        if self.full_sync and not worker.failed:
+            self.last_full_sync = time.monotonic()
+            removed = [self.prs.pop(key) for key in list(self.prs) if key not in self.seen]
+            self._emit(self.prs_removed, removed)
+
+        if self.burst_polls > 0:
+            self.burst_polls -= 1
+            interval = BURST_INTERVAL
+        elif self.changed:
+            self.interval = MIN_INTERVAL
+            interval = self.interval
+        else:
+            # 변경이 없으면 간격을 두 배씩 늘림
+            self.interval = min(self.interval * 2, MAX_INTERVAL)
+            interval = self.interval
+        self._schedule(interval)
+
+    def _emit(self, signal, prs):
+        if prs:
+            self.changed = True
+            signal.emit(prs)
+
+    def _schedule(self, seconds: float):
+        if self.is_monitoring:
+            logger.debug(f"Next PR poll in {seconds}s")
+            self.timer.start(int(seconds * 1000))
@@ -0,0 +1,225 @@
+import hashlib
+import hmac
+import json
+import threading
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterable, Optional
+from models.pull_request import PullRequest
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+WEBHOOK_PATH = "/webhook"
+MAX_BODY_BYTES = 1024 * 1024
+SIGNATURE_HEADER = "X-Hub-Signature"
+EVENT_HEADER = "X-Event-Key"
+API_ROOT = "https://api.bitbucket.org/2.0"
+
+def sign(secret: str, body: bytes) -> str:
+    """Bitbucket 이 X-Hub-Signature 에 넣는 "sha256=<hex>" 서명"""
+    return "sha256=" + hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+
+def verify_signature(secret: str, body: bytes, signature: Optional[str]) -> bool:
+    if not secret or not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body), signature.strip())
+
+def pull_request_from_payload(payload: dict) -> Optional[PullRequest]:
+    """pullrequest:* webhook 본문에서 PullRequest 를 만듭니다.
+
+    pullrequest 나 updated_on 이 없으면 변경 순서를 알 수 없으므로 None 을 반환합니다.
+    """
+    pr = payload.get('pullrequest')
+    if not pr or not pr.get('updated_on'):
+        return None
+    # Bitbucket 은 값이 없을 때 키를 빼지 않고 null 을 보내기도 하므로 `or {}` 로 받음
+    source = pr.get('source') or {}
+    destination = pr.get('destination') or {}
+    repository = source.get('repository') or payload.get('repository') or {}
+    full_name = repository.get('full_name')
+    links = pr.get('links') or {}
+
+    def href(name):
+        return (links.get(name) or {}).get('href')
+
+    # webhook 본문에는 diff/diffstat 링크가 없을 수 있어 API 경로로 채움
+    api_url = f"{API_ROOT}/repositories/{full_name}/pullrequests/{pr['id']}" if full_name else None
+    return PullRequest.from_json({
+        'id': pr['id'],
+        'title': pr.get('title', ''),
+        'state': pr.get('state', 'OPEN'),
+        'updated_on': pr['updated_on'],
+        'source': {
+            'branch': {'name': (source.get('branch') or {}).get('name')},
+            'repository': {'name': repository.get('name')},
+            'commit': {'hash': (source.get('commit') or {}).get('hash')}
+        },
+        'destination': {
+            'branch': {'name': (destination.get('branch') or {}).get('name')},
+            'commit': {'hash': (destination.get('commit') or {}).get('hash')}
+        },
+        'links': {
+            'diff': {'href': href('diff') or (api_url and f"{api_url}/diff")},
+            'diffstat': {'href': href('diffstat') or (api_url and f"{api_url}/diffstat")},
+            'html': {'href': href('html')}
+        }
+    })
+
+class _WebhookHandler(BaseHTTPRequestHandler):
+    server_version = "BitbucketMonitorWebhook/1.0"
+
+    def log_message(self, format, *args):
+        logger.debug(f"webhook {self.address_string()} {format % args}")
+
+    def _reply(self, status: int, message: str = ""):
+        body = message.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        receiver: WebhookReceiver = self.server.receiver
+        if self.path.split("?", 1)[0] != WEBHOOK_PATH:
+            self._reply(404, "not found")
+            return
+
+        length = int(self.headers.get("Content-Length") or 0)
+        if length <= 0 or length > MAX_BODY_BYTES:
+            self._reply(413 if length > MAX_BODY_BYTES else 400, "invalid body size")
+            return
+        body = self.rfile.read(length)
+
+        if not verify_signature(receiver.secret, body, self.headers.get(SIGNATURE_HEADER)):
+            logger.warning(f"Rejected webhook with invalid signature from {self.address_string()}")
+            self._reply(401, "invalid signature")
+            return
+
+        event_key = self.headers.get(EVENT_HEADER, "")
+        if not event_key.startswith("pullrequest:"):
+            self._reply(204)
+            return
+
+        try:
+            pr = pull_request_from_payload(json.loads(body))
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            self._reply(400, f"invalid payload: {e}")
+            return
+        if pr is None:
+            logger.warning(f"Dropped webhook {event_key} without pullrequest.updated_on")
+            self._reply(400, "missing pullrequest or updated_on")
+            return
+
+        logger.info(f"Webhook {event_key}: {pr.source.repository}#{pr.id} {pr.state}")
+        try:
+            receiver.on_pull_request(event_key, pr)
+        except Exception as e:
+            logger.error(f"Error handling webhook {event_key}: {e}")
+            self._reply(500, "handler failed")
+            return
+        self._reply(202, "accepted")
+
+class WebhookReceiver:
+    """Bitbucket pullrequest webhook 을 받는 로컬 HTTP 서버
+
+    서명(X-Hub-Signature, HMAC-SHA256)을 확인한 PR 만 on_pull_request(event_key, pr) 로 넘깁니다.
+    콜백은 서버 스레드에서 호출됩니다.
+    """
+
+    def __init__(self, secret: str, on_pull_request: Callable[[str, PullRequest], None],
+                 host: str = "127.0.0.1", port: int = 8787):
+        if not secret:
+            raise ValueError("A webhook secret is required to verify Bitbucket signatures")
+        self.secret = secret
+        self.on_pull_request = on_pull_request
+        self.host = host
+        self.port = port
+        self.server: Optional[ThreadingHTTPServer] = None
+        self.thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2] if self.server else (self.host, self.port)
+        return f"http://{host}:{port}{WEBHOOK_PATH}"
+
+    def start(self):
+        self.server = ThreadingHTTPServer((self.host, self.port), _WebhookHandler)
+        self.server.daemon_threads = True
+        self.server.receiver = self
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        logger.info(f"Webhook receiver listening on {self.url}")
+
+    def stop(self):
+        if self.server is not None:
+            self.server.shutdown()
+            self.server.server_close()
+            self.server = None
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+def replay_payloads(url: str, secret: str, paths: Iterable[str], event_key: str = "pullrequest:updated"):
+    """저장해 둔 webhook 본문을 서명해서 수신기로 보냅니다. (Bitbucket 대신 로컬 테스트용)
+
+    파일은 webhook 본문 그대로이거나 {"event": "...", "payload": {...}} 형식입니다.
+    """
+    for path in paths:
+        with open(path, 'r') as f:
+            recorded = json.load(f)
+        event = event_key
+        if 'payload' in recorded:
+            event = recorded.get('event', event_key)
+            recorded = recorded['payload']
+
+        body = json.dumps(recorded).encode()
+        request = urllib.request.Request(url, data=body, method="POST", headers={
+            "Content-Type": "application/json",
+            EVENT_HEADER: event,
+            SIGNATURE_HEADER: sign(secret, body)
+        })
+        try:
+            with urllib.request.urlopen(request, timeout=10) as response:
+                print(f"{path}: {event} -> {response.status}")
+        except urllib.error.HTTPError as e:
+            print(f"{path}: {event} -> {e.code} {e.read().decode(errors='replace')}")
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    # 사용법 (src 에서):
+    #   python -m services.webhook_receiver serve --secret S [--port 8787]
+    #   python -m services.webhook_receiver replay --secret S [--url URL] payload.json ...
+    parser = argparse.ArgumentParser(description="Bitbucket pull request webhook receiver")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve = subparsers.add_parser("serve", help="run a headless receiver that logs PR events")
+    serve.add_argument("--secret", required=True)
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8787)
+
+    replay = subparsers.add_parser("replay", help="post recorded payloads to a receiver")
+    replay.add_argument("--secret", required=True)
+    replay.add_argument("--url", default=f"http://127.0.0.1:8787{WEBHOOK_PATH}")
+    replay.add_argument("--event", default="pullrequest:updated")
+    replay.add_argument("payloads", nargs="+")
+
+    args = parser.parse_args()
+    if args.command == "serve":
+        receiver = WebhookReceiver(
+            args.secret,
+            lambda event_key, pr: print(f"{event_key} {pr!r} updated_on={pr.updated_on_raw}"),
+            args.host, args.port
+        )
+        receiver.start()
+        try:
+            while True:
+                time.sleep(1)
+        except KeyboardInterrupt:
+            receiver.stop()
+    else:
+        replay_payloads(args.url, args.secret, args.payloads, args.event)
@@ -1,3 +1,4 @@
+import re
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -31,4 +32,10 @@ def generate_next_version(current_version: str) -> str:
             
     except Exception as e:
         logger.error(f"Failed to generate next version for {current_version}: {e}")
-        return current_version 
\ No newline at end of file
+        return current_version
+
+def version_sort_key(tag: str) -> list:
+    """git의 version:refname 정렬과 같은 순서를 만드는 정렬 키"""
+    # 숫자 부분은 정수로 비교 (예: version/0.0.10 > version/0.0.9)
+    parts = re.split(r'(\d+)', tag)
+    return [int(part) if i % 2 else part for i, part in enumerate(parts)]
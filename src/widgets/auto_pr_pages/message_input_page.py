@@ -95,28 +95,18 @@ class MessageInputPage(QWidget):
                 title += f"{recipe['name']}={recipe['new_version'].replace('version/', '')} "
         self.title_edit.setText(title.strip())
         
-        # 설명 자동 생성
-        all_commit_messages = []
-        description = []
-        for recipe in updated_recipes:
-            try:
-                commits = workspace.get_commit_messages_between_tags(
-                    recipe['name'],
-                    recipe['old_version'],
-                    recipe['new_version']
-                )
-                description.extend(commits)
-                all_commit_messages.extend(commits)
-            except Exception as e:
-                logger.error(f"Failed to get commit messages for {recipe['name']}: {e}")
-                
-        self.desc_edit.setText("\n".join(description))
+        # 설명 자동 생성 (레시피별 커밋 레코드를 한 번에 조회)
+        ranges = [(recipe['name'], recipe['old_version'], recipe['new_version']) for recipe in updated_recipes]
+        records = workspace.get_commit_records(ranges)
+        all_records = [record for commit_range in ranges for record in records.get(commit_range, [])]
+        
+        self.desc_edit.setText("\n".join(record.subject for record in all_records))
         
         # 원인과 대책
         causes = []
         countermeasures = []
-        for commit in all_commit_messages:
-            parsed = workspace.parse_commit_message(commit)
+        for record in all_records:
+            parsed = workspace.parse_commit_record(record)
             if parsed.get('cause'):
                 causes.append(parsed['cause'])
             if parsed.get('countermeasure'):
@@ -127,7 +117,6 @@ class MessageInputPage(QWidget):
         
         # Jira 티켓
         jiras = set()
-        for commit in all_commit_messages:
-            jira_numbers = re.findall(r'(?:[A-Z][A-Z0-9]*-\d+)', commit)
-            jiras.update(jira_numbers)
+        for record in all_records:
+            jiras.update(record.jira_keys)
         self.jira_edit.setText("\n".join(sorted(jiras))) 
\ No newline at end of file
@@ -172,13 +172,7 @@ class VersionInputPage(QWidget):
             
             for branch in branches:
                 logger.debug(f"Processing branch: {branch}")
-                # 메타 저장소 체크아웃
-                for meta_name, _ in recipes:
-                    try:
-                        logger.debug(f"Checking out {meta_name} to {branch}")
-                        self.workspace.checkout_branch(meta_name, branch)
-                    except Exception as e:
-                        logger.warning(f"Failed to checkout {meta_name} to {branch}: {e}")
+                # BB 파일은 origin/<branch> 에서 직접 읽으므로 메타 저장소 체크아웃이 필요 없음
                 
                 # 접을 수 있는 브랜치 그룹 생성 - self 전달
                 box = CollapsibleBox(f"Branch: {branch}", version_page=self)
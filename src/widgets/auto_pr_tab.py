@@ -17,13 +17,21 @@ from widgets.auto_pr_pages.branch_selection_page import BranchSelectionPage
 from widgets.auto_pr_pages.message_input_page import MessageInputPage
 from widgets.auto_pr_pages.selection_page import SelectionPage
 from utils.logger import setup_logger
-from bitbucket.api import BitbucketAPI
+from services.pr_engine import BulkPREngine
+from services.pr_monitor import PRMonitor
+from models.pr_result import PR_CREATED
+import asyncio
 import re
-from git import git
+import concurrent.futures
+from git.push_batcher import PushBatcher
 
 logger = setup_logger(__name__)
 
+MAX_PARALLEL_BRANCHES = 4
+
 class AutoPRTab(QWidget):
+    branch_processed = pyqtSignal(int, int)  # 완료한 대상 브랜치 수, 전체 수 (작업 스레드에서 발생)
+    
     def __init__(self, parent=None):
         super().__init__(parent)
         self.repo_config = RepoConfig.get_instance()
@@ -47,6 +55,11 @@ class AutoPRTab(QWidget):
         self.stack.addWidget(self.version_page)
         self.stack.addWidget(self.message_page)
         
+        # 진행 상태 표시 (PR 생성 중에만 보임)
+        self.progress_bar = QProgressBar()
+        self.progress_bar.hide()
+        self.branch_processed.connect(self.on_branch_progress)
+        
         # 네비게이션 버튼
         nav_layout = QHBoxLayout()
         
@@ -62,12 +75,18 @@ class AutoPRTab(QWidget):
         nav_layout.addWidget(self.next_btn)
         
         layout.addWidget(self.stack)
+        layout.addWidget(self.progress_bar)
         layout.addLayout(nav_layout)
         
     def next_page(self):
         current = self.stack.currentIndex()
         logger.debug(f"Moving to next page from index {current}")
         
+        if current == self.stack.count() - 1:  # MessageInputPage: "Create PRs"
+            if self.validate_current_page():
+                self.create_pull_requests()
+            return
+        
         if current < self.stack.count() - 1:
             if self.validate_current_page():
                 if current == 0:  # SelectionPage -> VersionInputPage
@@ -76,51 +95,87 @@ class AutoPRTab(QWidget):
                     logger.info(f"Moving to version input with {len(selected_recipes)} recipes and {len(selected_branches)} branches")
                     self.version_page.update_recipes(selected_recipes, selected_branches)
                 elif current == 1:  # VersionInputPage -> MessageInputPage
-                    # 버전 정보 가져오기
+                    # fetch 와 버전 조회는 git 실행기에서 하고, 끝나면 다음 페이지로 이동
                     version_info = self.version_page.get_version_info()
-                    
-                    # 각 브랜치별로 자동 메시지 생성
-                    for target_branch, recipes in version_info.items():
-                        updated_recipes = []
-                        
-                        # 먼저 모든 레시피 저장소를 최신으로 업데이트
-                        workspace = WorkspaceManager.get_instance()
-                        for (meta_name, recipe_name), (new_version, new_branch) in recipes.items():
-                            try:
-                                # 레시피 저장소 업데이트
-                                workspace.checkout_branch(recipe_name, new_branch)
-                                git.git_pull(workspace.active_repositories[recipe_name])
-                                
-                                # 메타 저장소 업데이트
-                                workspace.checkout_branch(meta_name, target_branch)
-                                git.git_pull(workspace.active_repositories[meta_name])
-                                
-                                # 현재 버전 정보 가져오기
-                                current_info = workspace.get_recipe_info(meta_name, recipe_name, target_branch)
-                                
-                                updated_recipes.append({
-                                    'name': recipe_name,
-                                    'old_version': current_info['CCOS_VERSION'],
-                                    'new_version': new_version,
-                                    'old_branch': current_info['CCOS_GIT_BRANCH_NAME'],
-                                    'new_branch': new_branch
-                                })
-                            except Exception as e:
-                                logger.error(f"Failed to update repository {recipe_name}: {e}")
-                                QMessageBox.critical(self, "Error", 
-                                    f"Failed to update repository {recipe_name}: {str(e)}")
-                                return
-                            
-                        # 자동 메시지 생성
-                        self.message_page.set_auto_generated_message(
-                            updated_recipes,
-                            workspace
-                        )
+                    self.next_btn.setEnabled(False)
+                    self.workspace.run_task(
+                        self.load_updated_recipes(version_info),
+                        on_finished=lambda updated: self.on_updated_recipes_loaded(current, updated),
+                        on_error=self.on_updated_recipes_error
+                    )
+                    return
+                
+                self.show_page(current + 1)
                 
-                self.stack.setCurrentIndex(current + 1)
-                self.prev_btn.setEnabled(True)
-                if current + 1 == self.stack.count() - 1:
-                    self.next_btn.setText("Create PRs")
+    def show_page(self, index: int):
+        self.stack.setCurrentIndex(index)
+        self.prev_btn.setEnabled(index > 0)
+        if index == self.stack.count() - 1:
+            self.next_btn.setText("Create PRs")
+            
+    async def load_updated_recipes(self, version_info: dict) -> Dict[str, list]:
+        """대상 브랜치별 레시피 변경 정보(이전/새 버전과 브랜치)를 구합니다. (git 실행기에서 실행)
+        
+        레시피 저장소는 새 브랜치로 체크아웃하고, 메타 저장소는 대상 브랜치만 fetch 합니다.
+        (TTL 안에 fetch 했으면 생략)
+        """
+        workspace = self.workspace
+        recipe_branches = {}
+        meta_branches = set()
+        for target_branch, recipes in version_info.items():
+            for (meta_name, recipe_name), (new_version, new_branch) in recipes.items():
+                recipe_branches[(recipe_name, new_branch)] = None
+                meta_branches.add((meta_name, target_branch))
+                
+        async def prepare(repo_name, coro):
+            try:
+                await coro
+            except Exception as e:
+                raise Exception(f"Failed to update repository {repo_name}: {e}") from e
+                
+        await asyncio.gather(
+            *(prepare(recipe_name, workspace.checkout_branch_async(recipe_name, new_branch))
+              for recipe_name, new_branch in recipe_branches),
+            *(prepare(meta_name, workspace.fetch_repository_async(meta_name, [target_branch]))
+              for meta_name, target_branch in meta_branches)
+        )
+        
+        updated = {}
+        for target_branch, recipes in version_info.items():
+            updated_recipes = []
+            for (meta_name, recipe_name), (new_version, new_branch) in recipes.items():
+                # 현재 버전 정보 (BB 파일은 origin/<branch> 에서 읽음)
+                current_info = await workspace.get_recipe_info_async(meta_name, recipe_name, target_branch)
+                updated_recipes.append({
+                    'name': recipe_name,
+                    'old_version': current_info['CCOS_VERSION'],
+                    'new_version': new_version,
+                    'old_branch': current_info['CCOS_GIT_BRANCH_NAME'],
+                    'new_branch': new_branch
+                })
+            updated[target_branch] = updated_recipes
+            
+        # 메시지 페이지가 GUI 스레드에서 읽을 커밋 레코드를 미리 조회해 RangeCache 에 채움
+        await workspace.get_commit_records_async([
+            (recipe['name'], recipe['old_version'], recipe['new_version'])
+            for updated_recipes in updated.values() for recipe in updated_recipes
+        ])
+        return updated
+        
+    def on_updated_recipes_loaded(self, current: int, updated: Dict[str, list]):
+        self.next_btn.setEnabled(True)
+        if self.stack.currentIndex() != current:
+            return
+        
+        # 각 브랜치별로 자동 메시지 생성
+        for target_branch, updated_recipes in updated.items():
+            self.message_page.set_auto_generated_message(updated_recipes, self.workspace)
+        self.show_page(current + 1)
+        
+    def on_updated_recipes_error(self, error: Exception):
+        self.next_btn.setEnabled(True)
+        logger.error(f"Failed to prepare repositories: {error}")
+        QMessageBox.critical(self, "Error", str(error))
                 
     def prev_page(self):
         current = self.stack.currentIndex()
@@ -176,7 +231,11 @@ class AutoPRTab(QWidget):
         self.version_inputs_layout.addStretch()
         
     def create_pull_requests(self):
-        """PR 생성 처리"""
+        """PR 생성 처리
+        
+        BB 파일 수정, push, PR 생성은 git 실행기의 작업 스레드에서 진행하고
+        진행 상황과 결과는 시그널로 받아 GUI 스레드에서 표시합니다.
+        """
         version_info = self.version_page.get_version_info()
         user_message = self.message_page.get_message()
         
@@ -192,117 +251,195 @@ class AutoPRTab(QWidget):
         logger.debug(f"Version info: {version_info}")
         
         # 진행 상태 표시
-        self.progress_bar.show()
-        self.progress_bar.setMaximum(len(version_info))  # 브랜치 수만큼 설정
-        self.progress_bar.setValue(0)
+        self.set_busy(True)
+        self.on_branch_progress(0, len(version_info))
+        
+        engine = BulkPREngine()
+        engine.progress.connect(self.on_pr_progress)
+        self.workspace.run_task(
+            self.workspace.git_runner.call(self.run_pr_pipeline, version_info, user_message, engine),
+            on_finished=self.on_pull_requests_created,
+            on_error=self.on_pull_requests_failed
+        )
+        
+    def run_pr_pipeline(self, version_info: dict, user_message: dict, engine: BulkPREngine) -> list:
+        """대상 브랜치별 커밋, atomic push, PR 생성 (작업 스레드에서 실행)
         
-        try:
-            workspace = WorkspaceManager.get_instance()
-            bitbucket = BitbucketAPI.get_instance()
+        대상 브랜치마다 별도의 worktree 에서 작업하므로 브랜치들을 병렬로 처리합니다.
+        PRResult 목록을 반환합니다.
+        """
+        # 브랜치별 커밋은 push 하지 않고 모아서 메타 저장소마다 한 번의 atomic push 로 보냄
+        workspace = WorkspaceManager.get_instance()
+        batch = PushBatcher()
+        pr_requests = []
+        errors = []
+        total = len(version_info)
+        
+        with concurrent.futures.ThreadPoolExecutor(max_workers=MAX_PARALLEL_BRANCHES) as executor:
+            futures = {
+                executor.submit(self.process_target_branch, target_branch, recipes, user_message, batch): target_branch
+                for target_branch, recipes in version_info.items()
+            }
             
-            for target_branch, recipes in version_info.items():
-                logger.info(f"Processing target branch: {target_branch}")
+            for done, future in enumerate(concurrent.futures.as_completed(futures), 1):
+                target_branch = futures[future]
+                try:
+                    pr_requests.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error creating PRs for {target_branch}: {e}")
+                    errors.append(f"{target_branch}: {e}")
+                self.branch_processed.emit(done, total)
                 
-                # 메타 저장소별로 그룹화
-                meta_groups = {}
-                for (meta_name, recipe_name), (version, branch) in recipes.items():
-                    if meta_name not in meta_groups:
-                        meta_groups[meta_name] = []
-                    meta_groups[meta_name].append({
-                        'recipe_name': recipe_name,
-                        'version': version,
-                        'branch': branch
-                    })
+        # 한 브랜치라도 실패하면 아무것도 push 하지 않음
+        if errors:
+            raise Exception("\n".join(errors))
+            
+        report = workspace.push_batch(batch)
+        failures = PushBatcher.failures(report)
+        if failures:
+            raise Exception("Push failed:\n" + "\n".join(failures))
+            
+        # PR 생성 (같은 source/destination 의 열린 PR 이 있으면 갱신)
+        return engine.run(pr_requests)
+        
+    def set_busy(self, busy: bool):
+        self.progress_bar.setVisible(busy)
+        self.next_btn.setEnabled(not busy)
+        self.prev_btn.setEnabled(not busy and self.stack.currentIndex() > 0)
+        
+    def on_branch_progress(self, done: int, total: int):
+        self.progress_bar.setFormat("Updating branches %v/%m")
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+            
+    def on_pr_progress(self, done: int, total: int):
+        self.progress_bar.setFormat("Creating pull requests %v/%m")
+        self.progress_bar.setMaximum(total)
+        self.progress_bar.setValue(done)
+        
+    def on_pull_requests_created(self, results: list):
+        self.set_busy(False)
+        PRMonitor.get_instance().notify_local_change()
+        
+        failed = [str(result) for result in results if not result.ok]
+        if failed:
+            self.on_pull_requests_failed(Exception("Some pull requests failed:\n" + "\n".join(failed)))
+            return
+            
+        created = sum(1 for result in results if result.action == PR_CREATED)
+        QMessageBox.information(
+            self, "Success",
+            f"Pull requests created successfully! ({created} created, {len(results) - created} updated)"
+        )
+        
+    def on_pull_requests_failed(self, error: Exception):
+        self.set_busy(False)
+        logger.error(f"Error creating PRs: {error}")
+        QMessageBox.critical(self, "Error", f"Failed to create pull requests: {str(error)}")
+            
+    def process_target_branch(self, target_branch: str, recipes: dict, user_message: dict,
+                              batch: PushBatcher) -> list:
+        """대상 브랜치 하나의 BB 파일 업데이트와 커밋 (작업 스레드에서 실행)
+
+        커밋은 batch 에 추가되며, push 후 생성할 PR 데이터 목록을 반환합니다.
+        """
+        logger.info(f"Processing target branch: {target_branch}")
+        workspace = WorkspaceManager.get_instance()
+        pr_requests = []
+        
+        # 메타 저장소별로 그룹화
+        meta_groups = {}
+        for (meta_name, recipe_name), (version, branch) in recipes.items():
+            if meta_name not in meta_groups:
+                meta_groups[meta_name] = []
+            meta_groups[meta_name].append({
+                'recipe_name': recipe_name,
+                'version': version,
+                'branch': branch
+            })
+        
+        # 각 메타 저장소에 대해 PR 생성
+        for meta_name, recipe_updates in meta_groups.items():
+            logger.info(f"Creating PR for meta repo: {meta_name}")
+            
+            # 대상 브랜치 전용 worktree 준비 (메인 워킹 트리는 체크아웃하지 않음)
+            workspace.acquire_worktree(meta_name, target_branch)
+            try:
+                # 레시피 저장소의 태그 해시를 먼저 모두 구함
+                for update in recipe_updates:
+                    tags = workspace.get_tag_hash_by_branch(update['recipe_name'], update['branch'])
+                    if update['version'] not in tags:
+                        raise Exception(f"Version {update['version']} not found in {update['recipe_name']} tags")
+                    update['tag'] = tags[update['version']]
                 
-                # 각 메타 저장소에 대해 PR 생성
-                for meta_name, recipe_updates in meta_groups.items():
-                    logger.info(f"Creating PR for meta repo: {meta_name}")
-                    
-                    # 메타 저장소 체크아웃
-                    workspace.checkout_branch(meta_name, target_branch)
-                    
-                    # BB 파일 업데이트
-                    updated_recipes = []
-                    for update in recipe_updates:
-                        recipe_name = update['recipe_name']
-                        version = update['version']
-                        branch = update['branch']
-                        
-                        # 레시피 저장소의 태그 해시 가져오기
-                        tags = workspace.get_tag_hash_by_branch(recipe_name, branch)
-                        if version not in tags:
-                            raise Exception(f"Version {version} not found in {recipe_name} tags")
-                        
-                        # BB 파일 업데이트
-                        workspace.update_bb_file(meta_name, f"{recipe_name}.bb", {
-                            'version': version,
-                            'branch': branch,
-                            'tag': tags[version]
-                        })
-                        
-                        # 업데이트된 레시피 정보 저장
-                        updated_recipes.append({
-                            'name': recipe_name,
-                            'old_version': workspace.get_recipe_info(meta_name, recipe_name, target_branch)['CCOS_VERSION'],
-                            'new_version': version,
-                            'old_branch': workspace.get_recipe_info(meta_name, recipe_name, target_branch)['CCOS_GIT_BRANCH_NAME'],
-                            'new_branch': branch
-                        })
-                    
-                    # 자동 커밋 메시지 생성
-                    commit_message = self.generate_commit_message(
-                        meta_name, 
-                        target_branch, 
-                        updated_recipes,
-                        user_message
-                    )
+                # 파일을 고치기 전에 사용할 태그가 원격에 같은 커밋으로 올라가 있는지 확인 (원격당 ls-remote 1회)
+                problems = workspace.validate_remote_tags(
+                    (update['recipe_name'], update['version'], update['tag']) for update in recipe_updates
+                )
+                if problems:
+                    raise Exception("Remote tag check failed:\n" + "\n".join(problems))
+                
+                # BB 파일 업데이트
+                updated_recipes = []
+                for update in recipe_updates:
+                    recipe_name = update['recipe_name']
+                    version = update['version']
+                    branch = update['branch']
                     
-                    workspace.update_changes(meta_name, commit_message)
+                    # 변경 전 정보 (origin/<target_branch> 기준)
+                    current_info = workspace.get_recipe_info(meta_name, recipe_name, target_branch)
                     
-                    # PR 생성
-                    pr_data = {
-                        'title': f"Update CCOS versions for {target_branch}",
-                        'description': commit_message,
-                        'source': {
-                            'branch': target_branch,
-                            'repository': meta_name
-                        },
-                        'destination': {
-                            'branch': target_branch
-                        }
-                    }
+                    workspace.update_bb_file(meta_name, f"{recipe_name}.bb", {
+                        'version': version,
+                        'branch': branch,
+                        'tag': update['tag']
+                    }, branch_name=target_branch)
                     
-                    bitbucket.create_pull_request(pr_data)
+                    # 업데이트된 레시피 정보 저장
+                    updated_recipes.append({
+                        'name': recipe_name,
+                        'old_version': current_info['CCOS_VERSION'],
+                        'new_version': version,
+                        'old_branch': current_info['CCOS_GIT_BRANCH_NAME'],
+                        'new_branch': branch
+                    })
                 
-                self.progress_bar.setValue(self.progress_bar.value() + 1)
+                # 자동 커밋 메시지 생성
+                commit_message = self.generate_commit_message(
+                    meta_name, 
+                    target_branch, 
+                    updated_recipes,
+                    user_message
+                )
                 
-            QMessageBox.information(self, "Success", "Pull requests created successfully!")
+                workspace.update_changes(meta_name, commit_message, branch_name=target_branch, batch=batch)
+                
+            finally:
+                workspace.release_worktree(meta_name, target_branch)
             
-        except Exception as e:
-            logger.error(f"Error creating PRs: {e}")
-            QMessageBox.critical(self, "Error", f"Failed to create pull requests: {str(e)}")
+            # PR 데이터 (push 성공 후 생성)
+            pr_requests.append({
+                'title': f"Update CCOS versions for {target_branch}",
+                'description': commit_message,
+                'source': {
+                    'branch': target_branch,
+                    'repository': meta_name
+                },
+                'destination': {
+                    'branch': target_branch
+                }
+            })
             
-        finally:
-            self.progress_bar.hide()
+        return pr_requests
             
     def generate_commit_message(self, meta_name: str, target_branch: str, 
                               updated_recipes: list, user_message: dict) -> str:
         """커밋 메시지를 자동으로 생성합니다."""
         workspace = WorkspaceManager.get_instance()
         
-        # 각 레시피의 커밋 메시지 수집
-        all_commit_messages = []
-        for recipe in updated_recipes:
-            try:
-                # 이전 버전과 새 버전 사이의 커밋 메시지 가져오기
-                commits = workspace.get_commit_messages_between_tags(
-                    recipe['name'],
-                    recipe['old_version'],
-                    recipe['new_version']
-                )
-                all_commit_messages.extend(commits)
-            except Exception as e:
-                logger.warning(f"Failed to get commit messages for {recipe['name']}: {e}")
+        # 각 레시피의 커밋 레코드를 한 번에 수집
+        ranges = [(recipe['name'], recipe['old_version'], recipe['new_version']) for recipe in updated_recipes]
+        records = workspace.get_commit_records(ranges)
         
         # 커밋 메시지 분석
         description = []
@@ -310,20 +447,20 @@ class AutoPRTab(QWidget):
         countermeasures = []
         jiras = set()
         
-        for commit in all_commit_messages:
-            # 커밋 메시지 파싱
-            parsed = workspace.parse_commit_message(commit)
-            
-            if parsed.get('description'):
-                description.append(parsed['description'])
-            if parsed.get('cause'):
-                causes.append(parsed['cause'])
-            if parsed.get('countermeasure'):
-                countermeasures.append(parsed['countermeasure'])
+        for commit_range in ranges:
+            for record in records.get(commit_range, []):
+                # 커밋 레코드 파싱
+                parsed = workspace.parse_commit_record(record)
                 
-            # Jira 번호 추출
-            if parsed.get('jira'):
-                jiras.update(re.findall(r'(?:[A-Z][A-Z0-9]*-\d+)', parsed['jira']))
+                if parsed.get('description'):
+                    description.append(parsed['description'])
+                if parsed.get('cause'):
+                    causes.append(parsed['cause'])
+                if parsed.get('countermeasure'):
+                    countermeasures.append(parsed['countermeasure'])
+                    
+                # Jira 번호
+                jiras.update(record.jira_keys)
         
         # 메시지 생성
         message = f"Update CCOS versions for {target_branch}\n\n"
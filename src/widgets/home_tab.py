@@ -1,16 +1,20 @@
-from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
-                           QPushButton, QLabel, QScrollArea,
-                           QFrame, QListWidget, QListWidgetItem, QDialog)
-from PyQt6.QtCore import Qt, QTimer, QSize
-from PyQt6.QtGui import QColor, QFont, QIcon
-from datetime import datetime
-from bitbucket.api import BitbucketAPI
-from bitbucket.utils import parse_info_from_diff
+from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
+                           QPushButton, QLabel,
+                           QFrame, QListWidget, QListWidgetItem, QDialog, QMessageBox)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
+from PyQt6 import sip
+from bitbucket.pr_inspector import PRInspector
 from dialogs.edit_version_dialog import EditVersionDialog
+from services.pr_monitor import PRMonitor
 from workspace.manager import WorkspaceManager
-from git import git
+from models.pull_request import PullRequest
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
 class PRItemWidget(QFrame):
-    def __init__(self, pr_data, parent=None):
+    def __init__(self, pr_data: PullRequest, parent=None):
         super().__init__(parent)
         self.pr_data = pr_data
         self.setObjectName("PRItem")  # 테마 스타일 적용을 위한 객체 이름
@@ -22,68 +26,90 @@ class PRItemWidget(QFrame):
         layout.setContentsMargins(12, 8, 12, 8)
         
         # Title
-        title = QLabel(f"Title: {self.pr_data['title']}")
+        title = QLabel(f"Title: {self.pr_data.title}")
         title.setProperty("class", "title")  # 테마 스타일 적용
         title.setWordWrap(False)
         title.setMaximumWidth(600)
         
         # Branch info
-        branch_label = QLabel(f"→ {self.pr_data['destination']['branch']['name']}")
+        branch_label = QLabel(f"→ {self.pr_data.destination.branch}")
         branch_label.setProperty("class", "branch")  # 테마 스타일 적용
         
         # Repository badge
-        repo_name = self.pr_data['source']['repository']['name']
+        repo_name = self.pr_data.source.repository
         repo_label = QLabel(repo_name)
         repo_label.setProperty("class", "repo")  # 테마 스타일 적용
         
         # Status badge
-        status = self.pr_data['state']
+        status = self.pr_data.state
         status_label = QLabel(status)
         status_label.setProperty("class", f"status-{status.lower()}")  # 테마 스타일 적용
         
         # Edit button
-        edit_btn = QPushButton("Edit")
-        edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        edit_btn.clicked.connect(self.on_edit_clicked)
+        self.edit_btn = QPushButton("Edit")
+        self.edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.edit_btn.clicked.connect(self.on_edit_clicked)
         
         layout.addWidget(title)
         layout.addWidget(branch_label)
         layout.addWidget(repo_label)
         layout.addWidget(status_label)
-        layout.addWidget(edit_btn)
+        layout.addWidget(self.edit_btn)
 
     def on_edit_clicked(self):
-        diff_url = self.pr_data.get('links', {}).get('diff', {}).get('href')
-        source_branch = self.pr_data['source']['branch']['name']
-        repo_name = self.pr_data['source']['repository']['name']
-        
-        bitbucket = BitbucketAPI.get_instance()
-        diff_info = parse_info_from_diff(bitbucket.get(diff_url))
-        
+        # diffstat 으로 레시피 파일만 골라 경로별 diff 를 받음 (source 커밋별로 캐시)
+        # 네트워크 요청이므로 git 실행기에서 수행하고 결과를 받으면 편집 창을 엶
+        self.edit_btn.setEnabled(False)
+        self.edit_btn.setText("Loading...")
+        workspace = WorkspaceManager.get_instance()
+        workspace.run_task(
+            workspace.git_runner.call(PRInspector.get_instance().inspect, self.pr_data),
+            on_finished=self.on_diff_info_loaded,
+            on_error=self.on_diff_info_error
+        )
+
+    def reset_edit_button(self):
+        self.edit_btn.setEnabled(True)
+        self.edit_btn.setText("Edit")
+
+    def on_diff_info_error(self, error):
+        if sip.isdeleted(self):
+            return
+        self.reset_edit_button()
+        logger.error(f"Failed to load PR diff for {self.pr_data!r}: {error}")
+        QMessageBox.warning(self, "Error", f"Failed to load pull request changes: {error}")
+
+    def on_diff_info_loaded(self, diff_info):
+        # 받는 동안 PR 이 갱신되어 항목 위젯이 교체되었으면 열지 않음 (새 항목에서 다시 편집)
+        if sip.isdeleted(self):
+            return
+        self.reset_edit_button()
+        source_branch = self.pr_data.source.branch
+        repo_name = self.pr_data.source.repository
+
+        # 체크아웃, BB 파일 수정, 원격 태그 확인, 커밋과 push 는 EditVersionDialog 가 처리
         dialog = EditVersionDialog(diff_info, self.pr_data, self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
-            updated_versions = dialog.get_updated_versions()
-            updated_branch = dialog.get_updated_branch()
-            
-            # 브랜치 변경이 있는 경우
-            if updated_branch != source_branch:
-                WorkspaceManager.get_instance().checkout_branch(repo_name, updated_branch)
-            
-            # 버전 업데이트
-            tag_hash = git.get_remote_tag_hash(repo_name, updated_versions)
-            WorkspaceManager.get_instance().update_bb_file(repo_name, "audiostreamingmanager.bb", updated_versions)
+            PRInspector.get_instance().invalidate(repo_name)
+            PRMonitor.get_instance().notify_local_change()
+            logger.info(f"Updated {repo_name} PR from {source_branch} "
+                        f"({len(dialog.get_updated_versions())} recipes changed)")
 
 
 
 class HomeTab(QWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
+        self.items = {}  # PullRequest.key (저장소, PR id) -> QListWidgetItem
         self.setup_ui()
-        self.load_prs()
         
-        self.timer = QTimer(self)
-        self.timer.timeout.connect(self.load_prs)
-        self.timer.start(5 * 60 * 1000)
+        # 주기적으로 전체 목록을 다시 받지 않고 PRMonitor 의 변경 시그널만 반영
+        self.monitor = PRMonitor.get_instance()
+        self.monitor.prs_added.connect(self.add_prs)
+        self.monitor.prs_updated.connect(self.update_prs)
+        self.monitor.prs_closed.connect(self.remove_prs)
+        self.monitor.prs_removed.connect(self.remove_prs)
+        self.monitor.poll_failed.connect(self.on_load_error)
 
     def setup_ui(self):
         layout = QVBoxLayout(self)
@@ -153,17 +179,35 @@ class HomeTab(QWidget):
         layout.addWidget(self.pr_list)
 
     def load_prs(self):
-        try:
-            self.pr_list.clear()
-            bitbucket = BitbucketAPI.get_instance()
-            prs = bitbucket.get_pull_requests_meta()
-            
-            for pr in prs:
-                item = QListWidgetItem(self.pr_list)
-                widget = PRItemWidget(pr)
-                item.setSizeHint(widget.sizeHint())
-                self.pr_list.addItem(item)
-                self.pr_list.setItemWidget(item, widget)
-                
-        except Exception as e:
-            print(f"Error loading PRs: {e}") 
\ No newline at end of file
+        self.monitor.refresh()
+
+    def add_prs(self, prs):
+        """새 PR 을 목록 끝에 추가합니다."""
+        for pr in prs:
+            item = QListWidgetItem(self.pr_list)
+            widget = PRItemWidget(pr)
+            item.setSizeHint(widget.sizeHint())
+            self.pr_list.addItem(item)
+            self.pr_list.setItemWidget(item, widget)
+            self.items[pr.key] = item
+
+    def update_prs(self, prs):
+        """바뀐 PR 의 항목 위젯을 새로 만듭니다."""
+        for pr in prs:
+            item = self.items.get(pr.key)
+            if item is None:
+                self.add_prs([pr])
+                continue
+            widget = PRItemWidget(pr)
+            item.setSizeHint(widget.sizeHint())
+            self.pr_list.setItemWidget(item, widget)
+
+    def remove_prs(self, prs):
+        """병합/거절되었거나 사라진 PR 을 목록에서 뺍니다."""
+        for pr in prs:
+            item = self.items.pop(pr.key, None)
+            if item is not None:
+                self.pr_list.takeItem(self.pr_list.row(item))
+
+    def on_load_error(self, message):
+        logger.error(f"Error loading PRs: {message}")
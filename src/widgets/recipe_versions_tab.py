@@ -2,12 +2,11 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QTableWidget,
                            QTableWidgetItem, QHeaderView, QComboBox,
                            QHBoxLayout, QLabel, QPushButton, QProgressBar,
                            QFrame, QStyle)
-from PyQt6.QtCore import Qt, pyqtSignal, QEventLoop
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QColor, QFont, QIcon
 from config.repo_config import RepoConfig
 from config.branch_config import BranchManager
 from workspace.manager import WorkspaceManager
-import concurrent.futures
 from utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -92,72 +91,31 @@ class RecipeVersionsTab(QWidget):
         """브랜치 선택 시 버전 정보 업데이트"""
         self.load_versions(branch_name)
         
-    def wait_for_checkout(self, repo_name: str, branch_name: str) -> bool:
-        """체크아웃이 완료될 때까지 대기"""
-        loop = QEventLoop()
-        success = True
-        
-        def on_finished(finished_repo, finished_branch):
-            if finished_repo == repo_name and finished_branch == branch_name:
-                loop.quit()
-                
-        def on_error(error_msg):
-            nonlocal success
-            success = False
-            print(f"Checkout error: {error_msg}")
-            loop.quit()
-            
-        # 시그널 연결
-        self.workspace.checkout_finished.connect(on_finished)
-        self.workspace.operation_error.connect(on_error)
-        
-        # 체크아웃 시작
-        self.workspace.checkout_branch(repo_name, branch_name)
-        
-        # 완료될 때까지 대기
-        loop.exec()
-        
-        # 시그널 연결 해제
-        self.workspace.checkout_finished.disconnect(on_finished)
-        self.workspace.operation_error.disconnect(on_error)
-        
-        return success
-        
     def update_progress(self, value, max_value):
         """진행 상태 업데이트"""
         self.progress_bar.setMaximum(max_value)
         self.progress_bar.setValue(value)
         
     def load_versions(self, branch_name):
-        """선택된 브랜치의 레시피 버전 정보 로드"""
+        """선택된 브랜치의 레시피 버전 정보 로드
+
+        BB 파일은 origin/<branch> 에서 직접 읽으므로 메타 저장소를 체크아웃하지 않습니다.
+        """
         logger.info("Loading recipe versions")
         self.version_table.setRowCount(0)
         self.progress_bar.show()
         
         try:
-            # 메타 저장소 체크아웃 (병렬 처리)
             total_repos = len(self.repo_config.meta_repos)
             self.update_progress(0, total_repos)
             
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                futures = []
-                for meta_repo in self.repo_config.meta_repos:
-                    future = executor.submit(
-                        self.wait_for_checkout,
-                        meta_repo.name,
-                        branch_name
-                    )
-                    futures.append((meta_repo, future))
-                
-                # 체크아웃 완료 대기 및 결과 처리
-                for idx, (meta_repo, future) in enumerate(futures):
-                    try:
-                        if future.result():
-                            self.load_meta_repo_recipes(meta_repo, branch_name)
-                    except Exception as e:
-                        print(f"Error processing {meta_repo.name}: {e}")
-                    finally:
-                        self.update_progress(idx + 1, total_repos)
+            for idx, meta_repo in enumerate(self.repo_config.meta_repos):
+                try:
+                    self.load_meta_repo_recipes(meta_repo, branch_name)
+                except Exception as e:
+                    print(f"Error processing {meta_repo.name}: {e}")
+                finally:
+                    self.update_progress(idx + 1, total_repos)
                         
         finally:
             self.progress_bar.hide()
@@ -0,0 +1,128 @@
+import subprocess
+import threading
+import time
+from concurrent.futures import Future
+from typing import Dict, Iterable, List, Set
+from git import git
+from config.branch_config import BranchManager
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEFAULT_FETCH_TTL = 300  # 초
+
+class FetchCoordinator:
+    """저장소별 fetch 를 조율합니다.
+
+    - 마지막 fetch 후 TTL 이 지나지 않았으면 fetch 를 생략합니다.
+    - 같은 저장소에 대한 동시 요청은 진행 중인 fetch 하나를 공유합니다.
+    - BranchManager 에 설정된 브랜치와 version/* 태그만 한 번에 fetch 합니다.
+    - 원격에 없는 브랜치는 TTL 동안만 제외하고, 그 뒤(또는 invalidate / force)에 다시 시도합니다.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_FETCH_TTL):
+        self.ttl_seconds = ttl_seconds
+        self.last_fetched: Dict[str, float] = {}       # repo_path -> 마지막 fetch 시각
+        self.fetched_branches: Dict[str, Set[str]] = {}  # repo_path -> fetch 한 브랜치
+        self.missing_branches: Dict[str, Dict[str, float]] = {}  # repo_path -> {원격에 없던 브랜치: 확인 시각}
+        self.in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def build_refspecs(self, branches: Iterable[str]) -> List[str]:
+        """브랜치와 version/* 태그를 위한 refspec 목록을 만듭니다."""
+        refspecs = [f"+refs/heads/{branch}:refs/remotes/origin/{branch}" for branch in sorted(branches)]
+        refspecs.append("+refs/tags/version/*:refs/tags/version/*")
+        return refspecs
+
+    def _wanted_branches(self, repo_path: str, extra_branches: Iterable[str]) -> Set[str]:
+        branches = {branch.name for branch in BranchManager.get_instance().branches}
+        branches.update(branch for branch in extra_branches if branch)
+        now = time.monotonic()
+        missing = {
+            branch for branch, checked in self.missing_branches.get(repo_path, {}).items()
+            if now - checked <= self.ttl_seconds
+        }
+        return branches - missing
+
+    def _is_fresh(self, repo_path: str, branches: Set[str]) -> bool:
+        last = self.last_fetched.get(repo_path)
+        if last is None or time.monotonic() - last > self.ttl_seconds:
+            return False
+        return branches <= self.fetched_branches.get(repo_path, set())
+
+    def mark_fresh(self, repo_path: str, extra_branches: Iterable[str] = ()):
+        """방금 클론한 저장소처럼 이미 최신인 저장소를 fetch 한 것으로 기록합니다."""
+        with self._lock:
+            self.last_fetched[repo_path] = time.monotonic()
+            self.fetched_branches[repo_path] = self._wanted_branches(repo_path, extra_branches)
+
+    def invalidate(self, repo_path: str = None):
+        """fetch 기록을 지워 다음 요청에서 다시 fetch 하도록 합니다."""
+        with self._lock:
+            if repo_path is None:
+                self.last_fetched.clear()
+                self.missing_branches.clear()
+            else:
+                self.last_fetched.pop(repo_path, None)
+                self.missing_branches.pop(repo_path, None)
+
+    def ensure_fresh(self, repo_path: str, extra_branches: Iterable[str] = (), force: bool = False):
+        """저장소가 TTL 안에 fetch 된 상태가 되도록 합니다."""
+        extra_branches = list(extra_branches)
+        while True:
+            with self._lock:
+                if force:
+                    self.missing_branches.pop(repo_path, None)
+                branches = self._wanted_branches(repo_path, extra_branches)
+                if not force and self._is_fresh(repo_path, branches):
+                    return
+
+                future = self.in_flight.get(repo_path)
+                is_owner = future is None
+                if is_owner:
+                    future = Future()
+                    self.in_flight[repo_path] = future
+
+            if not is_owner:
+                # 진행 중인 fetch 를 기다린 뒤 필요한 브랜치가 포함됐는지 다시 확인
+                future.result()
+                force = False
+                continue
+
+            try:
+                fetched = self._fetch(repo_path, branches)
+            except Exception as e:
+                with self._lock:
+                    self.in_flight.pop(repo_path, None)
+                future.set_exception(e)
+                raise
+
+            with self._lock:
+                self.last_fetched[repo_path] = time.monotonic()
+                self.fetched_branches[repo_path] = fetched
+                self.in_flight.pop(repo_path, None)
+            future.set_result(None)
+            return
+
+    def _fetch(self, repo_path: str, branches: Set[str]) -> Set[str]:
+        logger.info(f"Fetching {sorted(branches)} and version tags in {repo_path}")
+        try:
+            git.git_fetch(repo_path, self.build_refspecs(branches))
+            return branches
+
+        except subprocess.CalledProcessError:
+            # 오류 메시지는 git 의 언어 설정에 따라 달라지므로 원격 브랜치 목록으로 원인을 확인
+            remote_branches = set(git.git_ls_remote_heads(repo_path))
+            missing = branches - remote_branches
+            if not missing:
+                raise
+
+            # 원격에 없는 브랜치는 TTL 동안 제외하고 다시 시도
+            checked = time.monotonic()
+            with self._lock:
+                self.missing_branches.setdefault(repo_path, {}).update(dict.fromkeys(missing, checked))
+            logger.info(f"Skipping branches missing on remote in {repo_path}: {sorted(missing)}")
+
+            available = branches & remote_branches
+            git.git_fetch(repo_path, self.build_refspecs(available))
+            return available
@@ -1,29 +1,64 @@
-from PyQt6.QtCore import QObject, pyqtSignal, QThread
+from PyQt6.QtCore import QObject, pyqtSignal
 import os
 import shutil
+import subprocess
 from git import git
 import re
-from typing import List
+import concurrent.futures
+from datetime import datetime
+from typing import Dict, List, Sequence, Tuple
 from utils.logger import setup_logger  # 절대 경로 사용
+from workspace.ref_index import RefIndex
+from git.backend import get_backend
+from git.diff_stream import DiffPager, iter_diff_hunks, git_diff_stat, DEFAULT_PAGE_BYTES, DEFAULT_PAGE_HUNKS
+from workspace.fetch_coordinator import FetchCoordinator
+from git.async_runner import AsyncGitRunner
+from git.remote_refs import RemoteRefSnapshot
+from git.push_batcher import PushBatcher
+from workspace.worktrees import WorktreeManager
+from models.commit_record import CommitRecord
+from models.file_change import FileChange
+from models.push_result import PushResult
+from workspace.range_cache import RangeCache
 
 logger = setup_logger(__name__)
 
-class GitWorker(QThread):
+class GitTask(QObject):
+    """AsyncGitRunner 에서 실행되는 코루틴의 결과를 Qt 시그널로 전달합니다.
+
+    GUI 스레드에서 생성하면 시그널은 GUI 스레드에서 처리됩니다.
+    """
     finished = pyqtSignal(object)  # 결과를 전달
     error = pyqtSignal(Exception)  # 에러를 전달
     
-    def __init__(self, func, *args, **kwargs):
+    def __init__(self, runner: AsyncGitRunner, coro):
         super().__init__()
-        self.func = func
-        self.args = args
-        self.kwargs = kwargs
+        self.runner = runner
+        self.coro = coro
+        self.future = None
         
-    def run(self):
-        try:
-            result = self.func(*self.args, **self.kwargs)
-            self.finished.emit(result)
-        except Exception as e:
-            self.error.emit(e)
+    def start(self):
+        """시그널을 연결한 뒤 호출해야 결과를 놓치지 않습니다."""
+        self.future = self.runner.submit(self.coro)
+        self.future.add_done_callback(self._on_done)
+        
+    def cancel(self) -> bool:
+        """작업을 취소합니다.
+
+        아직 시작하지 않은 작업은 실행되지 않습니다. 이미 작업 스레드에서 실행 중인
+        동기 git 작업(*_async 변형)은 중단되지 않고 끝까지 실행되며 결과만 버려집니다.
+        """
+        return self.future is not None and self.future.cancel()
+        
+    def _on_done(self, future):
+        if future.cancelled():
+            self.error.emit(Exception("Operation cancelled"))
+            return
+        error = future.exception()
+        if error:
+            self.error.emit(error)
+        else:
+            self.finished.emit(future.result())
 
 class WorkspaceManager(QObject):
     clone_finished = pyqtSignal(str)  # repo_path
@@ -46,88 +81,233 @@ class WorkspaceManager(QObject):
         os.makedirs(self.workspace_dir, exist_ok=True)
         WorkspaceManager._instance = self
         self.active_repositories = {}
-        self.workers = []  # Keep track of workers to prevent garbage collection
+        self.ref_indexes = {}  # repo_path -> RefIndex
+        self.blob_readers = {}  # repo_path -> (백엔드 이름, blob 읽기 객체)
+        self.tree_files = {}  # (repo_path, commit) -> {파일 이름: 경로}
+        self.fetcher = FetchCoordinator()
+        self.git_runner = AsyncGitRunner()
+        self.worktrees = WorktreeManager()
+        self.range_cache = RangeCache()
+        self.remote_urls = {}  # repo_path -> origin URL
+        self.tasks = []  # Keep track of tasks to prevent garbage collection
     
+    def _repo_name_from_url(self, repo_url, folder_name=None):
+        if folder_name:
+            return folder_name
+        return repo_url.split('/')[-1].replace('.git', '')
+
     def _clone_repository_sync(self, repo_url, branch_name, folder_name=None):
         """동기 방식의 저장소 클론 (내부 사용)"""
-        if folder_name:
-            repo_name = folder_name
-        else:
-            repo_name = repo_url.split('/')[-1].replace('.git', '')
-            
+        repo_name = self._repo_name_from_url(repo_url, folder_name)
         repo_path = os.path.join(self.workspace_dir, repo_name)
         
-        try:
-            if repo_name in self.active_repositories:
-                repo_path = self.active_repositories[repo_name]
-                if os.path.exists(repo_path):
-                    git.git_checkout(repo_path, branch_name)
-                    git.git_pull(repo_path)
+        with self.git_runner.repo_lock(repo_path):
+            try:
+                if repo_name in self.active_repositories:
+                    repo_path = self.active_repositories[repo_name]
+                    if os.path.exists(repo_path):
+                        return self._checkout_branch_sync(repo_name, branch_name)
+            
+                # 이전 실행에서 만든 클론이 있으면 검증 후 재사용
+                if os.path.exists(repo_path) and self._adopt_existing_clone(repo_name, repo_path, repo_url, branch_name):
                     return repo_path
             
-            if os.path.exists(repo_path):
-                shutil.rmtree(repo_path)
+                if os.path.exists(repo_path):
+                    shutil.rmtree(repo_path)
+                self._release_repository_state(repo_path)
             
-            # 상위 디렉토리에 클론
-            git.git_clone(repo_url, branch_name, self.workspace_dir, folder_name)
-            self.active_repositories[repo_name] = repo_path
-            return repo_path
+                # 상위 디렉토리에 클론
+                git.git_clone(repo_url, branch_name, self.workspace_dir, folder_name)
+                self.active_repositories[repo_name] = repo_path
+                self.fetcher.mark_fresh(repo_path, [branch_name])
+                return repo_path
             
+            except Exception as e:
+                if os.path.exists(repo_path):
+                    shutil.rmtree(repo_path)
+                self._release_repository_state(repo_path)
+                if repo_name in self.active_repositories:
+                    del self.active_repositories[repo_name]
+                raise
+    
+    def _normalize_url(self, url: str) -> str:
+        url = url.strip().rstrip('/')
+        return url[:-len('.git')] if url.endswith('.git') else url
+
+    def _is_reusable_clone(self, repo_path: str, repo_url: str) -> bool:
+        """디스크에 있는 클론이 같은 원격을 가리키는 정상 저장소인지 확인합니다."""
+        try:
+            if os.path.realpath(git.git_toplevel(repo_path)) != os.path.realpath(repo_path):
+                logger.info(f"{repo_path} is not the top level of a repository")
+                return False
+
+            remote_url = git.git_remote_url(repo_path)
+            if self._normalize_url(remote_url) != self._normalize_url(repo_url):
+                logger.info(f"Remote URL mismatch in {repo_path}: {remote_url} != {repo_url}")
+                return False
+
+            git.git_verify_commit(repo_path, "HEAD")
+            return True
+
         except Exception as e:
-            if os.path.exists(repo_path):
-                shutil.rmtree(repo_path)
-            if repo_name in self.active_repositories:
-                del self.active_repositories[repo_name]
-            raise
+            logger.info(f"Existing clone at {repo_path} is not reusable: {e}")
+            return False
+
+    def _preserve_local_work(self, repo_path, branch_name):
+        """초기화하면 사라질 작업을 보관합니다.
+
+        커밋하지 않은 변경(추적하지 않는 파일 포함)은 stash 에, 원격에 없는 커밋은
+        backup/<브랜치>-<시각> 브랜치에 남깁니다.
+        """
+        stamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        changes = git.git_status_porcelain(repo_path)
+        if changes:
+            message = f"bitbucket-monitor: local changes before reuse {stamp}"
+            git.git_stash_push(repo_path, message)
+            logger.warning(f"Stashed {len(changes)} uncommitted changes in {repo_path} ({message!r})")
+
+        # 옮겨지는 것은 대상 로컬 브랜치와 (detached 상태라면) HEAD 뿐
+        revs = {}
+        try:
+            revs[branch_name] = git.git_verify_commit(repo_path, f"refs/heads/{branch_name}")
+        except subprocess.CalledProcessError:
+            pass
+        if git.git_current_branch(repo_path) == "HEAD":
+            revs.setdefault("detached", git.git_verify_commit(repo_path, "HEAD"))
+
+        for name, commit in revs.items():
+            if name != branch_name and commit == revs.get(branch_name):
+                continue
+            unpushed = git.git_rev_list(repo_path, [commit, "--not", "--remotes"])
+            if unpushed:
+                backup = f"backup/{name}-{stamp}"
+                git.git_create_branch(repo_path, backup, commit)
+                logger.warning(f"Kept {len(unpushed)} unpushed commits of {name} in {repo_path} on {backup}")
+
+    def _adopt_existing_clone(self, repo_name, repo_path, repo_url, branch_name) -> bool:
+        """기존 클론을 재사용하고 fetch 로 최신 상태로 만듭니다.
+
+        새로 클론한 것과 같은 상태가 되도록 워킹 트리를 origin/<branch> 로 초기화합니다.
+        그 전에 커밋하지 않은 변경은 stash 에, 원격에 없는 커밋은 backup/ 브랜치에
+        보관합니다. (ignore 된 파일은 그대로 둠) 보관하지 못하면 디렉토리를
+        <경로>.backup-<시각> 으로 옮겨 두고 새로 클론합니다.
+        """
+        if not self._is_reusable_clone(repo_path, repo_url):
+            return False
+
+        try:
+            # 이전 실행이 비정상 종료되며 남긴 lock 파일 정리
+            index_lock = os.path.join(repo_path, ".git", "index.lock")
+            if os.path.exists(index_lock):
+                logger.warning(f"Removing stale lock file: {index_lock}")
+                os.remove(index_lock)
+
+            self._preserve_local_work(repo_path, branch_name)
+        except Exception as e:
+            backup_path = f"{repo_path}.backup-{datetime.now().strftime('%Y%m%d-%H%M%S')}"
+            logger.warning(f"Could not save local work in {repo_path} ({e}); moving it to {backup_path}")
+            os.replace(repo_path, backup_path)
+            self._release_repository_state(repo_path)
+            return False
+
+        try:
+            git.git_reset_hard(repo_path)
+            git.git_clean(repo_path)
+
+            self.active_repositories[repo_name] = repo_path
+            self.fetcher.ensure_fresh(repo_path, [branch_name], force=True)
+            git.git_checkout(repo_path, branch_name)
+            if self.get_ref_index(repo_name).resolve(f"origin/{branch_name}"):
+                git.git_reset_hard(repo_path, f"origin/{branch_name}")
+
+            logger.info(f"Reusing existing clone: {repo_path}")
+            return True
+
+        except Exception as e:
+            logger.warning(f"Failed to reuse existing clone at {repo_path}, cloning again: {e}")
+            self.active_repositories.pop(repo_name, None)
+            self._release_repository_state(repo_path)
+            return False
+
+    def run_task(self, coro, on_finished=None, on_error=None) -> GitTask:
+        """코루틴을 git 실행기에서 실행하고 결과를 GUI 스레드의 콜백으로 전달합니다."""
+        task = GitTask(self.git_runner, coro)
+        
+        def handle_finished(result):
+            self.tasks.remove(task)
+            if on_finished:
+                on_finished(result)
+            
+        def handle_error(e):
+            self.tasks.remove(task)
+            if on_error:
+                on_error(e)
+            else:
+                self.operation_error.emit(str(e))
+        
+        task.finished.connect(handle_finished)
+        task.error.connect(handle_error)
+        self.tasks.append(task)
+        task.start()
+        return task
     
     def clone_repository(self, repo_url, branch_name, folder_name=None, callback=None):
         """비동기 방식의 저장소 클론"""
-        worker = GitWorker(self._clone_repository_sync, repo_url, branch_name, folder_name)
-        
         def on_finished(repo_path):
             self.clone_finished.emit(repo_path)
             if callback:
                 callback(repo_path)
-            self.workers.remove(worker)
-            
-        def on_error(e):
-            self.operation_error.emit(str(e))
-            self.workers.remove(worker)
         
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-        self.workers.append(worker)
-        worker.start()
+        return self.run_task(
+            self.clone_repository_async(repo_url, branch_name, folder_name),
+            on_finished
+        )
     
+    def get_ref_index(self, repo_name: str) -> RefIndex:
+        """저장소의 ref 인덱스를 반환합니다."""
+        repo_path = self.active_repositories.get(repo_name)
+        if not repo_path:
+            raise Exception(f"Repository {repo_name} not found")
+
+        if repo_path not in self.ref_indexes:
+            self.ref_indexes[repo_path] = RefIndex(repo_path)
+        return self.ref_indexes[repo_path]
+
+    def set_fetch_ttl(self, seconds: float):
+        """fetch 결과를 신선한 것으로 보는 시간(초)을 설정합니다."""
+        self.fetcher.ttl_seconds = seconds
+
+    def fetch_repository(self, repo_name: str, branches: Sequence[str] = (), force: bool = False):
+        """설정된 브랜치와 version 태그를 fetch 합니다. (TTL 안이면 생략)"""
+        repo_path = self.active_repositories.get(repo_name)
+        if not repo_path:
+            raise Exception(f"Repository {repo_name} not found")
+
+        self.fetcher.ensure_fresh(repo_path, branches, force=force)
+        return repo_path
+
     def _checkout_branch_sync(self, repo_name, branch_name):
         """동기 방식의 브랜치 체크아웃 (내부 사용)"""
-        repo_path = self.active_repositories[repo_name]
-        current_branch = git.git_current_branch(repo_path)
+        repo_path = self.fetch_repository(repo_name, [branch_name])
+        with self.git_runner.repo_lock(repo_path):
+            index = self.get_ref_index(repo_name)
         
-        if current_branch != branch_name:
-            git.git_checkout(repo_path, branch_name)
-        git.git_pull(repo_path)
-        return repo_path
+            if index.current_branch() != branch_name:
+                git.git_checkout(repo_path, branch_name)
+            if index.resolve(f"origin/{branch_name}"):
+                git.git_merge_ff_only(repo_path, f"origin/{branch_name}")
+            return repo_path
     
     def checkout_branch(self, repo_name, branch_name, callback=None):
         """비동기 방식의 브랜치 체크아웃"""
-        print(repo_name, branch_name)
-        worker = GitWorker(self._checkout_branch_sync, repo_name, branch_name)
+        logger.debug(f"Checkout {repo_name} to {branch_name}")
         
         def on_finished(repo_path):
             self.checkout_finished.emit(repo_name, branch_name)
             if callback:
                 callback(repo_path)
-            self.workers.remove(worker)
-            
-        def on_error(e):
-            self.operation_error.emit(str(e))
-            self.workers.remove(worker)
         
-        worker.finished.connect(on_finished)
-        worker.error.connect(on_error)
-        self.workers.append(worker)
-        worker.start()
+        return self.run_task(self.checkout_branch_async(repo_name, branch_name), on_finished)
     
     def find_bb_file(self, meta_name: str, recipe_name: str) -> str:
         """BB 파일 경로를 찾습니다."""
@@ -138,157 +318,368 @@ class WorkspaceManager(QObject):
                 if f'{recipe_name}.bb' in files:
                     return os.path.join(root, f"{recipe_name}.bb")
     
+    def _get_blob_reader(self, repo_name: str):
+        """저장소의 blob 읽기 객체 (선택한 읽기 백엔드에 따라 cat-file --batch 또는 dulwich)"""
+        repo_path = self.active_repositories[repo_name]
+        backend = get_backend()
+        backend_name, reader = self.blob_readers.get(repo_path, (None, None))
+        if backend_name != backend.name:
+            # 설정에서 백엔드가 바뀌었으면 이전 읽기 객체를 정리
+            if reader:
+                reader.close()
+            reader = backend.blob_reader(repo_path)
+            self.blob_readers[repo_path] = (backend.name, reader)
+        return reader
+
+    def _find_bb_path_at(self, repo_name: str, commit: str, recipe_name: str) -> str:
+        """커밋 트리에서 BB 파일의 경로를 찾습니다."""
+        repo_path = self.active_repositories[repo_name]
+        key = (repo_path, commit)
+        if key not in self.tree_files:
+            # 커밋은 변하지 않으므로 파일 목록을 한 번만 읽음
+            files = {}
+            for file_path in git.git_ls_tree_files(repo_path, commit):
+                files.setdefault(os.path.basename(file_path), file_path)
+            self.tree_files[key] = files
+        return self.tree_files[key].get(f"{recipe_name}.bb")
+
+    def _parse_recipe_info(self, lines) -> dict:
+        """BB 파일 내용에서 CCOS_VERSION 과 CCOS_GIT_BRANCH_NAME 을 읽습니다."""
+        version = None
+        git_branch = "@s6mobis"  # 기본값 설정
+
+        for line in lines:
+            line = line.strip()
+            if line.startswith('CCOS_VERSION'):
+                # "0.0.1_abcd1234" -> "version/0.0.1" 형식으로 변환
+                value = line.split('=')[1].strip().strip('"')
+                version = f"version/{value.split('_')[0]}"
+            elif line.startswith('CCOS_GIT_BRANCH_NAME'):
+                git_branch = line.split('=')[1].strip().strip('"')
+
+        return {
+            'CCOS_VERSION': version,
+            'CCOS_GIT_BRANCH_NAME': git_branch
+        }
+
     def get_recipe_info(self, meta_name: str, recipe_name: str, branch_name: str) -> dict:
-        """레시피의 BB 파일에서 버전 정보를 읽어옵니다."""
+        """레시피의 BB 파일에서 버전 정보를 읽어옵니다.
+
+        origin/<branch> 의 BB 파일을 cat-file 로 직접 읽으므로 메타 저장소를
+        체크아웃하지 않습니다. 브랜치를 찾지 못하면 한 번 fetch 한 뒤 다시 찾고,
+        그래도 없으면 N/A 를 반환합니다. (다른 브랜치가 체크아웃된 워킹 트리는 읽지 않음)
+        """
+        bb_path = None
         try:
-            # BB 파일 경로 구성
-            bb_path = self.find_bb_file(meta_name, recipe_name)
-            
-            if not os.path.exists(bb_path):
-                raise FileNotFoundError(f"BB file not found: {bb_path}")
-            elif bb_path == None:
-                raise FileNotFoundError(f"BB file not found: {bb_path}")
-            
-            # BB 파일 읽기
-            version = None
-            git_branch = "@s6mobis"  # 기본값 설정
-            
-            with open(bb_path, 'r') as f:
-                for line in f:
-                    print(line)
-                    line = line.strip()
-                    if line.startswith('CCOS_VERSION'):
-                        # "0.0.1_abcd1234" -> "version/0.0.1" 형식으로 변환
-                        value = line.split('=')[1].strip().strip('"')
-                        version = f"version/{value.split('_')[0]}"
-                    elif line.startswith('CCOS_GIT_BRANCH_NAME'):
-                        git_branch = line.split('=')[1].strip().strip('"')
-                    
-                    if version:  # version만 찾으면 break (git_branch는 기본값 있음)
-                        break
-            
-            if not version:
+            index = self.get_ref_index(meta_name)
+            commit = index.resolve(f"origin/{branch_name}") or index.resolve(branch_name)
+            if not commit:
+                self.fetch_repository(meta_name, [branch_name])
+                commit = index.resolve(f"origin/{branch_name}") or index.resolve(branch_name)
+            if not commit:
+                raise LookupError(f"Branch {branch_name} not found in {meta_name}")
+
+            bb_path = self._find_bb_path_at(meta_name, commit, recipe_name)
+            if not bb_path:
+                raise FileNotFoundError(f"BB file not found: {recipe_name}.bb at {branch_name}")
+
+            content = self._get_blob_reader(meta_name).read_text(f"{commit}:{bb_path}")
+            if content is None:
+                raise FileNotFoundError(f"BB file not found: {bb_path} at {branch_name}")
+            info = self._parse_recipe_info(content.splitlines())
+
+            if not info['CCOS_VERSION']:
                 raise ValueError(f"CCOS_VERSION not found in BB file: {bb_path}")
-            
-            return {
-                'CCOS_VERSION': version,
-                'CCOS_GIT_BRANCH_NAME': git_branch
-            }
-            
+
+            return info
+
         except Exception as e:
-            print(f"Error reading BB file for {bb_path}: {e}")
+            logger.error(f"Error reading BB file for {bb_path}: {e}")
             return {
                 'CCOS_VERSION': 'N/A',
                 'CCOS_GIT_BRANCH_NAME': '@s6mobis'  # 에러 시에도 기본값 반환
             }
+
+    def get_recipe_infos(self, meta_name: str, recipe_names: List[str], branch_names: List[str]) -> dict:
+        """여러 브랜치, 여러 레시피의 버전 정보를 한 번에 읽어옵니다.
+
+        Returns:
+            {(branch_name, recipe_name): recipe_info}
+        """
+        return {
+            (branch_name, recipe_name): self.get_recipe_info(meta_name, recipe_name, branch_name)
+            for branch_name in branch_names
+            for recipe_name in recipe_names
+        }
         
-    def update_bb_file(self, repo_name, file_name, version_info):
-        """BB 파일을 업데이트합니다."""
+    def acquire_worktree(self, repo_name: str, branch_name: str) -> str:
+        """origin/<branch> 를 체크아웃한 저장소 전용 worktree 를 준비합니다.
+
+        메인 워킹 트리를 체크아웃하지 않으므로 여러 브랜치를 동시에 작업할 수 있습니다.
+        """
+        repo_path = self.fetch_repository(repo_name, [branch_name])
+        with self.git_runner.repo_lock(repo_path):
+            return self.worktrees.acquire(repo_path, repo_name, branch_name)
+
+    def release_worktree(self, repo_name: str, branch_name: str):
+        """acquire_worktree 로 만든 worktree 를 삭제합니다."""
+        repo_path = self.active_repositories.get(repo_name)
+        if repo_path:
+            with self.git_runner.repo_lock(repo_path):
+                self.worktrees.release(repo_path, branch_name)
+
+    def _working_path(self, repo_name: str, branch_name: str = None) -> str:
+        """branch_name 이 주어지면 해당 브랜치의 worktree, 아니면 메인 워킹 트리 경로"""
         repo_path = self.active_repositories[repo_name]
+        if branch_name is None:
+            return repo_path
+
+        worktree_path = self.worktrees.get(repo_path, branch_name)
+        if not worktree_path:
+            raise Exception(f"No worktree for {repo_name}@{branch_name}. Call acquire_worktree() first")
+        return worktree_path
+
+    def update_bb_file(self, repo_name, file_name, version_info, branch_name=None):
+        """BB 파일을 업데이트합니다. (branch_name 이 주어지면 해당 worktree 에서)"""
+        repo_path = self._working_path(repo_name, branch_name)
         
-        if not os.path.exists(repo_path):
-            raise FileNotFoundError(f"Repository not found: {repo_path}")
-            
-        # 파일 찾기
-        file_path = None
-        for root, dirs, files in os.walk(repo_path):
-            if file_name in files:
-                file_path = os.path.join(root, file_name)
-                break
+        with self.git_runner.repo_lock(repo_path):
+            if not os.path.exists(repo_path):
+                raise FileNotFoundError(f"Repository not found: {repo_path}")
+            
+            # 파일 찾기
+            file_path = None
+            for root, dirs, files in os.walk(repo_path):
+                if file_name in files:
+                    file_path = os.path.join(root, file_name)
+                    break
                 
-        if not file_path:
-            raise FileNotFoundError(f"File not found: {file_name}")
+            if not file_path:
+                raise FileNotFoundError(f"File not found: {file_name}")
         
-        # BB 파일 업데이트
-        with open(file_path, 'r') as f:
-            lines = f.readlines()
+            # BB 파일 업데이트
+            with open(file_path, 'r') as f:
+                lines = f.readlines()
             
-        found_version = False
-        found_branch = False
+            found_version = False
+            found_branch = False
         
-        for i, line in enumerate(lines):
-            line = line.strip()
-            # CCOS_VERSION 또는 CCOS_VERSION = 형태 모두 처리
-            if line.replace(" ", "").startswith('CCOS_VERSION='):
-                # = 위치 찾기
-                eq_pos = line.find('=')
-                prefix = line[:eq_pos+1]  # 기존의 CCOS_VERSION= 형식 유지
-                version = f'{version_info["version"].replace("version/", "")}_{version_info["tag"]}'
-                lines[i] = f'{prefix}"{version}"\n'
-                found_version = True
-            # CCOS_GIT_BRANCH_NAME 또는 CCOS_GIT_BRANCH_NAME = 형태 모두 처리
-            elif line.replace(" ", "").startswith('CCOS_GIT_BRANCH_NAME='):
-                eq_pos = line.find('=')
-                prefix = line[:eq_pos+1]  # 기존의 CCOS_GIT_BRANCH_NAME= 형식 유지
-                lines[i] = f'{prefix}"{version_info["branch"]}"\n'
-                found_branch = True
+            for i, line in enumerate(lines):
+                line = line.strip()
+                # CCOS_VERSION 또는 CCOS_VERSION = 형태 모두 처리
+                if line.replace(" ", "").startswith('CCOS_VERSION='):
+                    # = 위치 찾기
+                    eq_pos = line.find('=')
+                    prefix = line[:eq_pos+1]  # 기존의 CCOS_VERSION= 형식 유지
+                    version = f'{version_info["version"].replace("version/", "")}_{version_info["tag"]}'
+                    lines[i] = f'{prefix}"{version}"\n'
+                    found_version = True
+                # CCOS_GIT_BRANCH_NAME 또는 CCOS_GIT_BRANCH_NAME = 형태 모두 처리
+                elif line.replace(" ", "").startswith('CCOS_GIT_BRANCH_NAME='):
+                    eq_pos = line.find('=')
+                    prefix = line[:eq_pos+1]  # 기존의 CCOS_GIT_BRANCH_NAME= 형식 유지
+                    lines[i] = f'{prefix}"{version_info["branch"]}"\n'
+                    found_branch = True
                 
-        # branch가 @s6mobis가 아니고 CCOS_GIT_BRANCH_NAME이 없으면 추가
-        if version_info["branch"] != "@s6mobis" and not found_branch:
-            lines.append(f'CCOS_GIT_BRANCH_NAME="{version_info["branch"]}"\n')
+            # branch가 @s6mobis가 아니고 CCOS_GIT_BRANCH_NAME이 없으면 추가
+            if version_info["branch"] != "@s6mobis" and not found_branch:
+                lines.append(f'CCOS_GIT_BRANCH_NAME="{version_info["branch"]}"\n')
         
-        with open(file_path, 'w') as f:
-            f.writelines(lines)
-            
+            with open(file_path, 'w') as f:
+                f.writelines(lines)
+            
+    def _release_repository_state(self, repo_path):
+        """저장소에 대해 메모리에 보관하던 인덱스와 프로세스를 정리합니다."""
+        self.ref_indexes.pop(repo_path, None)
+        self.remote_urls.pop(repo_path, None)
+        _, reader = self.blob_readers.pop(repo_path, (None, None))
+        if reader:
+            reader.close()
+        for key in [key for key in self.tree_files if key[0] == repo_path]:
+            del self.tree_files[key]
+
     def cleanup_repository(self, repo_name):
         """특정 저장소 정리"""
         if repo_name in self.active_repositories:
             repo_path = self.active_repositories[repo_name]
-            if os.path.exists(repo_path):
-                shutil.rmtree(repo_path)
+            with self.git_runner.repo_lock(repo_path):
+                self.worktrees.cleanup(repo_path)
+                if os.path.exists(repo_path):
+                    shutil.rmtree(repo_path)
+                self._release_repository_state(repo_path)
             del self.active_repositories[repo_name]
     
     def cleanup_all(self):
         """모든 저장소 정리"""
+        self.worktrees.cleanup()
         for repo_path in self.active_repositories.values():
             if os.path.exists(repo_path):
                 shutil.rmtree(repo_path)
+            self._release_repository_state(repo_path)
         self.active_repositories.clear()
 
-    def update_changes(self, repo_name, commit_message):
-        """변경사항을 커밋하고 push합니다."""
-        repo_path = self.active_repositories[repo_name]
+    def update_changes(self, repo_name, commit_message, branch_name=None, batch: PushBatcher = None):
+        """변경사항을 커밋하고 push합니다. (branch_name 이 주어지면 해당 worktree 에서)
+
+        batch 가 주어지면 바로 push 하지 않고 커밋을 batch 에 추가합니다. (push_batch 로 전송)
+        """
+        repo_path = self._working_path(repo_name, branch_name)
         
-        if not os.path.exists(repo_path):
-            raise FileNotFoundError(f"Repository not found: {repo_path}")
+        with self.git_runner.repo_lock(repo_path):
+            if not os.path.exists(repo_path):
+                raise FileNotFoundError(f"Repository not found: {repo_path}")
             
-        try:
-            # 현재 브랜치 확인
-            current_branch = git.git_current_branch(repo_path)
-            
-            # 변경된 파일들을 스테이징
-            git.git_add_all(repo_path)
-            
-            # 커밋 수행
-            git.git_commit(repo_path, commit_message)
-            
-            # push 수행
-            git.git_push(repo_path, current_branch)
+            try:
+                # 변경된 파일들을 스테이징
+                git.git_add_all(repo_path)
+            
+                # 커밋 수행
+                git.git_commit(repo_path, commit_message)
+            
+                target_branch = branch_name or self.get_ref_index(repo_name).current_branch()
+                if batch is not None:
+                    # worktree 가 정리되어도 커밋은 공유 객체 저장소에 남으므로 해시로 push
+                    commit = git.run_git_command(["git", "rev-parse", "HEAD"], cwd=repo_path)
+                    batch.add_branch(self.active_repositories[repo_name], commit, target_branch)
+                    return
+            
+                # push 수행 (worktree 는 detached HEAD 이므로 대상 브랜치를 지정)
+                if branch_name:
+                    git.git_push_head(repo_path, branch_name)
+                else:
+                    git.git_push(repo_path, target_branch)
+                RemoteRefSnapshot.get_instance().invalidate(self.get_remote_url(repo_name))
             
-        except Exception as e:
-            raise Exception(f"Failed to commit and push changes: {str(e)}")
+            except Exception as e:
+                raise Exception(f"Failed to commit and push changes: {str(e)}")
+
+    def push_batch(self, batch: PushBatcher) -> Dict[str, List[PushResult]]:
+        """batch 에 모인 태그와 브랜치를 원격마다 한 번의 atomic push 로 보냅니다.
+
+        반환값은 {저장소 이름: [ref 별 PushResult]} 입니다.
+        """
+        results = batch.push()
+        names = {path: name for name, path in self.active_repositories.items()}
+        snapshot = RemoteRefSnapshot.get_instance()
+        report = {}
+        for repo_path, repo_results in results.items():
+            repo_name = names.get(repo_path, repo_path)
+            if repo_name in self.active_repositories:
+                snapshot.invalidate(self.get_remote_url(repo_name))
+            report[repo_name] = repo_results
+        return report
         
     def get_tag_hash_by_branch(self, repo_name, branch_name):
-        """브랜치 해시를 반환합니다."""
+        """브랜치에 병합된 태그와 커밋 해시의 매핑을 반환합니다."""
         repo_path = self.active_repositories[repo_name]
         return git.get_tag_hash_by_branch(repo_path, branch_name)
 
+    def get_remote_url(self, repo_name: str) -> str:
+        """저장소의 origin URL 을 반환합니다."""
+        repo_path = self.active_repositories[repo_name]
+        if repo_path not in self.remote_urls:
+            self.remote_urls[repo_path] = git.git_remote_url(repo_path)
+        return self.remote_urls[repo_path]
+
+    def validate_remote_tags(self, tags) -> List[str]:
+        """(저장소 이름, 태그, 기대하는 커밋 해시) 목록이 원격에 그대로 있는지 확인합니다.
+
+        원격마다 ls-remote 스냅샷 한 번으로 모든 태그를 확인하며, 문제가 있는 항목의
+        설명 목록을 반환합니다. (빈 목록이면 모두 정상)
+        """
+        tags = list(tags)
+        snapshot = RemoteRefSnapshot.get_instance()
+        problems = []
+        urls = {}
+        for repo_name in dict.fromkeys(repo_name for repo_name, _, _ in tags):
+            try:
+                urls[repo_name] = self.get_remote_url(repo_name)
+            except KeyError:
+                problems.append(f"{repo_name}: repository is not in the workspace")
+            except Exception as e:
+                problems.append(f"{repo_name}: failed to get the remote URL ({e})")
+        snapshot.prefetch(urls.values())
+
+        for repo_name, tag, expected_hash in tags:
+            if repo_name not in urls:
+                continue
+            try:
+                remote_hash = snapshot.tag_hash(urls[repo_name], tag)
+            except Exception as e:
+                problems.append(f"{repo_name}: failed to list remote refs ({e})")
+                continue
+            if remote_hash is None:
+                problems.append(f"{repo_name}: {tag} is not pushed to the remote")
+            elif expected_hash and remote_hash != expected_hash:
+                problems.append(f"{repo_name}: {tag} is {remote_hash[:10]} on the remote, "
+                                f"expected {expected_hash[:10]}")
+        return problems
+
+    def get_commit_records(self, ranges) -> Dict[Tuple[str, str, str], List[CommitRecord]]:
+        """여러 (저장소 이름, 시작 태그, 끝 태그) 범위의 커밋 레코드를 한 번에 가져옵니다.
+
+        저장소마다 fetch 는 한 번만 하고, 범위마다 git log 한 번으로 제목, 본문, JIRA 번호,
+        trailer 를 모두 얻습니다. 서로 다른 범위는 병렬로 조회하며, 태그 사이처럼 SHA 로
+        고정되는 범위의 결과는 RangeCache 에 저장되어 재시작 후에도 재사용됩니다.
+        가져오지 못한 범위는 빈 목록으로 반환합니다.
+        """
+        ranges = list(dict.fromkeys(tuple(r) for r in ranges))
+        if not ranges:
+            return {}
+
+        repo_names = {repo_name for repo_name, _, _ in ranges}
+        repo_paths = {}
+        for repo_name in repo_names:
+            try:
+                repo_paths[repo_name] = self.fetch_repository(repo_name)
+            except Exception as e:
+                logger.error(f"Failed to prepare {repo_name} for commit query: {e}")
+
+        def query(commit_range):
+            repo_name, from_rev, to_rev = commit_range
+            try:
+                # 두 리비전을 SHA 로 바꿀 수 있으면 결과가 바뀌지 않으므로 디스크 캐시 사용
+                ref_index = self.get_ref_index(repo_name)
+                from_sha, to_sha = ref_index.resolve(from_rev), ref_index.resolve(to_rev)
+                if from_sha and to_sha:
+                    records = self.range_cache.get(repo_name, from_sha, to_sha)
+                    if records is not None:
+                        return records
+
+                records = git.get_commit_records(repo_paths[repo_name], from_rev, to_rev)
+                if from_sha and to_sha:
+                    self.range_cache.put(repo_name, from_sha, to_sha, records)
+                return records
+            except Exception as e:
+                logger.error(f"Error getting commits {from_rev}..{to_rev} in {repo_name}: {e}")
+                return []
+
+        targets = [r for r in ranges if r[0] in repo_paths]
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(8, len(targets) or 1)) as executor:
+            results = dict(zip(targets, executor.map(query, targets)))
+        return {commit_range: results.get(commit_range, []) for commit_range in ranges}
+
     def get_commit_messages_between_tags(self, repo_name: str, tag1: str, tag2: str) -> List[str]:
-        """두 태그 사이의 커밋 메시지를 가져옵니다."""
-        repo_path = self.active_repositories.get(repo_name)
-        if not repo_path:
-            raise Exception(f"Repository {repo_name} not found")
-            
-        return git.get_commit_messages_between_tags(repo_path, tag1, tag2)
+        """두 태그 사이의 커밋 메시지(제목)를 가져옵니다."""
+        records = self.get_commit_records([(repo_name, tag1, tag2)])[(repo_name, tag1, tag2)]
+        return [record.subject for record in records]
     
     def get_jira_numbers_between_tags(self, repo_name: str, tag1: str, tag2: str) -> List[str]:
         """두 태그 사이의 JIRA 번호를 가져옵니다."""
-        repo_path = self.active_repositories.get(repo_name)
-        if not repo_path:
-            raise Exception(f"Repository {repo_name} not found")
-            
-        return git.get_jira_numbers_between_tags(repo_path, tag1, tag2)
+        records = self.get_commit_records([(repo_name, tag1, tag2)])[(repo_name, tag1, tag2)]
+        return list(dict.fromkeys(key for record in records for key in record.jira_keys))
         
+    def parse_commit_record(self, record: CommitRecord) -> dict:
+        """커밋 레코드에서 제목, JIRA, 그리고 Description/Cause/Countermeasure trailer 를 추출합니다."""
+        result = {'title': record.subject}
+        if record.jira_keys:
+            result['jira'] = ' '.join(record.jira_keys)
+        for key in ('description', 'cause', 'countermeasure'):
+            value = record.trailer(key)
+            if value:
+                result[key] = value
+        return result
+
     def parse_commit_message(self, commit_message: str) -> dict:
         """커밋 메시지를 파싱합니다."""
         try:
@@ -312,49 +703,46 @@ class WorkspaceManager(QObject):
 
     def get_latest_tag(self, repo_name: str) -> str:
         """저장소의 최신 태그를 반환합니다."""
-        repo_path = self.active_repositories.get(repo_name)
-        if not repo_path:
-            raise Exception(f"Repository {repo_name} not found")
-            
-        return git.get_latest_tag(repo_path)
+        return self.get_ref_index(repo_name).get_latest_tag()
         
     def get_head_tags(self, repo_name: str) -> List[str]:
         """HEAD에 있는 태그들을 반환합니다."""
-        repo_path = self.active_repositories.get(repo_name)
-        if not repo_path:
-            raise Exception(f"Repository {repo_name} not found")
-            
-        return git.get_head_tags(repo_path)
+        return self.get_ref_index(repo_name).get_head_tags()
         
     def get_all_version_tags(self, repo_name: str) -> List[str]:
         """저장소의 모든 버전 태그를 반환합니다."""
-        repo_path = self.active_repositories.get(repo_name)
-        if not repo_path:
-            raise Exception(f"Repository {repo_name} not found")
-            
-        return git.get_all_version_tags(repo_path)
+        return self.get_ref_index(repo_name).get_all_version_tags()
         
     def get_commit_count_between_tags(self, repo_name: str, tag1: str, tag2: str) -> int:
         """두 태그 사이의 커밋 수를 반환합니다."""
-        repo_path = self.active_repositories.get(repo_name)
-        if not repo_path:
-            raise Exception(f"Repository {repo_name} not found")
-            
-        return git.get_commit_count_between_tags(repo_path, tag1, tag2)
+        return len(self.get_commit_records([(repo_name, tag1, tag2)])[(repo_name, tag1, tag2)])
 
-    def get_modified_repositories(self) -> List[str]:
-        """변경사항이 있는 저장소 목록을 반환합니다."""
-        modified_repos = []
-        for repo_name, repo_path in self.active_repositories.items():
+    def scan_status(self, repo_names: List[str] = None) -> Dict[str, List[FileChange]]:
+        """저장소들의 변경된 파일 목록을 병렬로 조회합니다.
+
+        상태를 가져오지 못한 저장소는 결과에서 제외됩니다.
+        """
+        if repo_names is None:
+            repo_names = list(self.active_repositories)
+        targets = [(name, self.active_repositories[name]) for name in repo_names if name in self.active_repositories]
+        if not targets:
+            return {}
+
+        def scan(target):
+            repo_name, repo_path = target
             try:
-                # git status 실행
-                status = git.git_status(repo_path)
-                # 변경사항이 있으면 목록에 추가
-                if "nothing to commit" not in status:
-                    modified_repos.append(repo_name)
+                return repo_name, git.git_status_porcelain(repo_path)
             except Exception as e:
                 logger.error(f"Failed to get status for {repo_name}: {e}")
-        return modified_repos
+                return repo_name, None
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(16, len(targets))) as executor:
+            results = executor.map(scan, targets)
+            return {repo_name: changes for repo_name, changes in results if changes is not None}
+
+    def get_modified_repositories(self) -> List[str]:
+        """변경사항이 있는 저장소 목록을 반환합니다."""
+        return [repo_name for repo_name, changes in self.scan_status().items() if changes]
 
     def get_diff(self, repo_name: str) -> str:
         """저장소의 변경사항을 반환합니다."""
@@ -364,8 +752,30 @@ class WorkspaceManager(QObject):
         
         return git.git_diff(repo_path)
 
-    def create_version_tag(self, repo_name: str, tag: str, message: str = None) -> bool:
-        """새로운 버전 태그를 생성합니다."""
+    def open_diff(self, repo_name: str, max_bytes: int = DEFAULT_PAGE_BYTES,
+                  max_hunks: int = DEFAULT_PAGE_HUNKS) -> DiffPager:
+        """HEAD 대비 변경사항을 페이지 단위로 읽는 DiffPager 를 반환합니다.
+
+        사용이 끝나면 close() 를 호출해 git 프로세스를 정리해야 합니다.
+        """
+        repo_path = self.active_repositories.get(repo_name)
+        if not repo_path:
+            raise Exception(f"Repository {repo_name} not found")
+        return DiffPager(iter_diff_hunks(repo_path), max_bytes, max_hunks)
+
+    def get_diff_stat(self, repo_name: str) -> str:
+        """HEAD 대비 변경 요약(--stat)을 반환합니다."""
+        repo_path = self.active_repositories.get(repo_name)
+        if not repo_path:
+            raise Exception(f"Repository {repo_name} not found")
+        return git_diff_stat(repo_path)
+
+    def create_version_tag(self, repo_name: str, tag: str, message: str = None,
+                           batch: PushBatcher = None) -> bool:
+        """새로운 버전 태그를 생성합니다.
+
+        batch 가 주어지면 바로 push 하지 않고 batch 에 추가합니다.
+        """
         try:
             repo_path = self.active_repositories.get(repo_name)
             if not repo_path:
@@ -375,7 +785,13 @@ class WorkspaceManager(QObject):
             if not message:
                 message = f"Create tag {tag}"
             
-            git.create_tag(repo_path, tag, message)
+            with self.git_runner.repo_lock(repo_path):
+                git.create_tag(repo_path, tag, message)
+            
+            if batch is not None:
+                batch.add_tag(repo_path, tag)
+                logger.info(f"Created tag {tag} for {repo_name} (push batched)")
+                return True
             
             # 원격 저장소에 태그 푸시
             git.push_tag(repo_path, tag)
@@ -387,6 +803,106 @@ class WorkspaceManager(QObject):
             logger.error(f"Failed to create tag {tag} for {repo_name}: {e}")
             return False
 
+    def delete_version_tag(self, repo_name: str, tag: str):
+        """push 하지 못한 로컬 태그를 삭제합니다."""
+        repo_path = self.active_repositories.get(repo_name)
+        if not repo_path:
+            raise Exception(f"Repository {repo_name} not found")
+        with self.git_runner.repo_lock(repo_path):
+            git.delete_tag(repo_path, tag)
+
+    # ---- awaitable 변형 (AsyncGitRunner 루프에서 실행) ----
+
+    async def _call_async(self, func, *args, repo_name=None, repo_path=None, mutating=False, timeout=None):
+        """동기 작업을 git 실행기의 저장소 잠금과 동시 실행 제한 아래에서 실행합니다."""
+        if repo_path is None and repo_name:
+            repo_path = self.active_repositories.get(repo_name)
+        return await self.git_runner.call(func, *args, repo_path=repo_path, mutating=mutating, timeout=timeout)
+
+    async def clone_repository_async(self, repo_url, branch_name, folder_name=None, timeout=None):
+        repo_path = os.path.join(self.workspace_dir, self._repo_name_from_url(repo_url, folder_name))
+        return await self._call_async(self._clone_repository_sync, repo_url, branch_name, folder_name,
+                                      repo_path=repo_path, mutating=True, timeout=timeout)
+
+    async def checkout_branch_async(self, repo_name, branch_name, timeout=None):
+        return await self._call_async(self._checkout_branch_sync, repo_name, branch_name,
+                                      repo_name=repo_name, mutating=True, timeout=timeout)
+
+    async def fetch_repository_async(self, repo_name, branches=(), force=False, timeout=None):
+        return await self._call_async(self.fetch_repository, repo_name, branches, force,
+                                      repo_name=repo_name, timeout=timeout)
+
+    async def get_recipe_info_async(self, meta_name, recipe_name, branch_name, timeout=None):
+        return await self._call_async(self.get_recipe_info, meta_name, recipe_name, branch_name, timeout=timeout)
+
+    async def get_recipe_infos_async(self, meta_name, recipe_names, branch_names, timeout=None):
+        return await self._call_async(self.get_recipe_infos, meta_name, recipe_names, branch_names, timeout=timeout)
+
+    async def acquire_worktree_async(self, repo_name, branch_name, timeout=None):
+        return await self._call_async(self.acquire_worktree, repo_name, branch_name,
+                                      repo_name=repo_name, mutating=True, timeout=timeout)
+
+    async def release_worktree_async(self, repo_name, branch_name, timeout=None):
+        return await self._call_async(self.release_worktree, repo_name, branch_name,
+                                      repo_name=repo_name, mutating=True, timeout=timeout)
+
+    async def update_bb_file_async(self, repo_name, file_name, version_info, branch_name=None, timeout=None):
+        # worktree 작업은 worktree 경로 단위로 잠가 브랜치끼리 병렬로 진행
+        return await self._call_async(self.update_bb_file, repo_name, file_name, version_info, branch_name,
+                                      repo_path=self._working_path(repo_name, branch_name),
+                                      mutating=True, timeout=timeout)
+
+    async def update_changes_async(self, repo_name, commit_message, branch_name=None, batch=None, timeout=None):
+        return await self._call_async(self.update_changes, repo_name, commit_message, branch_name, batch,
+                                      repo_path=self._working_path(repo_name, branch_name),
+                                      mutating=True, timeout=timeout)
+
+    async def create_version_tag_async(self, repo_name, tag, message=None, batch=None, timeout=None):
+        return await self._call_async(self.create_version_tag, repo_name, tag, message, batch,
+                                      repo_name=repo_name, mutating=True, timeout=timeout)
+
+    async def push_batch_async(self, batch, timeout=None):
+        return await self._call_async(self.push_batch, batch, timeout=timeout)
+
+    async def get_tag_hash_by_branch_async(self, repo_name, branch_name, timeout=None):
+        return await self._call_async(self.get_tag_hash_by_branch, repo_name, branch_name, timeout=timeout)
+
+    async def validate_remote_tags_async(self, tags, timeout=None):
+        return await self._call_async(self.validate_remote_tags, tags, timeout=timeout)
+
+    async def get_commit_records_async(self, ranges, timeout=None):
+        return await self._call_async(self.get_commit_records, ranges, timeout=timeout)
+
+    async def get_commit_messages_between_tags_async(self, repo_name, tag1, tag2, timeout=None):
+        return await self._call_async(self.get_commit_messages_between_tags, repo_name, tag1, tag2, timeout=timeout)
+
+    async def get_jira_numbers_between_tags_async(self, repo_name, tag1, tag2, timeout=None):
+        return await self._call_async(self.get_jira_numbers_between_tags, repo_name, tag1, tag2, timeout=timeout)
+
+    async def get_commit_count_between_tags_async(self, repo_name, tag1, tag2, timeout=None):
+        return await self._call_async(self.get_commit_count_between_tags, repo_name, tag1, tag2, timeout=timeout)
+
+    async def get_latest_tag_async(self, repo_name, timeout=None):
+        return await self._call_async(self.get_latest_tag, repo_name, timeout=timeout)
+
+    async def get_head_tags_async(self, repo_name, timeout=None):
+        return await self._call_async(self.get_head_tags, repo_name, timeout=timeout)
+
+    async def get_all_version_tags_async(self, repo_name, timeout=None):
+        return await self._call_async(self.get_all_version_tags, repo_name, timeout=timeout)
+
+    async def scan_status_async(self, repo_names=None, timeout=None):
+        return await self._call_async(self.scan_status, repo_names, timeout=timeout)
+
+    async def get_modified_repositories_async(self, timeout=None):
+        return await self._call_async(self.get_modified_repositories, timeout=timeout)
+
+    async def get_diff_async(self, repo_name, timeout=None):
+        return await self._call_async(self.get_diff, repo_name, timeout=timeout)
+
+    async def get_diff_stat_async(self, repo_name, timeout=None):
+        return await self._call_async(self.get_diff_stat, repo_name, timeout=timeout)
+
 if __name__ == "__main__":
     manager = WorkspaceManager.get_instance()
     
@@ -0,0 +1,156 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from dataclasses import asdict
+from datetime import datetime
+from typing import List, Optional
+from models.commit_record import CommitRecord
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+RANGE_CACHE_PATH = os.path.expanduser("~/.auto-pr/range_cache.sqlite3")
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+class RangeCache:
+    """(저장소, 시작 커밋 SHA, 끝 커밋 SHA) 범위의 커밋 레코드를 SQLite 에 저장합니다.
+
+    두 SHA 사이의 커밋은 바뀌지 않으므로 항목을 무효화할 필요가 없습니다.
+    전체 크기가 max_bytes 를 넘으면 가장 오래 사용하지 않은 항목부터 지웁니다.
+    """
+
+    def __init__(self, db_path: str = RANGE_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        self._conn = self._connect()
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        try:
+            conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS commit_ranges ("
+                " repo TEXT NOT NULL,"
+                " from_sha TEXT NOT NULL,"
+                " to_sha TEXT NOT NULL,"
+                " payload BLOB NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " last_used REAL NOT NULL,"
+                " PRIMARY KEY (repo, from_sha, to_sha))"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS commit_ranges_last_used ON commit_ranges (last_used)")
+            conn.commit()
+            return conn
+        except sqlite3.Error as e:
+            # 캐시를 쓸 수 없어도 조회는 git 으로 계속 동작해야 함
+            logger.warning(f"Range cache disabled ({self.db_path}): {e}")
+            return None
+
+    def _encode(self, records: List[CommitRecord]) -> bytes:
+        data = [dict(asdict(record), date=record.date.isoformat()) for record in records]
+        return zlib.compress(json.dumps(data).encode())
+
+    def _decode(self, payload: bytes) -> List[CommitRecord]:
+        data = json.loads(zlib.decompress(payload))
+        return [CommitRecord(**dict(item, date=datetime.fromisoformat(item['date']))) for item in data]
+
+    def get(self, repo: str, from_sha: str, to_sha: str) -> Optional[List[CommitRecord]]:
+        """저장된 커밋 레코드를 반환합니다. 없으면 None"""
+        with self._lock:
+            row = None
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        "SELECT payload FROM commit_ranges WHERE repo = ? AND from_sha = ? AND to_sha = ?",
+                        (repo, from_sha, to_sha)
+                    ).fetchone()
+                    if row:
+                        self._conn.execute(
+                            "UPDATE commit_ranges SET last_used = ? WHERE repo = ? AND from_sha = ? AND to_sha = ?",
+                            (time.time(), repo, from_sha, to_sha)
+                        )
+                        self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Range cache read failed: {e}")
+                    row = None
+
+            if row is None:
+                self.misses += 1
+                return None
+
+            try:
+                records = self._decode(row[0])
+            except Exception as e:
+                logger.warning(f"Discarding corrupt range cache entry {repo} {from_sha}..{to_sha}: {e}")
+                self.misses += 1
+                return None
+            self.hits += 1
+            return records
+
+    def put(self, repo: str, from_sha: str, to_sha: str, records: List[CommitRecord]):
+        """커밋 레코드를 저장하고 필요하면 오래된 항목을 지웁니다."""
+        payload = self._encode(records)
+        with self._lock:
+            if self._conn is None:
+                return
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO commit_ranges (repo, from_sha, to_sha, payload, size, last_used)"
+                    " VALUES (?, ?, ?, ?, ?, ?)",
+                    (repo, from_sha, to_sha, payload, len(payload), time.time())
+                )
+                self._evict()
+                self._conn.commit()
+            except sqlite3.Error as e:
+                logger.warning(f"Range cache write failed: {e}")
+
+    def _evict(self):
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM commit_ranges").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+
+        rows = self._conn.execute(
+            "SELECT repo, from_sha, to_sha, size FROM commit_ranges ORDER BY last_used"
+        ).fetchall()
+        evicted = []
+        for repo, from_sha, to_sha, size in rows:
+            if total <= self.max_bytes:
+                break
+            evicted.append((repo, from_sha, to_sha))
+            total -= size
+        self._conn.executemany(
+            "DELETE FROM commit_ranges WHERE repo = ? AND from_sha = ? AND to_sha = ?", evicted
+        )
+        logger.info(f"Evicted {len(evicted)} range cache entries")
+
+    def stats(self) -> dict:
+        """적중/실패 횟수와 저장된 항목 수, 크기를 반환합니다."""
+        with self._lock:
+            entries, size = 0, 0
+            if self._conn is not None:
+                try:
+                    entries, size = self._conn.execute(
+                        "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM commit_ranges"
+                    ).fetchone()
+                except sqlite3.Error:
+                    pass
+            return {'hits': self.hits, 'misses': self.misses, 'entries': entries, 'bytes': size}
+
+    def clear(self):
+        """모든 항목을 지웁니다."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("DELETE FROM commit_ranges")
+                self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
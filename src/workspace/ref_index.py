@@ -0,0 +1,131 @@
+import os
+import threading
+from typing import Dict, List, Optional
+from git import git
+from git.backend import get_backend
+from utils.logger import setup_logger
+from utils.version_utils import version_sort_key
+
+logger = setup_logger(__name__)
+
+class RefIndex:
+    """저장소의 브랜치, 버전 태그, HEAD 정보를 메모리에 보관하는 인덱스
+
+    packed-refs, refs/, HEAD 가 디스크에서 바뀐 경우에만 다시 만들어지므로
+    조회할 때마다 git 프로세스를 실행하지 않습니다.
+    """
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        # worktree 에서는 HEAD 와 refs 의 위치가 다르므로 각각 확인
+        self.git_dir = git.run_git_command(
+            ["git", "rev-parse", "--absolute-git-dir"], cwd=repo_path
+        )
+        common_dir = git.run_git_command(
+            ["git", "rev-parse", "--git-common-dir"], cwd=repo_path
+        )
+        self.common_dir = os.path.normpath(os.path.join(repo_path, common_dir))
+
+        self.branches: Dict[str, str] = {}          # 로컬 브랜치 -> 커밋 해시
+        self.remote_branches: Dict[str, str] = {}   # origin/<branch> -> 커밋 해시
+        self.tags: Dict[str, str] = {}              # version/* 태그 -> 커밋 해시
+        self.head_branch: Optional[str] = None
+        self.head_commit: Optional[str] = None
+
+        self._fingerprint = None
+        self._lock = threading.Lock()
+
+    def _stat(self, path: str):
+        try:
+            stat = os.stat(path)
+            return (path, stat.st_mtime_ns, stat.st_ino, stat.st_size)
+        except FileNotFoundError:
+            return (path, None)
+
+    def _compute_fingerprint(self) -> tuple:
+        """HEAD, packed-refs, refs/ 디렉토리들의 상태를 모읍니다."""
+        entries = [
+            self._stat(os.path.join(self.git_dir, "HEAD")),
+            self._stat(os.path.join(self.common_dir, "packed-refs")),
+        ]
+        # loose ref 는 lock 파일을 rename 하며 갱신되므로 디렉토리 mtime 이 바뀜
+        for root, dirs, files in os.walk(os.path.join(self.common_dir, "refs")):
+            entries.append(self._stat(root))
+        return tuple(entries)
+
+    def _rebuild(self):
+        refs = get_backend().list_refs(self.repo_path, ["refs/heads", "refs/remotes", "refs/tags/version"])
+
+        branches, remote_branches, tags = {}, {}, {}
+        for ref, object_hash, peeled_hash in refs:
+            if ref.startswith("refs/heads/"):
+                branches[ref[len("refs/heads/"):]] = object_hash
+            elif ref.startswith("refs/remotes/"):
+                name = ref[len("refs/remotes/"):]
+                if not name.endswith("/HEAD"):
+                    remote_branches[name] = object_hash
+            elif ref.startswith("refs/tags/"):
+                tags[ref[len("refs/tags/"):]] = peeled_hash or object_hash
+
+        with open(os.path.join(self.git_dir, "HEAD"), 'r') as f:
+            head = f.read().strip()
+
+        if head.startswith("ref: refs/heads/"):
+            self.head_branch = head[len("ref: refs/heads/"):]
+            self.head_commit = branches.get(self.head_branch)
+        else:
+            self.head_branch = None
+            self.head_commit = head
+
+        self.branches = branches
+        self.remote_branches = remote_branches
+        self.tags = tags
+        logger.debug(
+            f"Rebuilt ref index for {self.repo_path}: "
+            f"{len(branches)} branches, {len(remote_branches)} remote branches, {len(tags)} tags"
+        )
+
+    def refresh(self):
+        """디스크의 ref 가 바뀐 경우에만 인덱스를 다시 만듭니다."""
+        with self._lock:
+            fingerprint = self._compute_fingerprint()
+            if fingerprint != self._fingerprint:
+                self._rebuild()
+                self._fingerprint = fingerprint
+
+    def invalidate(self):
+        """다음 조회 시 인덱스를 강제로 다시 만듭니다."""
+        with self._lock:
+            self._fingerprint = None
+
+    def current_branch(self) -> str:
+        """현재 브랜치 이름을 반환합니다. (detached 상태면 "HEAD")"""
+        self.refresh()
+        return self.head_branch or "HEAD"
+
+    def get_all_version_tags(self) -> List[str]:
+        """모든 버전 태그를 이름순으로 반환합니다."""
+        self.refresh()
+        return sorted(self.tags)
+
+    def get_latest_tag(self) -> str:
+        """버전 순으로 가장 최신 태그를 반환합니다."""
+        self.refresh()
+        if not self.tags:
+            return ""
+        return max(self.tags, key=version_sort_key)
+
+    def get_head_tags(self) -> List[str]:
+        """HEAD 커밋을 가리키는 버전 태그들을 반환합니다."""
+        self.refresh()
+        return sorted(tag for tag, commit in self.tags.items() if commit == self.head_commit)
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """HEAD, 브랜치, 원격 브랜치, 버전 태그 이름을 커밋 해시로 변환합니다."""
+        self.refresh()
+        if rev == "HEAD":
+            return self.head_commit
+        for refs in (self.tags, self.branches, self.remote_branches):
+            if rev in refs:
+                return refs[rev]
+        return None
@@ -0,0 +1,81 @@
+import os
+import shutil
+import threading
+from typing import Dict, Tuple
+from git import git
+from utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+WORKTREE_DIR = os.path.expanduser("~/.auto-pr/worktrees")
+
+class WorktreeManager:
+    """(메타 저장소, 대상 브랜치) 마다 별도의 git worktree 를 관리합니다.
+
+    메인 워킹 트리를 체크아웃하지 않고 여러 릴리즈 브랜치의 버전 변경과 커밋을
+    동시에 진행할 수 있습니다. worktree 는 origin/<branch> 를 detached 상태로
+    체크아웃하며, 커밋은 HEAD:refs/heads/<branch> 로 push 합니다.
+    """
+
+    def __init__(self, worktree_dir: str = WORKTREE_DIR):
+        self.worktree_dir = worktree_dir
+        os.makedirs(self.worktree_dir, exist_ok=True)
+        self.worktrees: Dict[Tuple[str, str], str] = {}  # (repo_path, branch) -> worktree 경로
+        self._repo_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def _lock_for(self, repo_path: str) -> threading.Lock:
+        with self._lock:
+            if repo_path not in self._repo_locks:
+                self._repo_locks[repo_path] = threading.Lock()
+            return self._repo_locks[repo_path]
+
+    def worktree_path(self, repo_name: str, branch: str) -> str:
+        return os.path.join(self.worktree_dir, repo_name, branch.replace('/', '_'))
+
+    def get(self, repo_path: str, branch: str) -> str:
+        """등록된 worktree 경로를 반환합니다. 없으면 None"""
+        return self.worktrees.get((repo_path, branch))
+
+    def acquire(self, repo_path: str, repo_name: str, branch: str) -> str:
+        """origin/<branch> 를 가리키는 깨끗한 worktree 를 준비하고 경로를 반환합니다.
+
+        호출 전에 origin/<branch> 가 fetch 되어 있어야 합니다.
+        """
+        worktree_path = self.worktree_path(repo_name, branch)
+        with self._lock_for(repo_path):
+            if self.worktrees.get((repo_path, branch)) == worktree_path and os.path.exists(worktree_path):
+                # 재사용: 이전 작업의 흔적을 지우고 최신 원격 브랜치로 맞춤
+                git.git_reset_hard(worktree_path, f"origin/{branch}")
+                git.git_clean(worktree_path)
+                return worktree_path
+
+            if os.path.exists(worktree_path):
+                shutil.rmtree(worktree_path)
+            git.git_worktree_prune(repo_path)
+
+            logger.info(f"Adding worktree for {repo_name}@{branch} at {worktree_path}")
+            os.makedirs(os.path.dirname(worktree_path), exist_ok=True)
+            git.git_worktree_add(repo_path, worktree_path, f"origin/{branch}")
+            self.worktrees[(repo_path, branch)] = worktree_path
+            return worktree_path
+
+    def release(self, repo_path: str, branch: str):
+        """worktree 를 삭제합니다."""
+        with self._lock_for(repo_path):
+            worktree_path = self.worktrees.pop((repo_path, branch), None)
+            if not worktree_path:
+                return
+            try:
+                git.git_worktree_remove(repo_path, worktree_path)
+            except Exception as e:
+                logger.warning(f"Failed to remove worktree {worktree_path}: {e}")
+                if os.path.exists(worktree_path):
+                    shutil.rmtree(worktree_path)
+                git.git_worktree_prune(repo_path)
+
+    def cleanup(self, repo_path: str = None):
+        """저장소(또는 전체)의 worktree 를 모두 삭제합니다."""
+        for key_repo_path, branch in list(self.worktrees):
+            if repo_path is None or key_repo_path == repo_path:
+                self.release(key_repo_path, branch)
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# 애플리케이션은 src 를 작업 디렉토리로 실행되므로 테스트도 같은 import 경로를 사용
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
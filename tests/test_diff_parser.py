@@ -0,0 +1,89 @@
+from bitbucket.utils import parse_info_from_diff
+
+DIFF = """\
+diff --git a/meta-a/foo/foo.bb b/meta-a/foo/foo.bb
+index 1111111..2222222 100644
+--- a/meta-a/foo/foo.bb
++++ b/meta-a/foo/foo.bb
+@@ -1,4 +1,5 @@
+ SUMMARY = "foo"
+-CCOS_VERSION = "0.0.1_aaaa"
++CCOS_VERSION = "0.0.2_bbbb"
++CCOS_VERSION = "0.0.3_cccc"
+-CCOS_GIT_BRANCH_NAME ?= "@s6mobis"
++CCOS_GIT_BRANCH_NAME ?= "release"
+diff --git a/meta-a/bar/bar.bb b/meta-a/bar/bar.bb
+index 3333333..4444444 100644
+--- a/meta-a/bar/bar.bb
++++ b/meta-a/bar/bar.bb
+@@ -1,5 +1,5 @@
+ SUMMARY = "bar"
+-+++ b/meta-a/fake/fake.bb
+-diff --git a/x b/x
+++++ b/meta-a/other/other.bb
++diff --git a/y b/y
+-CCOS_VERSION = "0.0.1_aaaa"
++CCOS_VERSION = "0.0.3_cccc"
+diff --git a/meta-a/baz/baz.bb b/meta-a/baz/baz.bb
+index 5555555..6666666 100644
+--- a/meta-a/baz/baz.bb
++++ b/meta-a/baz/baz.bb
+@@ -1 +1 @@
+-CCOS_GIT_BRANCH_NAME = "a"
++CCOS_GIT_BRANCH_NAME = "b"
+"""
+
+
+def test_last_value_per_file_and_same_line_in_two_files():
+    info = parse_info_from_diff(DIFF)
+
+    assert [entry["file"] for entry in info] == ["meta-a/foo/foo.bb", "meta-a/bar/bar.bb"]
+    foo, bar = info
+    assert (foo["version"], foo["commit"]) == ("version/0.0.3", "cccc")
+    assert (foo["old_version"], foo["old_commit"]) == ("version/0.0.1", "aaaa")
+    assert (foo["old_branch"], foo["new_branch"]) == ("@s6mobis", "release")
+    assert (bar["version"], bar["commit"]) == ("version/0.0.3", "cccc")
+    assert bar["old_branch"] is None and bar["new_branch"] is None
+
+
+def test_header_like_hunk_lines_do_not_switch_files():
+    info = parse_info_from_diff(DIFF)
+
+    assert "meta-a/fake/fake.bb" not in [entry["file"] for entry in info]
+    assert "meta-a/other/other.bb" not in [entry["file"] for entry in info]
+    assert info[1]["file"] == "meta-a/bar/bar.bb"
+
+
+def test_branch_only_change_is_skipped():
+    info = parse_info_from_diff(DIFF)
+
+    assert all(entry["version"] is not None for entry in info)
+    assert "meta-a/baz/baz.bb" not in [entry["file"] for entry in info]
+
+
+def test_bytes_lines_match_str_input():
+    lines = (line.encode() for line in DIFF.splitlines(keepends=True))
+
+    assert parse_info_from_diff(lines) == parse_info_from_diff(DIFF)
+
+
+def test_crlf_and_empty_input():
+    assert parse_info_from_diff(DIFF.replace("\n", "\r\n")) == parse_info_from_diff(DIFF)
+    assert parse_info_from_diff("") == []
+    assert parse_info_from_diff(None) == []
+
+
+def test_many_files_in_one_pass():
+    chunks = []
+    for i in range(5000):
+        chunks.append(
+            f"diff --git a/r{i}.bb b/r{i}.bb\n--- a/r{i}.bb\n+++ b/r{i}.bb\n"
+            f"@@ -1 +1 @@\n-CCOS_VERSION = \"0.0.1_aaaa\"\n+CCOS_VERSION = \"0.0.2_{i:04x}\"\n"
+        )
+    info = parse_info_from_diff("".join(chunks))
+
+    assert len(info) == 5000
+    assert info[-1] == {
+        "file": "r4999.bb", "version": "version/0.0.2", "commit": "1387",
+        "old_version": "version/0.0.1", "old_commit": "aaaa", "old_branch": None, "new_branch": None
+    }
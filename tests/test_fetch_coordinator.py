@@ -0,0 +1,109 @@
+import subprocess
+from types import SimpleNamespace
+
+import pytest
+
+from git import git
+from workspace import fetch_coordinator
+from workspace.fetch_coordinator import FetchCoordinator
+
+REPO = "/tmp/repo"
+
+
+class FakeRemote:
+    def __init__(self, heads):
+        self.heads = set(heads)
+        self.fetches = []
+
+    def fetch(self, path, refspecs, remote="origin"):
+        self.fetches.append(refspecs)
+        for spec in refspecs:
+            if spec.startswith("+refs/heads/"):
+                branch = spec[len("+refs/heads/"):].split(":", 1)[0]
+                if branch not in self.heads:
+                    # 언어 설정에 따라 달라지는 메시지를 흉내냄
+                    raise subprocess.CalledProcessError(128, ["git", "fetch"], None, "fatal: 원격 레퍼런스 없음")
+        return ""
+
+    def ls_remote_heads(self, path, remote="origin"):
+        return sorted(self.heads)
+
+    def fetched_branches(self, index=-1):
+        return [spec[len("+refs/heads/"):].split(":", 1)[0]
+                for spec in self.fetches[index] if spec.startswith("+refs/heads/")]
+
+
+@pytest.fixture
+def remote(monkeypatch):
+    remote = FakeRemote(["main"])
+    monkeypatch.setattr(git, "git_fetch", remote.fetch)
+    monkeypatch.setattr(git, "git_ls_remote_heads", remote.ls_remote_heads)
+    branch_manager = SimpleNamespace(branches=[SimpleNamespace(name="main")])
+    monkeypatch.setattr(fetch_coordinator.BranchManager, "get_instance", lambda: branch_manager)
+    return remote
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = SimpleNamespace(now=1000.0)
+    monkeypatch.setattr(fetch_coordinator.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+def test_missing_branch_is_skipped_regardless_of_message(remote, clock):
+    coordinator = FetchCoordinator(ttl_seconds=60)
+
+    coordinator.ensure_fresh(REPO, ["feature"])
+
+    assert remote.fetched_branches() == ["main"]
+    assert set(coordinator.missing_branches[REPO]) == {"feature"}
+
+
+def test_fetch_error_without_missing_branch_is_raised(remote, clock, monkeypatch):
+    remote.heads.add("feature")
+
+    def broken_fetch(path, refspecs, remote="origin"):
+        raise subprocess.CalledProcessError(128, ["git", "fetch"], None, "fatal: network unreachable")
+
+    monkeypatch.setattr(git, "git_fetch", broken_fetch)
+    with pytest.raises(subprocess.CalledProcessError):
+        FetchCoordinator().ensure_fresh(REPO, ["feature"])
+
+
+def test_missing_branch_is_retried_after_ttl(remote, clock):
+    coordinator = FetchCoordinator(ttl_seconds=60)
+    coordinator.ensure_fresh(REPO, ["feature"])
+    remote.heads.add("feature")
+
+    clock.now += 30
+    coordinator.ensure_fresh(REPO, ["feature"])
+    assert len(remote.fetches) == 2  # 실패 + 재시도 뒤 TTL 안에서는 다시 fetch 하지 않음
+
+    clock.now += 31
+    coordinator.ensure_fresh(REPO, ["feature"])
+    assert remote.fetched_branches() == ["feature", "main"]
+
+
+@pytest.mark.parametrize("retry", [
+    lambda coordinator: coordinator.invalidate(REPO),
+    lambda coordinator: coordinator.invalidate(),
+])
+def test_invalidate_forgets_missing_branches(remote, clock, retry):
+    coordinator = FetchCoordinator(ttl_seconds=60)
+    coordinator.ensure_fresh(REPO, ["feature"])
+    remote.heads.add("feature")
+
+    retry(coordinator)
+    coordinator.ensure_fresh(REPO, ["feature"])
+
+    assert remote.fetched_branches() == ["feature", "main"]
+
+
+def test_force_retries_missing_branches(remote, clock):
+    coordinator = FetchCoordinator(ttl_seconds=60)
+    coordinator.ensure_fresh(REPO, ["feature"])
+    remote.heads.add("feature")
+
+    coordinator.ensure_fresh(REPO, ["feature"], force=True)
+
+    assert remote.fetched_branches() == ["feature", "main"]
@@ -0,0 +1,159 @@
+import subprocess
+from datetime import datetime, timedelta, timezone
+from git import git
+from git.git import COMMIT_RECORD_FIELDS, parse_commit_records, parse_push_porcelain, parse_status_porcelain_v2
+from models.file_change import FileChange
+from models.push_result import PushResult
+
+US = "\x1f"
+
+def commit_entry(sha="a" * 40, author="Kim", email="kim@example.com", date="2025-01-23T10:00:00+09:00",
+                 subject="Fix crash", body="", trailers=""):
+    return US.join([sha, author, email, date, subject, body, trailers])
+
+def test_commit_records_split_on_nul_and_unit_separator():
+    output = "\0".join([
+        commit_entry(sha="a" * 40, subject="First"),
+        # git log -z 는 두 번째 레코드부터 앞에 줄바꿈이 붙음
+        "\n" + commit_entry(sha="b" * 40, subject="Second"),
+    ]) + "\0"
+
+    records = parse_commit_records(output)
+
+    assert [record.sha for record in records] == ["a" * 40, "b" * 40]
+    assert [record.subject for record in records] == ["First", "Second"]
+    assert records[0].date == datetime(2025, 1, 23, 10, 0, tzinfo=timezone(timedelta(hours=9)))
+
+def test_commit_record_body_may_contain_newlines_and_tabs():
+    body = "line one\n\tindented: not a trailer\n\n"
+    records = parse_commit_records(commit_entry(body=body))
+
+    assert records[0].body == "line one\n\tindented: not a trailer"
+    assert records[0].message == "Fix crash\n\nline one\n\tindented: not a trailer"
+
+def test_commit_record_trailers_and_jira_keys():
+    entry = commit_entry(
+        subject="CCOS-12 Fix crash",
+        body="Also fixes ABC2-7.\n\nCause: null pointer\nCountermeasure: add check",
+        trailers="Cause: null pointer\nCountermeasure: add check\ncause: second cause\n"
+    )
+    record = parse_commit_records(entry)[0]
+
+    assert record.jira_keys == ["CCOS-12", "ABC2-7"]
+    assert record.trailers == {
+        "cause": ["null pointer", "second cause"],
+        "countermeasure": ["add check"],
+    }
+    assert record.trailer("Cause") == "null pointer\nsecond cause"
+    assert record.trailer("description") == ""
+
+def test_commit_record_jira_keys_are_deduplicated_in_order():
+    record = parse_commit_records(commit_entry(subject="CCOS-2 CCOS-1", body="CCOS-2 again"))[0]
+    assert record.jira_keys == ["CCOS-2", "CCOS-1"]
+
+def test_malformed_commit_records_are_skipped():
+    truncated = US.join(["c" * 40, "Kim", "kim@example.com"])
+    output = "\0".join([commit_entry(sha="a" * 40), truncated, "", "\n"])
+
+    records = parse_commit_records(output)
+
+    assert [record.sha for record in records] == ["a" * 40]
+    assert len(COMMIT_RECORD_FIELDS) == 7
+
+H1 = "1" * 40
+H2 = "2" * 40
+H3 = "3" * 40
+
+def test_status_ordinary_paths_keep_spaces():
+    output = f"1 .M N... 100644 100644 100644 {H1} {H1} dir with space/file name.bb\0"
+
+    assert parse_status_porcelain_v2(output) == [
+        FileChange("dir with space/file name.bb", "ordinary", ".", "M")
+    ]
+
+def test_status_rename_consumes_original_path_entry():
+    output = (
+        f"2 R. N... 100644 100644 100644 {H1} {H1} R100 new name.bb\0old name.bb\0"
+        f"1 M. N... 100644 100644 100644 {H1} {H2} after.bb\0"
+    )
+    changes = parse_status_porcelain_v2(output)
+
+    assert changes == [
+        FileChange("new name.bb", "renamed", "R", ".", "old name.bb"),
+        FileChange("after.bb", "ordinary", "M", "."),
+    ]
+    assert str(changes[0]) == "R. old name.bb -> new name.bb"
+    assert changes[0].staged and not changes[0].unstaged
+
+def test_status_unmerged_untracked_ignored_and_headers():
+    output = "\0".join([
+        "# branch.oid " + H1,
+        "# branch.head master",
+        f"u UU N... 100644 100644 100644 100644 {H1} {H2} {H3} conflict file.bb",
+        "? new dir/untracked file",
+        "! build/out.o",
+    ]) + "\0"
+
+    assert parse_status_porcelain_v2(output) == [
+        FileChange("conflict file.bb", "unmerged", "U", "U"),
+        FileChange("new dir/untracked file", "untracked"),
+        FileChange("build/out.o", "ignored"),
+    ]
+
+def test_status_clean_and_unknown_entries():
+    assert parse_status_porcelain_v2("") == []
+    assert parse_status_porcelain_v2("x something\0") == []
+
+PUSH_OUTPUT = "\n".join([
+    "To ssh://git@example.com/meta-ccos.git",
+    "*\trefs/tags/version/1.2.0:refs/tags/version/1.2.0\t[new tag]",
+    "=\trefs/heads/main:refs/heads/main\t[up to date]",
+    " \t0123abc:refs/heads/release\t1111111..2222222",
+    "+\trefs/heads/topic:refs/heads/topic\t3333333...4444444 (forced update)",
+    "-\t:refs/heads/old\t[deleted]",
+    "!\trefs/heads/stale:refs/heads/stale\t[rejected] (atomic push failed)",
+    "Done",
+])
+
+def test_push_porcelain_flags():
+    results = parse_push_porcelain(PUSH_OUTPUT)
+
+    assert [(result.ref, result.flag) for result in results] == [
+        ("refs/tags/version/1.2.0", "*"),
+        ("refs/heads/main", "="),
+        ("refs/heads/release", " "),
+        ("refs/heads/topic", "+"),
+        ("refs/heads/old", "-"),
+        ("refs/heads/stale", "!"),
+    ]
+    assert [result.ok for result in results] == [True, True, True, True, True, False]
+    assert results[0].summary == "[new tag]"
+    assert results[3].summary == "3333333...4444444 (forced update)"
+    assert results[5].summary == "[rejected] (atomic push failed)"
+
+def test_push_porcelain_ignores_non_ref_lines():
+    assert parse_push_porcelain("To origin\nDone\n") == []
+    assert parse_push_porcelain("") == []
+
+def test_push_atomic_reports_per_ref_results_on_failure(monkeypatch):
+    def fail(command, cwd=None):
+        raise subprocess.CalledProcessError(1, command, output=PUSH_OUTPUT, stderr="error: failed to push")
+
+    monkeypatch.setattr(git, "run_git_command", fail)
+    results = git.git_push_atomic("/repo", ["refs/heads/stale:refs/heads/stale"])
+
+    assert len(results) == 6
+    assert results[-1] == PushResult("refs/heads/stale", "!", "[rejected] (atomic push failed)")
+
+def test_push_atomic_marks_every_ref_failed_without_porcelain_output(monkeypatch):
+    def fail(command, cwd=None):
+        raise subprocess.CalledProcessError(128, command, output="",
+                                            stderr="fatal: unable to access remote\nfatal: Could not read from remote repository.\n")
+
+    monkeypatch.setattr(git, "run_git_command", fail)
+    results = git.git_push_atomic("/repo", ["v1:refs/tags/v1", "HEAD:refs/heads/main"])
+
+    assert results == [
+        PushResult("refs/tags/v1", "!", "fatal: Could not read from remote repository."),
+        PushResult("refs/heads/main", "!", "fatal: Could not read from remote repository."),
+    ]
@@ -0,0 +1,141 @@
+import http.client
+import json
+
+import pytest
+
+from services.webhook_receiver import (
+    EVENT_HEADER, MAX_BODY_BYTES, SIGNATURE_HEADER, WEBHOOK_PATH, WebhookReceiver,
+    pull_request_from_payload, replay_payloads, sign, verify_signature
+)
+
+SECRET = "s3cret"
+
+
+def _payload(**pr):
+    pullrequest = {
+        'id': 7,
+        'title': 'Update foo',
+        'state': 'OPEN',
+        'source': {'branch': {'name': 'feature'}, 'commit': {'hash': 'abc'}},
+        'destination': {'branch': {'name': 'main'}, 'commit': {'hash': 'def'}},
+        'updated_on': '2025-01-24T01:02:03.000000+00:00',
+    }
+    pullrequest.update(pr)
+    return {'pullrequest': pullrequest, 'repository': {'name': 'meta-foo', 'full_name': 'ws/meta-foo'}}
+
+
+def test_payload_is_converted():
+    pr = pull_request_from_payload(_payload())
+
+    assert pr.key == ('meta-foo', 7)
+    assert pr.updated_on_raw == '2025-01-24T01:02:03.000000+00:00'
+    assert pr.destination.commit == 'def'
+    assert pr.diff_url == 'https://api.bitbucket.org/2.0/repositories/ws/meta-foo/pullrequests/7/diff'
+
+
+def test_payload_without_updated_on_is_dropped():
+    assert pull_request_from_payload(_payload(updated_on=None)) is None
+    assert pull_request_from_payload({'repository': {}}) is None
+
+
+def test_null_fields_are_tolerated():
+    payload = _payload(
+        source={'branch': None, 'commit': None, 'repository': None},
+        destination={'branch': None, 'commit': None},
+        links={'diff': None, 'html': None},
+    )
+
+    pr = pull_request_from_payload(payload)
+
+    assert pr.source.branch is None and pr.destination.branch is None
+    assert pr.source.repository == 'meta-foo'
+    assert pr.diff_url.endswith('/pullrequests/7/diff')
+    assert pr.html_url is None
+
+
+def test_verify_signature():
+    body = b'{"pullrequest": {}}'
+
+    assert verify_signature(SECRET, body, sign(SECRET, body))
+    assert not verify_signature(SECRET, body, sign("other", body))
+    assert not verify_signature(SECRET, body + b" ", sign(SECRET, body))
+    assert not verify_signature(SECRET, body, None)
+    assert not verify_signature("", body, sign("", body))
+
+
+@pytest.fixture
+def receiver():
+    received = []
+    receiver = WebhookReceiver(SECRET, lambda event_key, pr: received.append((event_key, pr)), port=0)
+    receiver.received = received
+    receiver.start()
+    yield receiver
+    receiver.stop()
+
+
+def _post(receiver, body: bytes, headers: dict):
+    host, port = receiver.server.server_address[:2]
+    connection = http.client.HTTPConnection(host, port, timeout=10)
+    try:
+        connection.request("POST", WEBHOOK_PATH, body=body, headers=headers)
+        response = connection.getresponse()
+        return response.status, response.read().decode()
+    finally:
+        connection.close()
+
+
+def _signed_post(receiver, payload, event="pullrequest:updated", signature=None):
+    body = json.dumps(payload).encode()
+    headers = {EVENT_HEADER: event, "Content-Type": "application/json"}
+    signature = sign(SECRET, body) if signature is None else signature
+    if signature:
+        headers[SIGNATURE_HEADER] = signature
+    return _post(receiver, body, headers)
+
+
+def test_signed_payload_reaches_callback(receiver):
+    status, _ = _signed_post(receiver, _payload(source={'branch': None}))
+
+    assert status == 202
+    [(event_key, pr)] = receiver.received
+    assert event_key == "pullrequest:updated"
+    assert pr.key == ('meta-foo', 7)
+
+
+@pytest.mark.parametrize("signature", ["", "sha256=" + "0" * 64])
+def test_missing_or_bad_signature_is_rejected(receiver, signature):
+    status, _ = _signed_post(receiver, _payload(), signature=signature)
+
+    assert status == 401
+    assert receiver.received == []
+
+
+def test_oversized_body_is_rejected(receiver):
+    status, _ = _post(receiver, b"x", {"Content-Length": str(MAX_BODY_BYTES + 1)})
+
+    assert status == 413
+    assert receiver.received == []
+
+
+def test_invalid_payloads_get_400(receiver):
+    assert _signed_post(receiver, _payload(updated_on=None))[0] == 400
+    assert _signed_post(receiver, ["not", "an", "object"])[0] == 400
+    assert receiver.received == []
+
+
+def test_non_pull_request_event_is_ignored(receiver):
+    assert _signed_post(receiver, _payload(), event="repo:push")[0] == 204
+    assert receiver.received == []
+
+
+def test_replay_posts_recorded_payloads(receiver, tmp_path):
+    plain = tmp_path / "plain.json"
+    plain.write_text(json.dumps(_payload()))
+    wrapped = tmp_path / "wrapped.json"
+    wrapped.write_text(json.dumps({"event": "pullrequest:fulfilled", "payload": _payload(state='MERGED')}))
+
+    replay_payloads(receiver.url, SECRET, [str(plain), str(wrapped)])
+
+    assert [(event_key, pr.state) for event_key, pr in receiver.received] == [
+        ("pullrequest:updated", "OPEN"), ("pullrequest:fulfilled", "MERGED")
+    ]